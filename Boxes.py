@@ -18,53 +18,24 @@ app made in python using pygame and pygame_widgets
 """
 
 import pygame
+import pygame_widgets
 
 import graphic_tool_import as gti
 import pygame_widgets_import as pwi
-
-
-def test_and_handle_ymd(year_input, month_input, day_input) -> tuple[str, str, str]:
-    """
-    function to test the year, month and day for the BoxDate and BoxDateRange
-    and if needed, modify them or raise error
-
-    --------------------------------------------------------------------------------------------------------------------
-
-    :param year_input: the raw year input from the input of the Box
-    :type: str
-    :param month_input: the raw mont input from the input of the Box
-    :type: str
-    :param day_input: the raw day input from the input of the Box
-    :type: str
-
-    :return: the tested input
-    :type: tuple[str, str, str]
-    """
-    year = year_input  .replace(' ', '')[:4]
-    month = month_input.replace(' ', '')[:2]
-    day = day_input    .replace(' ', '')[:2]
-
-    if not year.isnumeric():
-        raise ValueError("Year must be a number")
-
-    if (not month.isnumeric()) or len(month) == 0 or month is None:
-        month = '00'
-
-    if (not day.isnumeric()) or len(day) == 0 or day is None:
-        day = '00'
-
-    if not (0 <= int(month) <= 12):
-        raise ValueError("Month must be between 0 and 12")
-
-    # compute the number maximum of day in a month
-    max_day = (29 if int(year) % 4 else 28) if int(month) == 2 else (30 if int(month) % 2 else 31)
-    if not (0 <= int(day) <= max_day):
-        raise ValueError(f"Day must be between 0 and {max_day}")
-
-    return year, month, day
+import query_compiler as qc
+import widget_index
+from query_compiler import test_and_handle_ymd  # used to be defined here, kept for the scripts importing it
+from text_cache import text_cache
 
 
 class Box(object):
+    # the names of the attributes holding the widgets of the box, see get_widgets
+    _widget_names = ("left_button", "delete_button", "right_button", "text_input")
+    # the keys of the box spec, and the names of the attributes holding the text inputs giving them
+    _input_names = {"text": "text_input"}
+    # the prerendered chromes (border and labels) of the boxes, shared by the boxes of the same type, see _get_chrome
+    _chrome_surfaces = {}
+
     def __init__(self, world, index: int, box_type: str = "Normal"):
         """
         Base class to create a box for the Google butler app
@@ -85,15 +56,45 @@ class Box(object):
 
             .display_text(text, start_pos, color)
 
+            .get_rect() -> rect
+                the part of the screen the box draws in, completions included
+
             .update_index(new_index)
+                move the box, its widgets are created or released when it comes in or out of the viewport
+
+            .create_widgets()
+                create the widgets of the box, filled with its inputs
+
+            .release_widgets()
+                delete the widgets of the box, keeping its inputs
 
             .delete_widgets()
                 delete every widget of the box
 
+            .get_widgets() -> list of widgets
+
             .get_text() -> parsed_text
 
             .get_raw_text() -> input_text
 
+            .get_spec() -> box_spec
+
+            .set_spec(box_spec)
+                fill the inputs from a box spec
+
+            .get_fragment() -> fragment
+
+            .invalidate_fragment()
+                forget the cached fragment
+
+            .on_text_changed()
+                called at each keystroke, to update the fragment and the completions
+
+            .display_completions()
+
+            .accept_completion()
+                replace the word being typed by its first completion
+
         ----------------------------------------------------------------------------------------------------------------
 
         :param world: the World class from the main.py class in the Google butler app
@@ -110,9 +111,22 @@ class Box(object):
         self.world = world
         self.box_type = box_type
         self.index = index
-        self.x, self.y = self.coord = (15 + (index * 160), 260)
+        self.x, self.y = self.coord = world.get_box_coord(index)
         self.opp_x, self.opp_y = self.opp_coord = self.x + 150, self.y + 100
-        self._create()
+
+        # cached fragment of the query, see get_fragment
+        self._fragment = None
+        self._fragment_error = None
+        # a new box changes the query of the world
+        world.invalidate_query()
+
+        # only the boxes in the viewport of the world have widgets, the inputs of the others are kept here
+        self.has_widgets = False
+        self._inputs = {key: '' for key in self._input_names}
+        self.completions = []
+
+        if world.is_box_visible(index):
+            self.create_widgets()
 
     def _create(self):
         """
@@ -129,11 +143,6 @@ class Box(object):
         # pygame.draw.line(self.world.screen, gti.colors["white"], (x,     y),     (opp_x, y),     2)  # top
         # pygame.draw.line(self.world.screen, gti.colors["white"], (x,     opp_y), (opp_x, opp_y), 2)  # bottom
         self.border = gti.Border((x, y), (opp_x, opp_y), gti.colors["white"], border_radius=9, border_width=2)
-        self.border.draw(self.world.screen)
-
-        # label
-        self.display_text(self.box_type.capitalize(), (x + 75, y + 15),
-                          gti.colors["white"], is_center=(True, True), font_size=23)
 
         # buttons
         self.left_button = pwi.Button(self.world.screen, x + 10, y + 30, 30, 20, text="<-",
@@ -147,7 +156,71 @@ class Box(object):
                                        onClick=lambda: self.world.box_go_right(self.index))
 
         # input:
-        self.text_input = pwi.TextBox(self.world.screen, x + 5, y + 60, 140, 30, radius=4)
+        self.text_input = pwi.TextBox(self.world.screen, x + 5, y + 60, 140, 30, radius=4,
+                                      onTextChanged=self.on_text_changed, onSubmit=self.accept_completion)
+        self.completions = []
+
+        self._draw_chrome()
+
+    def _draw_chrome(self):
+        """
+        method to draw the parts of the box that aren't widgets (border and labels), in one blit
+        method used internally only
+        """
+        self.world.damage.add(self.world.screen.blit(self._get_chrome(), self.border.get_rect().topleft))
+
+    def _get_chrome(self) -> pygame.Surface:
+        """
+        method to obtain the chrome of the box : its border and its labels, rendered on a transparent surface the size
+        of self.border.get_rect()
+        method used internally only
+
+        it is rendered only for the first box of its type, the other ones share it
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the chrome, shared with the other boxes of the same type, it must not be drawn on
+        :type: pygame.Surface
+        """
+        border = self.border
+        key = (type(self), self.box_type, border.size, tuple(border.border_radius), border.border_width,
+               tuple(border.color))
+
+        chrome = Box._chrome_surfaces.get(key)
+        if chrome is None:
+            rect = border.get_rect()
+            x, y = border.x_1 - rect.x, border.y_1 - rect.y
+
+            chrome = pygame.Surface(rect.size, pygame.SRCALPHA)
+            gti.Border((x, y), (x + border.width, y + border.height), border.color,
+                       border_radius=border.border_radius, border_width=border.border_width).draw(chrome)
+            self._render_labels(chrome, x, y)
+
+            if pygame.display.get_surface() is not None:
+                chrome = chrome.convert_alpha()
+            # the chrome is mostly transparent, run-length encoding skips the transparent pixels when it is blitted
+            chrome.set_alpha(255, pygame.RLEACCEL)
+
+            chrome = Box._chrome_surfaces[key] = chrome
+
+        return chrome
+
+    def _render_labels(self, surface: pygame.Surface, x: int, y: int):
+        """
+        method to draw the labels of the box on its chrome
+        method used internally only
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param surface: the chrome
+        :type: pygame.Surface
+        :param x: the x coordinate of the top left corner of the box on the chrome
+        :type: int
+        :param y: the y coordinate of the top left corner of the box on the chrome
+        :type: int
+        """
+        self.display_text(self.box_type.capitalize(), (x + 75, y + 15),
+                          gti.colors["white"], is_center=(True, True), font_size=23, surface=surface)
 
     def display_text(self,
                      text:      str,
@@ -155,7 +228,8 @@ class Box(object):
                      color:     tuple[int, int, int],
                      is_center: tuple[bool, bool] = (False, False),
                      font:      str = None,
-                     font_size: int = 20):
+                     font_size: int = 20,
+                     surface:   pygame.Surface = None):
         """
         method to make displaying text more easy
 
@@ -174,25 +248,46 @@ class Box(object):
         :type: str
         :param font_size: size of the font, defaulted to 20
         :type: int
+        :param surface: the surface to draw on, defaulted to None (the screen of the world)
+        :type: pygame.Surface
         """
         if start_pos[0] < 0 or start_pos[1] < 0:
             raise ValueError("start_pos must have positive coordinates")
 
-        if 0 < color[0] < 255 or 0 < color[1] < 255 or 0 < color[2] < 255:
+        if not (0 <= color[0] <= 255 and 0 <= color[1] <= 255 and 0 <= color[2] <= 255):
             raise ValueError("color must use the rgb system, with 3 values ranging from 0 to 255")
 
-        text_render = pygame.font.Font(font, font_size).render(text, True, color)
+        # the fonts and the rendered texts are shared by the whole app
+        text_render = text_cache.render(text, color, font, font_size)
 
         if is_center[0]:
             start_pos = (start_pos[0] - (text_render.get_size()[0] // 2), start_pos[1])
         if is_center[1]:
             start_pos = (start_pos[0], start_pos[1] - (text_render.get_size()[1] // 2))
 
-        self.world.screen.blit(text_render, start_pos)
+        if surface is None:
+            self.world.damage.add(self.world.screen.blit(text_render, start_pos))
+        else:
+            surface.blit(text_render, start_pos)
+
+    def get_rect(self) -> pygame.Rect:
+        """
+        method to obtain the part of the screen the box draws in : its border and the completions under it
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the rectangle
+        :type: pygame.Rect
+        """
+        return pygame.Rect(self.x - 2, self.y - 2, 155, 122)
 
     def update_index(self, new_index: int):
         """
-        method to change the position of this box relative to the other ones
+        method to change the position of this box relative to the other ones, or to place it again after the
+        viewport of the world scrolled
+
+        the box loses its widgets if it goes out of the viewport, and gets them if it comes in,
+        the part of the screen where the box was isn't cleared
 
         ----------------------------------------------------------------------------------------------------------------
 
@@ -202,37 +297,111 @@ class Box(object):
         if new_index < 0:
             raise ValueError("new_index must be positive")
 
-        text_transfer = self.text_input.getText()
-        self.delete_widgets()
+        is_visible = self.world.is_box_visible(new_index)
+        if not is_visible:
+            self.release_widgets()
+
+        new_x, new_y = self.world.get_box_coord(new_index)
+        dx = new_x - self.x
+
         self.index = new_index
-        self.x, self.y = self.coord = (15 + (new_index * 160), 260)
+        self.x, self.y = self.coord = new_x, new_y
         self.opp_x, self.opp_y = self.opp_coord = self.x + 150, self.y + 100
+
+        if not is_visible:
+            return
+        if not self.has_widgets:
+            self.create_widgets()
+            return
+
+        # the widgets and the border are moved where they are, instead of being created again
+        for widget in self.get_widgets():
+            widget.moveX(dx)
+            self.world.widget_index.insert(widget, widget_index.get_widget_rect(widget))
+        self.border.move(dx, 0)
+
+        self._draw_chrome()
+        self.display_completions()
+
+    def create_widgets(self):
+        """
+        method to create the widgets of the box at its place, filled with the inputs it kept while it had none
+        """
+        if self.has_widgets:
+            return
+
         self._create()
-        self.text_input.setText(text_transfer)
+        self.has_widgets = True
+
+        for key, name in self._input_names.items():
+            getattr(self, name).setText(self._inputs[key])
+
+        # the events are routed to the widgets of the boxes through the spatial index of the world
+        for widget in self.get_widgets():
+            self.world.widget_index.insert(widget, widget_index.get_widget_rect(widget))
+
+    def release_widgets(self):
+        """
+        method to delete the widgets of the box but keep its inputs, for when it goes out of the viewport
+
+        nothing is erased from the screen, the world clears the viewport itself
+        """
+        if not self.has_widgets:
+            return
+
+        self._inputs = {key: getattr(self, name).getText() for key, name in self._input_names.items()}
+        self._remove_widgets()
+        self.completions = []
+
+    def get_widgets(self) -> list:
+        """
+        method to obtain the widgets of the box, the ones named in self._widget_names
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the buttons and the inputs of the box, an empty list if it has no widgets
+        :type: list of pygame_widgets widgets
+        """
+        if not self.has_widgets:
+            return []
+        return [getattr(self, name) for name in self._widget_names]
 
     def delete_widgets(self):
         """
         method to delete all the widgets of the box
 
-        used internally in to update the position
-        and to use if you need to delete the box, to have the widgets deleted from the display
+        the widgets are removed from the pygame_widgets.WidgetHandler, hiding them wasn't enough :
+        pygame_widgets.update kept going through them at every frame
+
+        to use if you need to delete the box, to have the widgets deleted from the display,
+        the inputs are lost (see release_widgets to keep them)
+        """
+        if not self.has_widgets:
+            return
+
+        self._remove_widgets()
+
+        self.completions = []
+        self.display_completions()
+
+        self.world.restore_background(self.get_rect())
+
+    def _remove_widgets(self):
+        """
+        method to remove the widgets of the box from pygame_widgets and from the box, without erasing anything
+        method used internally only
         """
-        self.delete_button.disable()
-        self.left_button.disable()
-        self.right_button.disable()
-        self.text_input.disable()
+        for name in self._widget_names:
+            widget = getattr(self, name)
 
-        self.delete_button.hide()
-        self.left_button.hide()
-        self.right_button.hide()
-        self.text_input.hide()
+            widget.disable()
+            widget.hide()
+            pygame_widgets.WidgetHandler.removeWidget(widget)
+            self.world.widget_index.remove(widget)
 
-        del self.delete_button
-        del self.left_button
-        del self.right_button
-        del self.text_input
+            delattr(self, name)
 
-        self.border.erase(self.world.screen, gti.colors["black"])
+        self.has_widgets = False
 
     def get_text(self, parser=lambda x=0: x) -> str:
         """
@@ -253,8 +422,8 @@ class Box(object):
         :type: str
         """
         if (parser() is None) or (parser is None):
-            return self.text_input.getText().strip().replace(' ', '+')
-        return parser(self.text_input.getText())
+            return qc.parse_normal(self._get_input("text"))
+        return parser(self._get_input("text"))
 
     def get_raw_text(self) -> str:
         """
@@ -265,7 +434,139 @@ class Box(object):
         :return: the raw input
         :type: str
         """
-        return self.text_input.getText()
+        return self._get_input("text")
+
+    def get_spec(self) -> dict:
+        """
+        method to obtain the box spec of this box, a plain dictionary used by the query_compiler module
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the box spec, {"type": box_type, key: input_text for each key of self._input_names}
+                 for instance {"type": box_type, "text": input_text}
+        :type: dict
+        """
+        spec = {"type": self.box_type}
+        for key in self._input_names:
+            spec[key] = self._get_input(key)
+
+        return spec
+
+    def set_spec(self, spec: dict):
+        """
+        method to fill the inputs of this box from a box spec, the type of the spec isn't checked
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param spec: the box spec, {"type": box_type, key: input_text for each key of self._input_names}
+                     for instance {"type": box_type, "text": input_text}
+        :type: dict
+        """
+        for key, name in self._input_names.items():
+            if self.has_widgets:
+                getattr(self, name).setText(spec.get(key, ''))
+            else:
+                self._inputs[key] = spec.get(key, '')
+
+        self.invalidate_fragment()
+
+    def _get_input(self, key: str) -> str:
+        """
+        method to obtain the text of an input of this box, from its widget or from what it kept if it has none
+        method used internally only
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param key: the key of the input in the box spec
+        :type: str
+
+        :return: the text of the input
+        :type: str
+        """
+        if self.has_widgets:
+            return getattr(self, self._input_names[key]).getText()
+        return self._inputs[key]
+
+    def get_fragment(self) -> tuple[str, str, str]:
+        """
+        method to obtain the compiled fragment of this box, what it adds to the query
+
+        the fragment is cached and only compiled again after one of the inputs changed (see invalidate_fragment)
+        raise the ValueError of the input if it isn't valid, the error is cached as well
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the fragment, (box_type, text, raw_text), see query_compiler.QueryCompiler.compile_fragment
+        :type: tuple[str, str, str]
+        """
+        if self._fragment is None and self._fragment_error is None:
+            try:
+                self._fragment = qc.QueryCompiler.compile_fragment(self.get_spec())
+            except ValueError as err:
+                self._fragment_error = err
+
+        if self._fragment_error is not None:
+            raise self._fragment_error
+        return self._fragment
+
+    def invalidate_fragment(self):
+        """
+        method to forget the cached fragment of this box
+
+        it is given as onTextChanged to every input of the box, so it is called each time one of them changes,
+        the query of the world is compiled again at its next preview
+        """
+        self._fragment = None
+        self._fragment_error = None
+
+        self.world.invalidate_query()
+
+    def on_text_changed(self):
+        """
+        method given as onTextChanged to the text input, called at each keystroke
+
+        forget the cached fragment and look for the completions of the word being typed
+
+        it is called by setText as well (create_widgets, set_spec), the completions are only looked for when the text
+        input is selected, as the user is the one typing
+        """
+        self.invalidate_fragment()
+
+        if not self.text_input.selected:
+            if self.completions:
+                self.completions = []
+                self.display_completions()
+            return
+
+        prefix = self._get_input("text").split(' ')[-1]
+        self.completions = self.world.autocomplete.complete(prefix, 3) if prefix else []
+
+        self.display_completions()
+
+    def display_completions(self):
+        """
+        method to display the completions of the word being typed under the box, or nothing if there is none
+        """
+        x, y = self.opp_x - 150, self.opp_y + 2
+
+        self.world.restore_background((x, y, 151, 18))
+
+        if self.completions:
+            text = ' '.join(self.completions)
+            if len(text) > 24:
+                text = text[:21] + "..."
+
+            self.display_text(text, (x + 2, y), gti.colors["grey"], font_size=20)
+
+    def accept_completion(self):
+        """
+        method given as onSubmit to the text input, pressing enter replaces the word being typed by its first completion
+        """
+        if self.completions:
+            words = self._get_input("text").split(' ')
+            words[-1] = self.completions[0]
+
+            self.text_input.setText(' '.join(words) + ' ')
 
 
 class BoxExact(Box):
@@ -290,15 +591,45 @@ class BoxExact(Box):
 
             .display_text(text, start_pos, color)
 
+            .get_rect() -> rect
+                the part of the screen the box draws in, completions included
+
             .update_index(new_index)
+                move the box, its widgets are created or released when it comes in or out of the viewport
+
+            .create_widgets()
+                create the widgets of the box, filled with its inputs
+
+            .release_widgets()
+                delete the widgets of the box, keeping its inputs
 
             .delete_widgets()
                 delete every widget of the box
 
+            .get_widgets() -> list of widgets
+
             .get_text() -> parsed_text
 
             .get_raw_text() -> input_text
 
+            .get_spec() -> box_spec
+
+            .set_spec(box_spec)
+                fill the inputs from a box spec
+
+            .get_fragment() -> fragment
+
+            .invalidate_fragment()
+                forget the cached fragment
+
+            .on_text_changed()
+                called at each keystroke, to update the fragment and the completions
+
+            .display_completions()
+
+            .accept_completion()
+                replace the word being typed by its first completion
+
         ----------------------------------------------------------------------------------------------------------------
 
         :param world: the World class from the main.py class in the Google butler app
@@ -330,14 +661,7 @@ class BoxExact(Box):
         :return: the parsed input
         :type: str
         """
-        text = self.separator_left
-
-        for i, word in enumerate(self.text_input.getText().split(' ')):
-            if i:
-                text += '+'
-            text += word
-
-        text += self.separator_right
+        text = qc.parse_exact(self._get_input("text"))
 
         if (parser() is None) or (parser is None):
             return text
@@ -365,15 +689,45 @@ class BoxAvoid(Box):
 
             .display_text(text, start_pos, color)
 
+            .get_rect() -> rect
+                the part of the screen the box draws in, completions included
+
             .update_index(new_index)
+                move the box, its widgets are created or released when it comes in or out of the viewport
+
+            .create_widgets()
+                create the widgets of the box, filled with its inputs
+
+            .release_widgets()
+                delete the widgets of the box, keeping its inputs
 
             .delete_widgets()
                 delete every widget of the box
 
+            .get_widgets() -> list of widgets
+
             .get_text() -> parsed_text
 
             .get_raw_text() -> input_text
 
+            .get_spec() -> box_spec
+
+            .set_spec(box_spec)
+                fill the inputs from a box spec
+
+            .get_fragment() -> fragment
+
+            .invalidate_fragment()
+                forget the cached fragment
+
+            .on_text_changed()
+                called at each keystroke, to update the fragment and the completions
+
+            .display_completions()
+
+            .accept_completion()
+                replace the word being typed by its first completion
+
         ----------------------------------------------------------------------------------------------------------------
 
         :param world: the World class from the main.py class in the Google butler app
@@ -404,17 +758,13 @@ class BoxAvoid(Box):
         :return: the parsed input
         :type: str
         """
-        text = ''
-
-        for i, word in enumerate(self.text_input.getText().split(' ')):
-            if i:
-                text += self.separator
-            text += word
-
-        return text
+        return qc.parse_avoid(self._get_input("text"))
 
 
 class BoxAny(Box):
+    _widget_names = ("left_button", "delete_button", "right_button")
+    _input_names = {}
+
     def __init__(self, world, index: int):
         """
         Derived class to create a box for the Google butler app
@@ -433,15 +783,37 @@ class BoxAny(Box):
 
             .display_text(text, start_pos, color)
 
+            .get_rect() -> rect
+                the part of the screen the box draws in, completions included
+
             .update_index(new_index)
+                move the box, its widgets are created or released when it comes in or out of the viewport
+
+            .create_widgets()
+                create the widgets of the box, filled with its inputs
+
+            .release_widgets()
+                delete the widgets of the box, keeping its inputs
 
             .delete_widgets()
                 delete every widget of the box
 
+            .get_widgets() -> list of widgets
+
             .get_text() -> parsed_text
 
             .get_raw_text() -> input_text
 
+            .get_spec() -> box_spec
+
+            .set_spec(box_spec)
+                fill the inputs from a box spec
+
+            .get_fragment() -> fragment
+
+            .invalidate_fragment()
+                forget the cached fragment
+
         ----------------------------------------------------------------------------------------------------------------
 
         :param world: the World class from the main.py class in the Google butler app
@@ -470,13 +842,8 @@ class BoxAny(Box):
         # pygame.draw.line(self.world.screen, gti.colors["white"], (x,     y),     (opp_x, y),     2)  # top
         # pygame.draw.line(self.world.screen, gti.colors["white"], (x,     opp_y), (opp_x, opp_y), 2)  # bottom
         self.border = gti.Border((x, y), (opp_x, opp_y), gti.colors["white"], border_radius=9, border_width=2)
-        self.border.draw(self.world.screen)
 
         # the label and buttons are centered because there is no input_text
-        # label :
-        self.display_text(self.box_type.capitalize(), (x + 75, y + 20),
-                          gti.colors["white"], is_center=(True, True), font_size=23)
-
         # buttons :
         self.left_button = pwi.Button(self.world.screen, x + 10, y + 45, 30, 20, text="<-",
                                       textColour=gti.colors["green"], font_size=30, radius=4,
@@ -488,48 +855,21 @@ class BoxAny(Box):
                                        textColour=gti.colors["green"], font_size=30, radius=4,
                                        onClick=lambda: self.world.box_go_right(self.index))
 
-    def update_index(self, new_index: int):
-        """
-        method to change the position of this box relative to the other ones
+        self.completions = []
 
-        had to overwrite it because it has no input
+        self._draw_chrome()
 
-        ----------------------------------------------------------------------------------------------------------------
-
-        :param new_index: the new index where this box is located
-        :type: int
+    def _render_labels(self, surface: pygame.Surface, x: int, y: int):
         """
-        if new_index < 0:
-            raise ValueError("new_index must be positive")
-
-        self.delete_widgets()
-        self.index = new_index
-        self.x, self.y = self.coord = (15 + (new_index * 160), 260)
-        self.opp_x, self.opp_y = self.opp_coord = self.x + 150, self.y + 100
-        self._create()
-
-    def delete_widgets(self):
-        """
-        method to delete all the widgets of the box
-
-        had to overwrite it because it has no input
+        method to draw the labels of the box on its chrome
+        method used internally only
 
-        used internally in to update the position
-        and to use if you need to delete the box, to have the widgets deleted from the display
+        had to overwrite it because the label isn't in the same place
         """
-        self.delete_button.disable()
-        self.left_button.disable()
-        self.right_button.disable()
-
-        self.delete_button.hide()
-        self.left_button.hide()
-        self.right_button.hide()
-
-        del self.delete_button
-        del self.left_button
-        del self.right_button
-
-        self.border.erase(self.world.screen, gti.colors["black"])
+        # the label is centered because there is no input_text
+        # label :
+        self.display_text(self.box_type.capitalize(), (x + 75, y + 20),
+                          gti.colors["white"], is_center=(True, True), font_size=23, surface=surface)
 
     def get_text(self, parser=lambda x=0: None) -> str:
         """
@@ -550,11 +890,27 @@ class BoxAny(Box):
         :type: str
         """
         if (parser() is None) or (parser is None):
-            return '*'
-        return parser('*')
+            return qc.parse_any()
+        return parser(qc.parse_any())
+
+    def get_raw_text(self) -> str:
+        """
+        method to obtain the raw text from the input of this box
+
+        had to overwrite it because it has no input
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: an empty string
+        :type: str
+        """
+        return ''
 
 
 class BoxDate(Box):
+    _widget_names = ("left_button", "delete_button", "right_button", "year_input", "month_input", "day_input")
+    _input_names = {"year": "year_input", "month": "month_input", "day": "day_input"}
+
     def __init__(self, world, index: int, box_type: str = "Before"):
         """
         Derived class to create a box for the Google butler app
@@ -574,15 +930,37 @@ class BoxDate(Box):
 
             .display_text(text, start_pos, color)
 
+            .get_rect() -> rect
+                the part of the screen the box draws in, completions included
+
             .update_index(new_index)
+                move the box, its widgets are created or released when it comes in or out of the viewport
+
+            .create_widgets()
+                create the widgets of the box, filled with its inputs
+
+            .release_widgets()
+                delete the widgets of the box, keeping its inputs
 
             .delete_widgets()
                 delete every widget of the box
 
+            .get_widgets() -> list of widgets
+
             .get_text() -> parsed_text
 
             .get_raw_text() -> input_text
 
+            .get_spec() -> box_spec
+
+            .set_spec(box_spec)
+                fill the inputs from a box spec
+
+            .get_fragment() -> fragment
+
+            .invalidate_fragment()
+                forget the cached fragment
+
         ----------------------------------------------------------------------------------------------------------------
 
         :param world: the World class from the main.py class in the Google butler app
@@ -618,11 +996,6 @@ class BoxDate(Box):
         # pygame.draw.line(self.world.screen, gti.colors["white"], (x,     y),     (opp_x, y),     2)  # top
         # pygame.draw.line(self.world.screen, gti.colors["white"], (x,     opp_y), (opp_x, opp_y), 2)  # bottom
         self.border = gti.Border((x, y), (opp_x, opp_y), gti.colors["white"], border_radius=9, border_width=2)
-        self.border.draw(self.world.screen)
-
-        # label :
-        self.display_text(self.box_type.capitalize(), (x + 75, y + 15),
-                          gti.colors["white"], is_center=(True, True), font_size=23)
 
         # buttons
         self.left_button = pwi.Button(self.world.screen, x + 10, y + 25, 30, 20, text="<-",
@@ -636,78 +1009,41 @@ class BoxDate(Box):
                                        onClick=lambda: self.world.box_go_right(self.index))
 
         # date input
-        self.year_input = pwi.TextBox(self.world.screen,  x + 5,   y + 65, 55, 30, radius=4)
-        self.month_input = pwi.TextBox(self.world.screen, x + 70,  y + 65, 35, 30, radius=4)
-        self.day_input = pwi.TextBox(self.world.screen,   x + 115, y + 65, 35, 30, radius=4)
+        self.year_input = pwi.TextBox(self.world.screen,  x + 5,   y + 65, 55, 30, radius=4,
+                                      onTextChanged=self.invalidate_fragment)
+        self.month_input = pwi.TextBox(self.world.screen, x + 70,  y + 65, 35, 30, radius=4,
+                                       onTextChanged=self.invalidate_fragment)
+        self.day_input = pwi.TextBox(self.world.screen,   x + 115, y + 65, 35, 30, radius=4,
+                                     onTextChanged=self.invalidate_fragment)
 
-        # label for the input
-        self.display_text("year",  (x + 32,  y + 50), gti.colors["white"], is_center=(True, False), font_size=20)
-        self.display_text("month", (x + 87,  y + 50), gti.colors["white"], is_center=(True, False), font_size=20)
-        self.display_text("day",   (x + 132, y + 50), gti.colors["white"], is_center=(True, False), font_size=20)
-
-        # " / " between input boxes
-        self.display_text('/', (x + 65,  y + 80), gti.colors["white"], is_center=(True, True), font_size=40)
-        self.display_text('/', (x + 110, y + 80), gti.colors["white"], is_center=(True, True), font_size=40)
-
-    def update_index(self, new_index: int):
-        """
-        method to change the position of this box relative to the other ones
+        self.completions = []
 
-        had to overwrite it because it has more inputs and labels
+        self._draw_chrome()
 
-        ----------------------------------------------------------------------------------------------------------------
-
-        :param new_index: the new index where this box is located
-        :type: int
-        """
-        if new_index < 0:
-            raise ValueError("new_index must be positive")
-
-        year_transfer = self.year_input.getText()
-        month_transfer = self.month_input.getText()
-        day_transfer = self.day_input.getText()
-
-        self.delete_widgets()
-        self.index = new_index
-        self.x, self.y = self.coord = (15 + (new_index * 160), 260)
-        self.opp_x, self.opp_y = self.opp_coord = self.x + 150, self.y + 100
-        self._create()
-
-        self.year_input.setText(year_transfer)
-        self.month_input.setText(month_transfer)
-        self.day_input.setText(day_transfer)
-
-    def delete_widgets(self):
+    def _render_labels(self, surface: pygame.Surface, x: int, y: int):
         """
-        method to delete all the widgets of the box
-
-        had to overwrite it because it has more inputs
+        method to draw the labels of the box on its chrome
+        method used internally only
 
-        used internally in to update the position
-        and to use if you need to delete the box, to have the widgets deleted from the display
+        had to overwrite it because it has more labels
         """
-        self.delete_button.disable()
-        self.left_button.disable()
-        self.right_button.disable()
-        self.year_input.disable()
-        self.month_input.disable()
-        self.day_input.disable()
-
-        self.delete_button.hide()
-        self.left_button.hide()
-        self.right_button.hide()
-        self.year_input.hide()
-        self.month_input.hide()
-        self.day_input.hide()
+        # label :
+        self.display_text(self.box_type.capitalize(), (x + 75, y + 15),
+                          gti.colors["white"], is_center=(True, True), font_size=23, surface=surface)
 
-        del self.delete_button
-        del self.left_button
-        del self.right_button
-        del self.year_input
-        del self.month_input
-        del self.day_input
+        # label for the input
+        self.display_text("year",  (x + 32,  y + 50), gti.colors["white"], is_center=(True, False), font_size=20,
+                          surface=surface)
+        self.display_text("month", (x + 87,  y + 50), gti.colors["white"], is_center=(True, False), font_size=20,
+                          surface=surface)
+        self.display_text("day",   (x + 132, y + 50), gti.colors["white"], is_center=(True, False), font_size=20,
+                          surface=surface)
 
-        self.border.erase(self.world.screen, gti.colors["black"])
+        # " / " between input boxes
+        self.display_text('/', (x + 65,  y + 80), gti.colors["white"], is_center=(True, True), font_size=40,
+                          surface=surface)
+        self.display_text('/', (x + 110, y + 80), gti.colors["white"], is_center=(True, True), font_size=40,
+                          surface=surface)
 
     def get_text(self, parser=lambda x=0: None) -> str:
         """
@@ -727,20 +1063,38 @@ class BoxDate(Box):
         :return: the parsed input
         :type: str
         """
-        year, month, day = test_and_handle_ymd(
-            self.year_input.getText(),
-            self.month_input.getText(),
-            self.day_input.getText()
+        text = qc.parse_date(
+            self.box_type,
+            self._get_input("year"),
+            self._get_input("month"),
+            self._get_input("day")
         )
 
-        text = f"{self.box_type.lower()}:{year}{self.separator}{month}{self.separator}{day}"
-
         if (parser() is None) or (parser is None):
             return text
         return parser(text)
 
+    def get_raw_text(self) -> str:
+        """
+        method to obtain the raw text from the inputs of this box, as yyyy mm dd
+
+        had to overwrite it because it has more inputs
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the raw inputs
+        :type: str
+        """
+        return f"{self._get_input('year')} {self._get_input('month')} {self._get_input('day')}"
+
 
 class BoxDateRange(Box):
+    _widget_names = ("left_button", "delete_button", "right_button",
+                     "first_year_input", "first_month_input", "first_day_input",
+                     "last_year_input", "last_month_input", "last_day_input")
+    _input_names = {"first_year": "first_year_input", "first_month": "first_month_input", "first_day": "first_day_input",
+                    "last_year":  "last_year_input",  "last_month":  "last_month_input",  "last_day":  "last_day_input"}
+
     def __init__(self, world, index: int):
         """
         Derived class to create a box for the Google butler app
@@ -760,15 +1114,37 @@ class BoxDateRange(Box):
 
             .display_text(text, start_pos, color)
 
+            .get_rect() -> rect
+                the part of the screen the box draws in, completions included
+
             .update_index(new_index)
+                move the box, its widgets are created or released when it comes in or out of the viewport
+
+            .create_widgets()
+                create the widgets of the box, filled with its inputs
+
+            .release_widgets()
+                delete the widgets of the box, keeping its inputs
 
             .delete_widgets()
                 delete every widget of the box
 
+            .get_widgets() -> list of widgets
+
             .get_text() -> parsed_text
 
             .get_raw_text() -> input_text
 
+            .get_spec() -> box_spec
+
+            .set_spec(box_spec)
+                fill the inputs from a box spec
+
+            .get_fragment() -> fragment
+
+            .invalidate_fragment()
+                forget the cached fragment
+
         ----------------------------------------------------------------------------------------------------------------
 
         :param world: the World class from the main.py class in the Google butler app
@@ -797,11 +1173,6 @@ class BoxDateRange(Box):
         # pygame.draw.line(self.world.screen, gti.colors["white"], (x,     y),     (opp_x, y),     2)  # top
         # pygame.draw.line(self.world.screen, gti.colors["white"], (x,     opp_y), (opp_x, opp_y), 2)  # bottom
         self.border = gti.Border((x, y), (opp_x, opp_y), gti.colors["white"], border_radius=9, border_width=2)
-        self.border.draw(self.world.screen)
-
-        # label :
-        self.display_text(self.box_type.capitalize(), (x + 75, y + 15),
-                          gti.colors["white"], is_center=(True, True), font_size=23)
 
         # buttons
         self.left_button = pwi.Button(self.world.screen, x + 10, y + 25, 30, 20, text="<-",
@@ -815,103 +1186,53 @@ class BoxDateRange(Box):
                                        onClick=lambda: self.world.box_go_right(self.index))
 
         # first date input
-        self.first_year_input = pwi.TextBox(self.world.screen,  x + 5,   y + 50, 55, 25, radius=4)
-        self.first_month_input = pwi.TextBox(self.world.screen, x + 70,  y + 50, 35, 25, radius=4)
-        self.first_day_input = pwi.TextBox(self.world.screen,   x + 115, y + 50, 35, 25, radius=4)
+        self.first_year_input = pwi.TextBox(self.world.screen,  x + 5,   y + 50, 55, 25, radius=4,
+                                            onTextChanged=self.invalidate_fragment)
+        self.first_month_input = pwi.TextBox(self.world.screen, x + 70,  y + 50, 35, 25, radius=4,
+                                             onTextChanged=self.invalidate_fragment)
+        self.first_day_input = pwi.TextBox(self.world.screen,   x + 115, y + 50, 35, 25, radius=4,
+                                           onTextChanged=self.invalidate_fragment)
 
         # last date input
-        self.last_year_input = pwi.TextBox(self.world.screen,  x + 5,   y + 70, 55, 25, radius=4)
-        self.last_month_input = pwi.TextBox(self.world.screen, x + 70,  y + 70, 35, 25, radius=4)
-        self.last_day_input = pwi.TextBox(self.world.screen,   x + 115, y + 70, 35, 25, radius=4)
+        self.last_year_input = pwi.TextBox(self.world.screen,  x + 5,   y + 70, 55, 25, radius=4,
+                                           onTextChanged=self.invalidate_fragment)
+        self.last_month_input = pwi.TextBox(self.world.screen, x + 70,  y + 70, 35, 25, radius=4,
+                                            onTextChanged=self.invalidate_fragment)
+        self.last_day_input = pwi.TextBox(self.world.screen,   x + 115, y + 70, 35, 25, radius=4,
+                                          onTextChanged=self.invalidate_fragment)
 
-        # label for the input
-        # self.display_text("year",  (x + 32,  y + 50), gti.colors["white"], is_center=(True, False), font_size=20)
-        # self.display_text("month", (x + 87,  y + 50), gti.colors["white"], is_center=(True, False), font_size=20)
-        # self.display_text("day",   (x + 132, y + 50), gti.colors["white"], is_center=(True, False), font_size=20)
-
-        # TODO : make the interface more easy to use
+        self.completions = []
 
-        # " / " between input boxes
-        self.display_text('/', (x + 65,  y + 85), gti.colors["white"], is_center=(True, True), font_size=40)
-        self.display_text('/', (x + 110, y + 85), gti.colors["white"], is_center=(True, True), font_size=40)
-
-        self.display_text('/', (x + 65,  y + 65), gti.colors["white"], is_center=(True, True), font_size=40)
-        self.display_text('/', (x + 110, y + 65), gti.colors["white"], is_center=(True, True), font_size=40)
+        self._draw_chrome()
 
-    def update_index(self, new_index: int):
+    def _render_labels(self, surface: pygame.Surface, x: int, y: int):
         """
-        method to change the position of this box relative to the other ones
-
-        had to overwrite it because it has more inputs and labels
-
-        ----------------------------------------------------------------------------------------------------------------
+        method to draw the labels of the box on its chrome
+        method used internally only
 
-        :param new_index: the new index where this box is located
-        :type: int
+        had to overwrite it because it has more labels
         """
-        if new_index < 0:
-            raise ValueError("new_index must be positive")
-
-        first_year_transfer = self.first_year_input.getText()
-        first_month_transfer = self.first_month_input.getText()
-        first_day_transfer = self.first_day_input.getText()
-        last_year_transfer = self.last_year_input.getText()
-        last_month_transfer = self.last_month_input.getText()
-        last_day_transfer = self.last_day_input.getText()
-
-        self.delete_widgets()
-        self.index = new_index
-        self.x, self.y = self.coord = (15 + (new_index * 160), 260)
-        self.opp_x, self.opp_y = self.opp_coord = self.x + 150, self.y + 100
-        self._create()
+        # label :
+        self.display_text(self.box_type.capitalize(), (x + 75, y + 15),
+                          gti.colors["white"], is_center=(True, True), font_size=23, surface=surface)
 
-        self.first_year_input.setText(first_year_transfer)
-        self.first_month_input.setText(first_month_transfer)
-        self.first_day_input.setText(first_day_transfer)
-        self.last_year_input.setText(last_year_transfer)
-        self.last_month_input.setText(last_month_transfer)
-        self.last_day_input.setText(last_day_transfer)
+        # label for the input
+        # self.display_text("year",  (x + 32,  y + 50), gti.colors["white"], is_center=(True, False), font_size=20)
+        # self.display_text("month", (x + 87,  y + 50), gti.colors["white"], is_center=(True, False), font_size=20)
+        # self.display_text("day",   (x + 132, y + 50), gti.colors["white"], is_center=(True, False), font_size=20)
 
-    def delete_widgets(self):
-        """
-        method to delete all the widgets of the box
+        # TODO : make the interface more easy to use
 
-        had to overwrite it because it has more inputs
+        # " / " between input boxes
+        self.display_text('/', (x + 65,  y + 85), gti.colors["white"], is_center=(True, True), font_size=40,
+                          surface=surface)
+        self.display_text('/', (x + 110, y + 85), gti.colors["white"], is_center=(True, True), font_size=40,
+                          surface=surface)
 
-        used internally in to update the position
-        and to use if you need to delete the box, to have the widgets deleted from the display
-        """
-        self.delete_button.disable()
-        self.left_button.disable()
-        self.right_button.disable()
-        self.first_year_input.disable()
-        self.first_month_input.disable()
-        self.first_day_input.disable()
-        self.last_year_input.disable()
-        self.last_month_input.disable()
-        self.last_day_input.disable()
-
-        self.delete_button.hide()
-        self.left_button.hide()
-        self.right_button.hide()
-        self.first_year_input.hide()
-        self.first_month_input.hide()
-        self.first_day_input.hide()
-        self.last_year_input.hide()
-        self.last_month_input.hide()
-        self.last_day_input.hide()
-
-        del self.delete_button
-        del self.left_button
-        del self.right_button
-        del self.first_year_input
-        del self.first_month_input
-        del self.first_day_input
-        del self.last_year_input
-        del self.last_month_input
-        del self.last_day_input
-
-        self.border.erase(self.world.screen, gti.colors["black"])
+        self.display_text('/', (x + 65,  y + 65), gti.colors["white"], is_center=(True, True), font_size=40,
+                          surface=surface)
+        self.display_text('/', (x + 110, y + 65), gti.colors["white"], is_center=(True, True), font_size=40,
+                          surface=surface)
 
     def get_text(self, parser=lambda x=0: None) -> str:
         """
@@ -931,20 +1252,67 @@ class BoxDateRange(Box):
         :return: the parsed input
         :type: str
         """
-        first_year, first_month, first_day = test_and_handle_ymd(
-            self.first_year_input.getText(),
-            self.first_month_input.getText(),
-            self.first_day_input.getText()
-        )
-        last_year, last_month, last_day = test_and_handle_ymd(
-            self.last_year_input.getText(),
-            self.last_month_input.getText(),
-            self.last_day_input.getText()
+        text = qc.parse_date_range(
+            self._get_input("first_year"),
+            self._get_input("first_month"),
+            self._get_input("first_day"),
+            self._get_input("last_year"),
+            self._get_input("last_month"),
+            self._get_input("last_day")
         )
 
-        text = f"{first_year}{self.separator}{first_month}{self.separator}{first_day}" \
-               f"::{last_year}{self.separator}{last_month}{self.separator}{last_day}"
-
         if (parser() is None) or (parser is None):
             return text
         return parser(text)
+
+    def get_raw_text(self) -> str:
+        """
+        method to obtain the raw text from the inputs of this box, as yyyy mm dd yyyy mm dd
+
+        had to overwrite it because it has more inputs
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the raw inputs
+        :type: str
+        """
+        return f"{self._get_input('first_year')} {self._get_input('first_month')} " \
+               f"{self._get_input('first_day')} {self._get_input('last_year')} " \
+               f"{self._get_input('last_month')} {self._get_input('last_day')}"
+
+
+def box_from_spec(world, index: int, spec: dict) -> Box:
+    """
+    function to create the box described by a box spec (see the query_compiler module), with its inputs filled
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param world: the World class from the main.py class in the Google butler app
+    :type: the World class from the main.py class in the Google butler app
+    :param index: a positive integer, the position of the box in your line of boxes to create the query
+    :type: int
+    :param spec: the box spec
+    :type: dict
+
+    :return: the box
+    :type: Box or a derived class
+    """
+    box_type = spec.get("type", "Normal").capitalize()
+
+    if box_type == "Normal":
+        box = Box(world, index)
+    elif box_type == "Exact":
+        box = BoxExact(world, index)
+    elif box_type == "Avoid":
+        box = BoxAvoid(world, index)
+    elif box_type == "Any":
+        box = BoxAny(world, index)
+    elif box_type in ("Before", "After"):
+        box = BoxDate(world, index, box_type=box_type)
+    elif box_type == "Range":
+        box = BoxDateRange(world, index)
+    else:
+        raise ValueError(f"Unknown box type : {spec.get('type')}")
+
+    box.set_spec(spec)
+    return box
@@ -0,0 +1,196 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+file to complete the words typed in the boxes from the words of the previous searches
+
+the words are kept in a prefix trie where every node remembers its most used completions,
+so completing a prefix only walks down the trie along the prefix : the time doesn't depend on the number of words,
+which keeps it far under a millisecond per keystroke even with millions of words
+
+this module contains :
+
+    - Autocomplete : a class to learn words and complete prefixes
+"""
+
+import time
+
+
+# +-------------------+
+# |   internal tool   |
+# +-------------------+
+class _TrieNode(object):
+    __slots__ = ("children", "count", "top")
+
+    def __init__(self):
+        """
+        class of a node of the trie
+        class used internally only
+
+        children : the nodes of the next characters, by character
+        count : the number of times the word ending at this node has been learned (0 if no word ends here)
+        top : the most used words starting with the prefix of this node, as [count, word] sorted by decreasing count
+        """
+        self.children = {}
+        self.count = 0
+        self.top = []
+
+
+# +------------------+
+# |   Autocomplete   |
+# +------------------+
+class Autocomplete(object):
+    def __init__(self, nbr_completions: int = 5, max_length: int = 64):
+        """
+        class to learn the words of the searches and complete the prefixes typed in the boxes
+
+        the words are compared in lower case
+
+        Please refer to the documentation of each method for further explanation
+        You can do that with help(Autocomplete.{method_name})
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        Methods:
+
+            .add(word)
+                learn a word, or learn it once more
+
+            .add_text(text)
+                learn every word of a text
+
+            .complete(prefix, limit) -> list of words
+
+            .get_stats() -> dict
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param nbr_completions: the number of completions remembered for each prefix, optional defaulted to 5
+        :type: int
+        :param max_length: the words longer than this are ignored, optional defaulted to 64
+        :type: int
+        """
+        if nbr_completions <= 0:
+            raise ValueError("nbr_completions must be strictly positive")
+
+        self.nbr_completions = nbr_completions
+        self.max_length = max_length
+
+        self._root = _TrieNode()
+        self.nbr_words = 0
+
+        self.last_latency = 0.0  # in seconds, of the last call to complete
+        self.max_latency = 0.0
+
+    def __len__(self) -> int:
+        """
+        Implement len(self)
+        """
+        return self.nbr_words
+
+    def add(self, word: str):
+        """
+        method to learn a word, learning it again makes it come earlier in the completions
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param word: the word
+        :type: str
+        """
+        word = word.strip().lower()
+        if not word or len(word) > self.max_length:
+            return
+
+        path = [self._root]
+        for char in word:
+            node = path[-1].children.get(char)
+            if node is None:
+                node = path[-1].children[char] = _TrieNode()
+            path.append(node)
+
+        if path[-1].count == 0:
+            self.nbr_words += 1
+        path[-1].count += 1
+        count = path[-1].count
+
+        # every prefix of the word may now have it in its most used completions
+        for node in path:
+            for item in node.top:
+                if item[1] == word:
+                    item[0] = count
+                    break
+            else:
+                if len(node.top) < self.nbr_completions:
+                    node.top.append([count, word])
+                elif count > node.top[-1][0]:
+                    node.top[-1] = [count, word]
+                else:
+                    continue
+
+            node.top.sort(key=lambda item: -item[0])
+
+    def add_text(self, text: str):
+        """
+        method to learn every word of a text, the words are separated by spaces
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param text: the text
+        :type: str
+        """
+        for word in text.split(' '):
+            self.add(word)
+
+    def complete(self, prefix: str, limit: int = None) -> list[str]:
+        """
+        method to obtain the most used words starting with a prefix, the most used first
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param prefix: the beginning of the word
+        :type: str
+
+        :param limit: the number maximum of words, optional defaulted to None (nbr_completions)
+        :type: int
+
+        :return: the words
+        :type: list of str
+        """
+        start = time.perf_counter()
+
+        node = self._root
+        for char in prefix.lower()[:self.max_length]:
+            node = node.children.get(char)
+            if node is None:
+                break
+
+        completions = [] if node is None else [word for _, word in node.top[:limit]]
+
+        self.last_latency = time.perf_counter() - start
+        self.max_latency = max(self.max_latency, self.last_latency)
+
+        return completions
+
+    def get_stats(self) -> dict:
+        """
+        method to obtain the statistics of the autocompletion
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the keys "words", "last_latency" and "max_latency" (in seconds)
+        :type: dict
+        """
+        return {
+            "words":        self.nbr_words,
+            "last_latency": self.last_latency,
+            "max_latency":  self.max_latency,
+        }
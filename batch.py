@@ -0,0 +1,194 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+batch file, the command line entry point next to main.main()
+
+it reads a JSONL stream where each line is a list of box specs (see the query_compiler module) :
+
+    [{"type": "Normal", "text": "pygame"}, {"type": "After", "year": "2020", "month": "1", "day": "1"}]
+
+and writes the resulting queries to stdout, one per line, in the same order as the input
+
+usage :
+
+    python batch.py [input] [--mode parsed|raw|both] [--workers N] [--chunk-size N]
+
+        input : a JSONL file, or '-' (the default) to read from stdin
+        --mode : which query to write, the one with the keywords (parsed), without (raw) or both, defaulted to parsed
+        --workers : number of processes used to compile the queries, defaulted to 0 (no process pool)
+        --chunk-size : number of lines sent to a process at once, defaulted to 10000
+
+the errors are written to stderr with the number of the line, the same way World.search shows them in a popup,
+and the exit status is 1 if there was any
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import sys
+
+import query_compiler as qc
+
+
+# +--------------------+
+# |   internal tools   |
+# +--------------------+
+def _chunks(lines, chunk_size: int):
+    """
+    generator to split an iterable of lines into lists of chunk_size lines, without reading it all at once
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param lines: the lines to split
+    :type: iterable of str
+    :param chunk_size: the number of lines in each chunk
+    :type: int
+
+    :return: tuples (number of the first line of the chunk, lines of the chunk)
+    :type: generator of tuple[int, list[str]]
+    """
+    lines = iter(lines)
+    start = 1
+
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            return
+
+        yield start, chunk
+        start += len(chunk)
+
+
+def compile_chunk(args: tuple[int, list[str], str]) -> tuple[list[str], list[str]]:
+    """
+    function to compile a chunk of JSONL lines into queries
+
+    used as is when there is no process pool, and as the task of each process otherwise
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param args: the number of the first line, the lines and the mode ("parsed", "raw" or "both")
+    :type: tuple[int, list[str], str]
+
+    :return: the queries and the error messages
+    :type: tuple[list[str], list[str]]
+    """
+    start, lines, mode = args
+
+    compiler = qc.QueryCompiler()
+    min_length = len(compiler.base_url)
+
+    queries = []
+    messages = []
+
+    for line_number, line in enumerate(lines, start):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            specs = json.loads(line)
+            if not isinstance(specs, list):
+                raise ValueError("a line must be a list of box specs")
+
+            query_parsed, query_raw, errors = compiler.compile(specs)
+
+        except (ValueError, AttributeError) as err:
+            messages.append(f"line {line_number} : {err}")
+            continue
+
+        for box_index, err in errors:
+            messages.append(f"line {line_number}, box {box_index} : {err}")
+
+        # same check as World.search to not have an empty search
+        if len(query_parsed) <= min_length:
+            continue
+
+        if mode in ("parsed", "both"):
+            queries.append(query_parsed)
+        if mode in ("raw", "both"):
+            queries.append(query_raw)
+
+    return queries, messages
+
+
+def _write(queries: list[str], messages: list[str]):
+    """
+    function to write the queries to stdout and the error messages to stderr
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param queries: the compiled queries
+    :type: list of str
+    :param messages: the error messages
+    :type: list of str
+    """
+    if queries:
+        sys.stdout.write('\n'.join(queries) + '\n')
+    if messages:
+        sys.stderr.write('\n'.join(messages) + '\n')
+
+
+# +-----------------+
+# |   entry point   |
+# +-----------------+
+def main(*argv):
+    parser = argparse.ArgumentParser(prog="batch.py", description="compile JSONL lists of box specs into queries")
+    parser.add_argument("input", nargs='?', default='-', help="JSONL file, or '-' to read from stdin")
+    parser.add_argument("--mode", choices=("parsed", "raw", "both"), default="parsed")
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+
+    # like main.main(), argv is given the way sys.argv is, with the name of the program first
+    args = parser.parse_args(argv[1:])
+
+    if args.workers < 0:
+        parser.error("--workers must be positive")
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size must be strictly positive")
+
+    has_errors = False
+
+    file = sys.stdin if args.input == '-' else open(args.input, 'r', encoding="utf-8")
+
+    try:
+        tasks = ((start, lines, args.mode) for start, lines in _chunks(file, args.chunk_size))
+
+        if args.workers:
+            with multiprocessing.Pool(args.workers) as pool:
+                # imap reads all of its tasks ahead of the processes, so it is only given 2 chunks by process at once
+                # to keep the memory bounded on huge inputs, imap keeps the order of the chunks
+                while True:
+                    window = list(itertools.islice(tasks, 2 * args.workers))
+                    if not window:
+                        break
+
+                    for queries, messages in pool.imap(compile_chunk, window):
+                        _write(queries, messages)
+                        has_errors = has_errors or bool(messages)
+        else:
+            for task in tasks:
+                queries, messages = compile_chunk(task)
+                _write(queries, messages)
+                has_errors = has_errors or bool(messages)
+
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+    return 1 if has_errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*sys.argv))
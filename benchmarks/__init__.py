@@ -0,0 +1,23 @@
+
+"""
+package to contain the benchmarks of the google search butler app
+
+@author: Zaynn-Lea
+
+see on gitHub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+    - bench_url_encoder : compare query_compiler.encode_text with the old per-box parsing loops
+    - bench_app : time the boxes and the World methods the users hit the most, and compare them with a baseline
+
+every benchmark is a script to run from the root of the project, for instance :
+
+    python -m benchmarks.bench_url_encoder
+"""
+
+__all__ = ["bench_url_encoder", "bench_app"]
@@ -0,0 +1,354 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+benchmark of the code paths of the app the users hit the most, run under the SDL dummy video driver :
+
+    - Box.get_text, for every type of box
+    - World.search, with 1 to 10 000 boxes, with the query cache cleared (cold) or not (warm)
+    - World.delete_box (of the first box, the worst case), World.box_go_right, World.box_go_left
+      and World.reset_lst_box, with a growing number of boxes
+    - World.update_widgets, the widgets part of a frame, with a growing number of boxes
+
+the times are given in microseconds as percentiles, they can be saved as a JSON baseline
+and a later run can be compared against it, a run slower than the baseline exits with the status 1
+
+the web browser is never opened, the urls given to the World are only counted,
+and the history is written in a temporary directory
+
+usage :
+
+    python -m benchmarks.bench_app [--repeat N] [--sizes N ...] [--box-sizes N ...]
+                                   [--save baseline.json] [--compare baseline.json [--tolerance 0.2]]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import Boxes
+import frame_scheduler
+import main as app
+import pygame_widgets_import as pwi
+
+SCREEN_SIZE = (1280, 720)
+
+PERCENTILES = (50, 90, 99)
+
+
+def summarize(times: list) -> dict:
+    """
+    function to obtain the statistics of a list of times
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param times: the times in seconds
+    :type: list of float
+
+    :return: the keys "runs", "min", "mean", "max" and "p50", "p90", "p99", in microseconds
+    :type: dict
+    """
+    times = sorted(time_ * 1e6 for time_ in times)
+
+    summary = {"runs": len(times), "min": times[0], "mean": sum(times) / len(times), "max": times[-1]}
+    for percent in PERCENTILES:
+        summary[f"p{percent}"] = frame_scheduler.percentile(times, percent)
+
+    return summary
+
+
+def measure(function, repeat: int, setup=None) -> dict:
+    """
+    function to time a function several times, the setup is called before each run and isn't timed
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param function: the function to time, without parameter
+    :type: function
+    :param repeat: the number of runs
+    :type: int
+
+    :param setup: a function without parameter called before each run, optional defaulted to None
+    :type: function
+
+    :return: the statistics of the runs (see summarize)
+    :type: dict
+    """
+    times = []
+
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return summarize(times)
+
+
+# +-------------+
+# |   the app   |
+# +-------------+
+def make_world(screen: pygame.Surface, history_dir: str) -> app.World:
+    """
+    function to create a World that doesn't open the web browser and keeps its history in history_dir
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param screen: the surface of the world
+    :type: pygame.Surface
+    :param history_dir: the directory of the history files
+    :type: str
+
+    :return: the world
+    :type: main.World
+    """
+    app.register_counting_browser()
+
+    return app.World(screen, SCREEN_SIZE, repeat_search_window=0.0,
+                     history_path=os.path.join(history_dir, f"history_{time.perf_counter_ns()}"), browser="scripted")
+
+
+def fill_boxes(world: app.World, nbr_boxes: int):
+    """
+    function to replace the boxes of a world by nbr_boxes Normal boxes with some text in them
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param world: the world
+    :type: main.World
+    :param nbr_boxes: the number of boxes
+    :type: int
+    """
+    for box in world.lst_box:
+        box.delete_widgets()
+
+    world.scroll_index = 0
+    world.lst_box = []
+    for i in range(nbr_boxes):
+        box = Boxes.Box(world, i)
+        box.set_spec({"text": f"word{i} other words & more"})
+        world.lst_box.append(box)
+
+
+def make_boxes_of_every_type(world: app.World) -> dict:
+    """
+    function to create one box of every type, with their inputs filled
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param world: the world of the boxes
+    :type: main.World
+
+    :return: the boxes, by name
+    :type: dict
+    """
+    boxes = {
+        "Normal":      Boxes.Box(world, 0),
+        "Exact":       Boxes.BoxExact(world, 1),
+        "Avoid":       Boxes.BoxAvoid(world, 2),
+        "Any":         Boxes.BoxAny(world, 3),
+        "Before":      Boxes.BoxDate(world, 4, box_type="Before"),
+        "After":       Boxes.BoxDate(world, 5, box_type="After"),
+        "Range":       Boxes.BoxDateRange(world, 6),
+    }
+
+    for name in ("Normal", "Exact", "Avoid"):
+        boxes[name].set_spec({"text": "search butler & friends 100%"})
+    for name in ("Before", "After"):
+        boxes[name].set_spec({"year": "2024", "month": "2", "day": "29"})
+    boxes["Range"].set_spec({"first_year": "2020", "first_month": "1", "first_day": "1",
+                             "last_year":  "2024", "last_month":  "12", "last_day": "31"})
+
+    return boxes
+
+
+# +----------------+
+# |   benchmarks   |
+# +----------------+
+def bench_get_text(world: app.World, repeat: int) -> dict:
+    results = {}
+
+    for name, box in make_boxes_of_every_type(world).items():
+        results[f"get_text/{name}"] = measure(box.get_text, repeat)
+
+    return results
+
+
+def bench_search(world: app.World, sizes: list, repeat: int) -> dict:
+    results = {}
+
+    search_mode_selection = pwi.Checkbox(world.screen, 0, 0, 200, 60, ("Without keyword", "With keyword"))
+    search_mode_selection.selected = [True, True]
+
+    def forget_queries():
+        world.query_cache.clear()
+        for box in world.lst_box:
+            box.invalidate_fragment()
+
+    for nbr_boxes in sizes:
+        fill_boxes(world, nbr_boxes)
+
+        results[f"search/cold/{nbr_boxes}"] = measure(lambda: world.search(search_mode_selection), repeat,
+                                                      setup=forget_queries)
+        results[f"search/warm/{nbr_boxes}"] = measure(lambda: world.search(search_mode_selection), repeat)
+
+    return results
+
+
+def bench_box_operations(world: app.World, sizes: list, repeat: int) -> dict:
+    results = {}
+
+    def add_boxes(nbr_boxes):
+        while len(world.lst_box) < nbr_boxes:
+            world.lst_box.append(Boxes.Box(world, len(world.lst_box)))
+
+    for nbr_boxes in sizes:
+        fill_boxes(world, nbr_boxes)
+
+        # the deleted box is added back at the end, so that every run has the same number of boxes
+        results[f"delete_box/{nbr_boxes}"] = measure(lambda: world.delete_box(0), repeat,
+                                                     setup=lambda: add_boxes(nbr_boxes))
+        add_boxes(nbr_boxes)
+
+        results[f"box_go_right/{nbr_boxes}"] = measure(lambda: world.box_go_right(0), repeat)
+        results[f"box_go_left/{nbr_boxes}"] = measure(lambda: world.box_go_left(len(world.lst_box) - 1), repeat)
+        results[f"reset_lst_box/{nbr_boxes}"] = measure(world.reset_lst_box, repeat,
+                                                        setup=lambda: fill_boxes(world, nbr_boxes))
+
+    return results
+
+
+def bench_update_widgets(world: app.World, sizes: list, repeat: int) -> dict:
+    results = {}
+
+    # the mouse is over the text input of the first box
+    pygame.mouse.set_pos(60, 335)
+
+    for nbr_boxes in sizes:
+        fill_boxes(world, nbr_boxes)
+        results[f"update_widgets/{nbr_boxes}"] = measure(lambda: world.update_widgets([]), repeat)
+
+    return results
+
+
+# +---------------+
+# |   baselines   |
+# +---------------+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    function to compare the results of a run with a baseline, on the median times
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param results: the results of the run
+    :type: dict
+    :param baseline: the results of the baseline
+    :type: dict
+    :param tolerance: how much slower than the baseline a median can be, 0.2 for 20 %
+    :type: float
+
+    :return: the names of the benchmarks slower than the baseline
+    :type: list of str
+    """
+    regressions = []
+
+    print(f"\n{'benchmark':<28}{'baseline p50':>15}{'p50':>15}{'ratio':>10}")
+
+    for name, summary in results.items():
+        if name not in baseline:
+            continue
+
+        ratio = summary["p50"] / baseline[name]["p50"] if baseline[name]["p50"] else float("inf")
+        is_regression = ratio > 1 + tolerance
+        if is_regression:
+            regressions.append(name)
+
+        print(f"{name:<28}{baseline[name]['p50']:>15.1f}{summary['p50']:>15.1f}{ratio:>10.2f}"
+              f"{'  slower' if is_regression else ''}")
+
+    return regressions
+
+
+def main(*argv):
+    parser = argparse.ArgumentParser(prog="bench_app")
+    parser.add_argument("--repeat", type=int, default=20, help="number of runs of each benchmark")
+    parser.add_argument("--sizes", type=int, nargs='+', default=[1, 10, 100, 1_000, 10_000],
+                        help="numbers of boxes for World.search")
+    parser.add_argument("--box-sizes", type=int, nargs='+', default=[2, 10, 100],
+                        help="numbers of boxes for delete_box, box_go_right, box_go_left, reset_lst_box "
+                             "and update_widgets")
+    parser.add_argument("--save", help="file where to save the results as a JSON baseline")
+    parser.add_argument("--compare", help="JSON baseline to compare the results with")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="how much slower than the baseline a median can be, optional defaulted to 0.2 (20 %%)")
+    args = parser.parse_args(argv[1:])
+
+    if args.repeat <= 0:
+        parser.error("--repeat must be strictly positive")
+    if min(args.sizes) <= 0 or min(args.box_sizes) <= 0:
+        parser.error("the numbers of boxes must be strictly positive")
+
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+
+    with tempfile.TemporaryDirectory() as history_dir:
+        world = make_world(screen, history_dir)
+        world.on_user_create()
+
+        results = {}
+        results.update(bench_get_text(world, args.repeat * 50))
+        results.update(bench_search(world, args.sizes, args.repeat))
+        results.update(bench_box_operations(world, args.box_sizes, args.repeat))
+        results.update(bench_update_widgets(world, args.box_sizes, args.repeat * 10))
+
+        world.close()
+
+    pygame.quit()
+
+    print(f"{'benchmark':<28}{'runs':>6}" + ''.join(f"{name + ' (us)':>15}"
+                                                  for name in ("min", "p50", "p90", "p99", "max")))
+    for name, summary in results.items():
+        print(f"{name:<28}{summary['runs']:>6}" + ''.join(f"{summary[key]:>15.1f}"
+                                                         for key in ("min", "p50", "p90", "p99", "max")))
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({
+                "python":  platform.python_version(),
+                "pygame":  pygame.version.ver,
+                "machine": platform.platform(),
+                "results": results,
+            }, file, indent=4)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+
+        if compare(results, baseline, args.tolerance):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(*sys.argv))
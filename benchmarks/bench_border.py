@@ -0,0 +1,97 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+benchmark of drawing many borders of graphic_tool : one Border.draw per border against one BorderGroup.draw,
+run under the SDL dummy video driver
+
+the borders are the rounded frames of the boxes with a few sizes and colors, laid on a grid twice as wide as the
+screen, so that half of them are outside of it (of its clip)
+
+usage :
+
+    python -m benchmarks.bench_border [--repeat N] [--sizes N ...]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import graphic_tool_import as gti
+
+SCREEN_SIZE = (1280, 720)
+
+
+def make_borders(nbr_borders: int) -> list:
+    """
+    function to make borders on a grid twice as wide as the screen, with 3 sizes and 2 colors
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param nbr_borders: the number of borders
+    :type: int
+
+    :return: the borders
+    :type: list of graphic_tool.Border
+    """
+    borders = []
+    nbr_columns = (2 * SCREEN_SIZE[0]) // 40
+
+    for i in range(nbr_borders):
+        x, y = (i % nbr_columns) * 40, ((i // nbr_columns) * 30) % SCREEN_SIZE[1]
+        width, height = (30, 20) if i % 3 else (36, 24)
+        color = gti.colors["white"] if i % 2 else gti.colors["green"]
+
+        borders.append(gti.Border((x, y), (x + width, y + height), color, border_radius=6, border_width=2))
+
+    return borders
+
+
+def main(*argv):
+    parser = argparse.ArgumentParser(prog="bench_border")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--sizes", type=int, nargs='+', default=[10, 100, 1_000])
+    args = parser.parse_args(argv[1:])
+
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+
+    print(f"{'borders':<10}{'Border.draw (us)':>20}{'BorderGroup.draw (us)':>25}{'drawn':>8}{'skipped':>10}")
+
+    for nbr_borders in args.sizes:
+        borders = make_borders(nbr_borders)
+        group = gti.BorderGroup(borders)
+
+        def draw_each():
+            for border in borders:
+                border.draw(screen)
+
+        draw_each()  # the borders are rasterized and their backgrounds saved before timing
+        group.draw(screen)
+
+        each_time = timeit.timeit(draw_each, number=args.repeat) / args.repeat * 1e6
+        group_time = timeit.timeit(lambda: group.draw(screen), number=args.repeat) / args.repeat * 1e6
+        stats = group.get_stats()
+
+        print(f"{nbr_borders:<10}{each_time:>20.1f}{group_time:>25.1f}{stats['last_drawn']:>8}"
+              f"{stats['last_skipped']:>10}")
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main(*sys.argv)
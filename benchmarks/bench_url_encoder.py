@@ -0,0 +1,118 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+benchmark of query_compiler.encode_text against the parsing loops the boxes used before it
+
+the old loops are copied here as they were in Boxes.py, they only replaced the spaces and encoded nothing else
+
+the encoder column is the encoding itself, the cached one is encode_text with the text already in its cache
+
+usage :
+
+    python -m benchmarks.bench_url_encoder [--repeat N]
+"""
+
+import argparse
+import random
+import string
+import sys
+import timeit
+
+import query_compiler as qc
+
+
+# +-------------------------+
+# |   old per-box parsing   |
+# +-------------------------+
+def old_normal(text: str) -> str:
+    return text.strip().replace(' ', '+')
+
+
+def old_exact(text: str) -> str:
+    result = '""'
+
+    for i, word in enumerate(text.split(' ')):
+        if i:
+            result += '+'
+        result += word
+
+    return result + '""'
+
+
+def old_avoid(text: str) -> str:
+    result = ''
+
+    for i, word in enumerate(text.split(' ')):
+        if i:
+            result += '-'
+        result += word
+
+    return result
+
+
+# +---------------+
+# |   benchmark   |
+# +---------------+
+def make_text(length: int, non_ascii: bool = False) -> str:
+    """
+    function to make a pasted-like text, words of letters and punctuation separated by spaces
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param length: the number of characters of the text
+    :type: int
+
+    :param non_ascii: add accented letters to the text, optional defaulted to False
+    :type: bool
+
+    :return: the text
+    :type: str
+    """
+    rng = random.Random(length)
+    alphabet = string.ascii_letters * 4 + string.digits + "&#%+?/=" + ("éàçü" if non_ascii else '') + ' ' * 10
+
+    return ''.join(rng.choice(alphabet) for _ in range(length))
+
+
+def main(*argv):
+    parser = argparse.ArgumentParser(prog="bench_url_encoder")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv[1:])
+
+    encode = qc._encode_text  # without the lru_cache, to time the encoding itself
+
+    cases = [
+        ("normal", old_normal, lambda text: encode(text.strip())),
+        ("exact",  old_exact,  lambda text: '""' + encode(text) + '""'),
+        ("avoid",  old_avoid,  lambda text: encode(text, space='-')),
+    ]
+
+    print(f"{'input':<18}{'box':<8}{'old loop (us)':>15}{'encoder (us)':>15}{'cached (us)':>15}")
+
+    for length in (100, 1_000, 10_000, 100_000):
+        for non_ascii in (False, True):
+            text = make_text(length, non_ascii)
+            name = f"{length} {'utf-8' if non_ascii else 'ascii'}"
+
+            for box, old, new in cases:
+                old_time = timeit.timeit(lambda: old(text), number=args.repeat) / args.repeat * 1e6
+                new_time = timeit.timeit(lambda: new(text), number=args.repeat) / args.repeat * 1e6
+
+                qc.encode_text(text)
+                cached_time = timeit.timeit(lambda: qc.encode_text(text), number=args.repeat) / args.repeat * 1e6
+
+                print(f"{name:<18}{box:<8}{old_time:>15.2f}{new_time:>15.2f}{cached_time:>15.2f}")
+
+
+if __name__ == '__main__':
+    main(*sys.argv)
@@ -0,0 +1,199 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+file to open the queries in the web browser without blocking the pygame loop
+
+webbrowser.open can take hundreds of milliseconds while the browser process starts,
+so the urls are given to a background thread through a bounded queue
+
+this module contains :
+
+    - BrowserDispatcher : a class to open urls in the web browser from a background thread
+"""
+
+import collections
+import queue
+import threading
+import time
+import webbrowser
+
+
+class BrowserDispatcher(object):
+    def __init__(self, max_pending: int = 8, duplicate_window: float = 1.0, browser: str = None):
+        """
+        class to open urls in the web browser from a background thread
+
+        the same url asked again within duplicate_window seconds is dropped, as well as the urls asked while
+        max_pending of them are still waiting, and every url is opened with the same webbrowser controller
+
+        Please refer to the documentation of each method for further explanation
+        You can do that with help(BrowserDispatcher.{method_name})
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        Methods:
+
+            .open(url) -> bool
+                ask for an url to be opened, without waiting for it
+
+            .get_stats() -> dict
+                number of opened and dropped urls and the dispatch latencies
+
+            .stop(timeout)
+                stop the background thread
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param max_pending: the number maximum of urls waiting to be opened, optional defaulted to 8
+        :type: int
+        :param duplicate_window: the time in seconds during which the same url is dropped, optional defaulted to 1.0
+        :type: float
+        :param browser: the name of the browser given to webbrowser.get, optional defaulted to None (default browser)
+        :type: str
+        """
+        if max_pending <= 0:
+            raise ValueError("max_pending must be strictly positive")
+        if duplicate_window < 0:
+            raise ValueError("duplicate_window must be positive")
+
+        self.duplicate_window = duplicate_window
+        self.browser = browser
+
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._last_asked = {}  # url -> time it was last asked for
+        self._controller = None
+
+        self._lock = threading.Lock()
+        self.nbr_opened = 0
+        self.nbr_dropped = 0
+        self.nbr_failed = 0
+        self.latencies = collections.deque(maxlen=100)  # in seconds, from open() to the end of webbrowser's open
+
+        self._thread = threading.Thread(target=self._run, name="BrowserDispatcher", daemon=True)
+        self._thread.start()
+
+    def open(self, url: str) -> bool:
+        """
+        method to ask for an url to be opened in a new tab of the web browser
+
+        it returns immediately, the url is opened by the background thread
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param url: the url to open
+        :type: str
+
+        :return: False if the url was dropped (duplicate or too many urls waiting), True otherwise
+        :type: bool
+        """
+        now = time.monotonic()
+
+        last = self._last_asked.get(url)
+        if last is not None and now - last < self.duplicate_window:
+            self._drop()
+            return False
+
+        # forget the urls too old to be duplicates, so that the dictionary doesn't grow forever
+        if len(self._last_asked) > 64:
+            self._last_asked = {key: value for key, value in self._last_asked.items()
+                                if now - value < self.duplicate_window}
+
+        try:
+            self._queue.put_nowait((url, time.perf_counter()))
+        except queue.Full:
+            self._drop()
+            return False
+
+        # only an url queued is a duplicate for the next ones, an url dropped can be asked again at once
+        self._last_asked[url] = now
+
+        return True
+
+    def get_stats(self) -> dict:
+        """
+        method to obtain the statistics of the dispatcher
+
+        the latencies are in seconds, from the call to open() to the end of the opening by webbrowser
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the keys "opened", "dropped", "failed", "pending", "last_latency", "mean_latency" and "max_latency"
+        :type: dict
+        """
+        with self._lock:
+            latencies = list(self.latencies)
+
+            return {
+                "opened":       self.nbr_opened,
+                "dropped":      self.nbr_dropped,
+                "failed":       self.nbr_failed,
+                "pending":      self._queue.qsize(),
+                "last_latency": latencies[-1] if latencies else None,
+                "mean_latency": sum(latencies) / len(latencies) if latencies else None,
+                "max_latency":  max(latencies) if latencies else None,
+            }
+
+    def stop(self, timeout: float = 1.0):
+        """
+        method to stop the background thread, after the urls already waiting are opened
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param timeout: the time in seconds to wait for the thread, optional defaulted to 1.0
+        :type: float
+        """
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+
+        self._thread.join(timeout)
+
+    def _drop(self):
+        """
+        method to count a dropped url
+        method used internally only
+        """
+        with self._lock:
+            self.nbr_dropped += 1
+
+    def _run(self):
+        """
+        loop of the background thread, it opens the urls one by one until stop() is called
+        method used internally only
+        """
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            url, asked_time = item
+
+            try:
+                # the controller is looked for once, webbrowser.open would look for it at every call
+                if self._controller is None:
+                    self._controller = webbrowser.get(self.browser)
+
+                is_opened = self._controller.open(url, new=2)
+
+            # any error (an OSError from a broken browser command for instance) only fails this url,
+            # if it ended the thread every later url would be queued and dropped without being counted
+            except Exception:
+                is_opened = False
+
+            with self._lock:
+                if is_opened:
+                    self.nbr_opened += 1
+                else:
+                    self.nbr_failed += 1
+                self.latencies.append(time.perf_counter() - asked_time)
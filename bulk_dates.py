@@ -0,0 +1,145 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+file to test a lot of dates at once, for the bulk jobs with many before:, after: and range clauses
+
+it follows the same rules as query_compiler.test_and_handle_ymd, but works on whole NumPy arrays instead of one date
+
+this module contains :
+
+    - validate_dates : a function to test and normalise an array of (year, month, day) triples
+"""
+
+import numpy as np
+
+import query_compiler as qc
+
+# the calendar table of query_compiler, as an array indexed by [is_leap_year, month]
+_DAYS_IN_MONTH = np.array(qc.DAYS_IN_MONTH, dtype=np.int64)
+
+
+# +--------------------+
+# |   internal tools   |
+# +--------------------+
+def _to_int(inputs: np.ndarray, length: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    function to convert raw text inputs into integers, the way test_and_handle_ymd reads them :
+    the spaces are removed, only the first length characters are kept and they are tested with query_compiler.is_number
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param inputs: the raw inputs
+    :type: 1D numpy array of str
+    :param length: the number of characters to keep
+    :type: int
+
+    :return: the numbers (0 where the input isn't a number) and the mask of the inputs that are numbers
+    :type: tuple of 2 1D numpy arrays, of int and of bool
+    """
+    # the inputs repeat a lot (there are only so many years, months and days),
+    # so each distinct input is parsed once and the results are spread back with the inverse indices
+    uniques, inverse = np.unique(inputs, return_inverse=True)
+
+    values = np.zeros(len(uniques), dtype=np.int64)
+    is_number = np.zeros(len(uniques), dtype=bool)
+
+    for i, text in enumerate(uniques):
+        text = str(text).replace(' ', '')[:length]
+
+        if qc.is_number(text):
+            values[i] = int(text)
+            is_number[i] = True
+
+    return values[inverse], is_number[inverse]
+
+
+def _format_dates(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    """
+    function to format valid dates as yyyy-mm-dd
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param year: the years, between 0 and 9999
+    :type: 1D numpy array of int
+    :param month: the months, between 0 and 12
+    :type: 1D numpy array of int
+    :param day: the days, between 0 and 31
+    :type: 1D numpy array of int
+
+    :return: the dates
+    :type: 1D numpy array of str
+    """
+    # same trick as _to_int, each distinct date is formatted once
+    uniques, inverse = np.unique(year * 10000 + month * 100 + day, return_inverse=True)
+
+    texts = np.array(
+        [f"{key // 10000:04d}-{key // 100 % 100:02d}-{key % 100:02d}" for key in uniques.tolist()],
+        dtype="U10"
+    )
+
+    return texts[inverse]
+
+
+# +-------------------------+
+# |   validation function   |
+# +-------------------------+
+def validate_dates(triples) -> tuple[np.ndarray, np.ndarray]:
+    """
+    function to test a collection of (year, month, day) triples, like test_and_handle_ymd does for one date
+
+    the triples can be the raw text inputs of the boxes, integers, or floats holding whole numbers
+    (a triple with a float that isn't a whole number is invalid) :
+        - the year must be a number
+        - a month or a day which isn't a number is replaced by 0 (unknown)
+        - the month must be between 0 and 12, and the day between 0 and the number of days of the month
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param triples: the dates to test
+    :type: array-like of shape (N, 3), of str, int or float
+
+    :return: the dates as yyyy-mm-dd ('' for the invalid ones) and the mask of the invalid dates
+    :type: tuple of 2 numpy arrays of shape (N,), of str and of bool
+    """
+    triples = np.asarray(triples)
+
+    if triples.ndim != 2 or triples.shape[1] != 3:
+        raise ValueError("triples must be of shape (N, 3)")
+
+    if triples.dtype.kind in "iu":
+        year, month, day = triples.astype(np.int64).T
+        error = (year < 0) | (year > 9999) | (month < 0) | (day < 0)
+
+    elif triples.dtype.kind == 'f':
+        # the floats aren't read as texts : 2.0 would be '2.0', so they must be whole numbers, cast to int
+        is_whole = np.isfinite(triples) & (triples == np.floor(triples))
+        # clipped before the cast so that the huge floats don't overflow, they are still out of range after it
+        year, month, day = np.where(is_whole, np.clip(triples, -1, 10000), 0).astype(np.int64).T
+        error = ~is_whole.all(axis=1) | (year < 0) | (year > 9999) | (month < 0) | (day < 0)
+
+    else:
+        year, is_year = _to_int(triples[:, 0], 4)
+        month, _ = _to_int(triples[:, 1], 2)
+        day, _ = _to_int(triples[:, 2], 2)
+        error = ~is_year
+
+    error |= month > 12
+
+    is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    max_day = _DAYS_IN_MONTH[is_leap.astype(np.intp), np.clip(month, 0, 12)]
+    error |= day > max_day
+
+    dates = np.full(len(triples), '', dtype="U10")
+    dates[~error] = _format_dates(year[~error], month[~error], day[~error])
+
+    return dates, error
@@ -0,0 +1,254 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+file to present on the display only the parts of the screen that changed during the frame
+
+the changes of a frame are local (a box created or deleted, a text input being typed in, a button hovered),
+so instead of pygame.display.flip, the rectangles drawn during the frame are collected
+and given to pygame.display.update
+
+this module contains :
+
+    - DamageTracker : a class to collect the rectangles drawn during a frame and present them
+
+    - is_hovered : a function to know if a widget isn't drawn normally because of the mouse
+"""
+
+import pygame
+
+# the events after which the widgets under the mouse can look differently
+_MOUSE_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+# the events after which the window must be presented entirely, what it showed may be lost
+_EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN)
+
+
+def is_hovered(widget) -> bool:
+    """
+    function to know if a widget isn't drawn normally, because the mouse is or was over it (a button for instance)
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param widget: the widget
+    :type: pygame_widgets.widget.WidgetBase
+
+    :return: True if the widget is hovered or pressed, or if it will be drawn back to normal, False otherwise
+    :type: bool
+    """
+    if getattr(widget, "mouseWasInside", False):
+        return True
+
+    return hasattr(widget, "inactiveColour") and widget.colour != widget.inactiveColour
+
+
+class DamageTracker(object):
+    def __init__(self, screen: pygame.Surface, max_rects: int = 32):
+        """
+        class to collect the rectangles of the screen drawn during a frame, and present only them on the display
+
+        the first frame is presented entirely
+
+        Please refer to the documentation of each method for further explanation
+        You can do that with help(DamageTracker.{method_name})
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        Methods:
+
+            .add(rect) -> rect
+                mark a rectangle of the screen as changed
+
+            .add_all()
+                mark the whole screen as changed
+
+            .add_widgets(lst_event, widgets)
+                mark the widgets that change with the events of the frame
+
+            .present()
+                update the display with the changed rectangles
+
+            .get_stats() -> dict
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param screen: the surface of the display
+        :type: pygame.Surface
+
+        :param max_rects: past this number of rectangles in a frame, the whole screen is presented,
+                          optional defaulted to 32
+        :type: int
+        """
+        if max_rects <= 0:
+            raise ValueError("max_rects must be strictly positive")
+
+        self.screen_rect = screen.get_rect()
+        self.max_rects = max_rects
+
+        self._rects = []
+        self._is_all = True
+
+        self.nbr_full_updates = 0
+        self.nbr_partial_updates = 0
+        self.last_area = 0  # in pixels, presented by the last update
+        self.nbr_added = 0  # rectangles added during this frame, even when the whole screen is presented
+        self.last_nbr_added = 0
+
+        # the widgets marked by the mouse or their selection during the last frame, they are marked again once,
+        # for the frame they are drawn back to normal
+        self._last_widgets = set()
+
+    def add(self, rect: [pygame.Rect, tuple]) -> [pygame.Rect, tuple]:
+        """
+        method to mark a rectangle of the screen as changed during this frame
+
+        it returns its parameter, so that it can wrap the drawing functions :
+            damage.add(pygame.draw.rect(screen, color, rect))
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param rect: the rectangle, the parts outside the screen are ignored
+        :type: pygame.Rect or tuple of 4 int
+
+        :return: rect
+        :type: pygame.Rect or tuple of 4 int
+        """
+        self.nbr_added += 1
+
+        if self._is_all:
+            return rect
+
+        clipped = self.screen_rect.clip(rect)
+        if clipped.width and clipped.height:
+            self._rects.append(clipped)
+
+            if len(self._rects) > self.max_rects:
+                self.add_all()
+
+        return rect
+
+    def add_all(self):
+        """
+        method to mark the whole screen as changed during this frame
+        """
+        self._is_all = True
+        self._rects = []
+
+    def add_widgets(self, lst_event: list, widgets: list):
+        """
+        method to mark the widgets of pygame_widgets that change with the events of this frame, to call before
+        pygame_widgets.update
+
+        they are :
+            - the widgets under the mouse, where it was and where it is, when it moves or clicks
+            - the selected text inputs, for their cursor and what is typed in them
+            - the widgets still hovered or pressed, they go back to normal one or two frames after the mouse left them,
+              without any event, and the ones marked by the two previous reasons during the last frame
+
+        the whole screen is marked after the window was uncovered or restored, as what it showed may be lost
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param lst_event: the pygame events of the frame
+        :type: list
+        :param widgets: the widgets, pygame_widgets.WidgetHandler.getWidgets() for instance
+        :type: list
+        """
+        if any(event.type in _EXPOSE_EVENTS for event in lst_event):
+            self.add_all()
+
+        last_widgets, self._last_widgets = self._last_widgets, set()
+
+        if self._is_all:
+            return
+
+        points = []
+        for event in lst_event:
+            if event.type in _MOUSE_EVENTS:
+                points.append(event.pos)
+
+                if event.type == pygame.MOUSEMOTION:
+                    points.append((event.pos[0] - event.rel[0], event.pos[1] - event.rel[1]))
+
+        for widget in widgets:
+            if not widget.isVisible():
+                continue
+
+            if getattr(widget, "selected", None) is True or any(widget.contains(*point) for point in points):
+                self._last_widgets.add(widget)
+                self.add(self._get_widget_rect(widget))
+
+            elif widget in last_widgets or is_hovered(widget):
+                self.add(self._get_widget_rect(widget))
+
+    def present(self):
+        """
+        method to update the display with the rectangles changed during this frame, instead of pygame.display.flip
+        """
+        if self._is_all:
+            pygame.display.flip()
+
+            self.nbr_full_updates += 1
+            self.last_area = self.screen_rect.width * self.screen_rect.height
+
+        elif self._rects:
+            pygame.display.update(self._rects)
+
+            self.nbr_partial_updates += 1
+            self.last_area = sum(rect.width * rect.height for rect in self._rects)
+
+        else:
+            self.last_area = 0
+
+        self._rects = []
+        self._is_all = False
+
+        self.last_nbr_added, self.nbr_added = self.nbr_added, 0
+
+    def get_stats(self) -> dict:
+        """
+        method to obtain the statistics of the updates of the display
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the keys "full_updates", "partial_updates", "pending_rects", "last_area" (in pixels)
+                 and "last_added" (the rectangles added during the last frame)
+        :type: dict
+        """
+        return {
+            "full_updates":    self.nbr_full_updates,
+            "partial_updates": self.nbr_partial_updates,
+            "pending_rects":   len(self._rects),
+            "last_area":       self.last_area,
+            "last_added":      self.last_nbr_added,
+        }
+
+    @staticmethod
+    def _get_widget_rect(widget) -> pygame.Rect:
+        """
+        method to obtain the rectangle where a widget draws itself
+        method used internally only
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param widget: the widget
+        :type: pygame_widgets.widget.WidgetBase
+
+        :return: the rectangle
+        :type: pygame.Rect
+        """
+        rect = pygame.Rect(widget.getX(), widget.getY(), widget.getWidth(), widget.getHeight())
+
+        # a dropdown draws its choices under itself, even when they are closing
+        for choice in getattr(widget, "_Dropdown__choices", ()):
+            rect.union_ip(pygame.Rect(choice.getX(), choice.getY(), choice.getWidth(), choice.getHeight()))
+
+        return rect.inflate(2, 2)
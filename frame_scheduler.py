@@ -0,0 +1,213 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+file to pace the frames of the pygame loop
+
+the loop used to poll the events and flip the display as fast as it could, keeping a core busy even when nothing
+happened : the frames are now capped with a pygame.time.Clock, and when nothing on the screen is animating
+the loop sleeps in pygame.event.wait until an event comes, or until a timeout to still redraw from time to time
+
+this module contains :
+
+    - FrameScheduler : a class to get the events of a frame and wait for the next one
+
+    - percentile : a function to obtain a percentile of sorted times
+"""
+
+import collections
+import time
+
+import pygame
+
+
+def percentile(sorted_times: list, percent: float) -> float:
+    """
+    function to obtain a percentile of sorted times, interpolated between the two closest times
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param sorted_times: the times, sorted, at least one
+    :type: list of float
+    :param percent: the percentile, from 0 to 100
+    :type: float
+
+    :return: the percentile
+    :type: float
+    """
+    if not 0 <= percent <= 100:
+        raise ValueError("the percents must range from 0 to 100")
+
+    position = (len(sorted_times) - 1) * percent / 100
+    low = int(position)
+    high = min(low + 1, len(sorted_times) - 1)
+
+    return sorted_times[low] + (sorted_times[high] - sorted_times[low]) * (position - low)
+
+
+class FrameScheduler(object):
+    def __init__(self, max_fps: int = 60, idle_timeout: float = 1.0, nbr_frames_kept: int = 120):
+        """
+        class to pace the frames of the pygame loop, used as :
+
+            while running:
+                lst_event = scheduler.get_events(is_animating)
+                ... (update and draw the frame)
+                scheduler.tick()
+
+        Please refer to the documentation of each method for further explanation
+        You can do that with help(FrameScheduler.{method_name})
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        Methods:
+
+            .get_events(is_animating) -> list of events
+                wait for the events if nothing is animating, and get them
+
+            .tick() -> elapsed_time
+                end the frame, waiting to not go over max_fps
+
+            .get_stats() -> dict
+                the statistics of the last frames
+
+            .get_percentiles(percents) -> dict
+                the percentiles of the times of the last frames
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param max_fps: the number maximum of frames per second, 0 for no cap, optional defaulted to 60
+        :type: int
+        :param idle_timeout: the time in seconds after which an idle frame is drawn without event,
+                             0 to never wait for the events, optional defaulted to 1.0
+        :type: float
+        :param nbr_frames_kept: the number of frames the statistics are computed on, optional defaulted to 120
+        :type: int
+        """
+        if max_fps < 0:
+            raise ValueError("max_fps must be positive")
+        if idle_timeout < 0:
+            raise ValueError("idle_timeout must be positive")
+        if nbr_frames_kept <= 0:
+            raise ValueError("nbr_frames_kept must be strictly positive")
+
+        self.max_fps = max_fps
+        self.idle_timeout = idle_timeout
+
+        self.clock = pygame.time.Clock()
+
+        self.elapsed_time = 0.0  # in seconds, between the start of the two last frames
+        self.nbr_frames = 0
+        self.nbr_idle_frames = 0  # frames that waited for the events
+
+        self._frame_start = time.perf_counter()
+        self.frame_times = collections.deque(maxlen=nbr_frames_kept)  # in seconds, between two frames
+        self.work_times = collections.deque(maxlen=nbr_frames_kept)  # in seconds, used by the frame itself
+
+    def get_events(self, is_animating: bool = False) -> list:
+        """
+        method to get the events of the frame, to call at the start of the frame
+
+        if nothing is animating, it sleeps until an event comes or idle_timeout seconds passed
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param is_animating: is something on the screen changing without events (a blinking cursor for instance),
+                             optional defaulted to False
+        :type: bool
+
+        :return: the pygame events
+        :type: list of pygame.event.Event
+        """
+        if not is_animating and self.idle_timeout > 0:
+            self.nbr_idle_frames += 1
+
+            event = pygame.event.wait(int(self.idle_timeout * 1000))
+            lst_event = [] if event.type == pygame.NOEVENT else [event]
+            lst_event.extend(pygame.event.get())
+
+        else:
+            lst_event = pygame.event.get()
+
+        # the time waiting for the events isn't time used by the frame
+        self._frame_start = time.perf_counter()
+
+        return lst_event
+
+    def tick(self) -> float:
+        """
+        method to end the frame, to call at the end of the frame
+
+        it waits as much as needed to not go over max_fps frames per second
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the time in seconds between the start of this frame and the start of the previous one
+        :type: float
+        """
+        self.work_times.append(time.perf_counter() - self._frame_start)
+
+        self.elapsed_time = self.clock.tick(self.max_fps) / 1000
+        self.frame_times.append(self.elapsed_time)
+        self.nbr_frames += 1
+
+        return self.elapsed_time
+
+    def get_stats(self) -> dict:
+        """
+        method to obtain the statistics of the last frames (at most nbr_frames_kept)
+
+        the work time of a frame is the time it used itself, without waiting for the events or for max_fps
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the keys "frames", "idle_frames", "fps", "last_frame_time", "last_work_time",
+                 "mean_work_time" and "max_work_time" (in seconds)
+        :type: dict
+        """
+        work_times = self.work_times
+
+        return {
+            "frames":          self.nbr_frames,
+            "idle_frames":     self.nbr_idle_frames,
+            "fps":             self.clock.get_fps(),
+            "last_frame_time": self.frame_times[-1] if self.frame_times else None,
+            "last_work_time":  work_times[-1] if work_times else None,
+            "mean_work_time":  sum(work_times) / len(work_times) if work_times else None,
+            "max_work_time":   max(work_times) if work_times else None,
+        }
+
+    def get_percentiles(self, percents: [list, tuple] = (50, 95, 99)) -> dict:
+        """
+        method to obtain percentiles of the frame times and of the work times of the last frames
+        (at most nbr_frames_kept), interpolated between the two closest times
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param percents: the percentiles, from 0 to 100, optional defaulted to (50, 95, 99)
+        :type: list or tuple of float
+
+        :return: the keys "frame_p{percent}" and "work_p{percent}" for each percent (in seconds, None without frame)
+        :type: dict
+        """
+        percentiles = {}
+
+        for name, times in (("frame", self.frame_times), ("work", self.work_times)):
+            times = sorted(times)
+
+            for percent in percents:
+                if not 0 <= percent <= 100:
+                    raise ValueError("the percents must range from 0 to 100")
+
+                percentiles[f"{name}_p{percent}"] = percentile(times, percent) if times else None
+
+        return percentiles
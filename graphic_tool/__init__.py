@@ -18,6 +18,8 @@ see on gitHub :
 
     - square_tyle : a submodules to handle definition and manipulation of 2D square tyles
 
+    - background : a submodules to save the background of a surface and to restore it
+
 ------------------------------------------------------------------------------------------------------------------------
 
     - matrix : a subpackage to handle matrices definitions, operations and manipulations
@@ -43,4 +45,4 @@ with this way, you only import with the tools you need and you have them in a si
 
 __author__ = "Gely Lea"
 
-__all__ = ["vector", "matrix", "triangles", "square_tile.py", "colors", "border"]
+__all__ = ["vector", "matrix", "triangles", "square_tile.py", "colors", "border", "background"]
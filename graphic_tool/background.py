@@ -0,0 +1,137 @@
+"""
+submodule du package graphic_tool made to save the background of a surface and to restore it
+
+@author: Zaynn-Lea
+
+see on gitHub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+------------------------------------------------------------------------------------------------------------------------
+
+erasing something by drawing over it in the color of the background is only right on a background of one color,
+and a big rectangle costs as much as the pixels it covers : the pixels under a region are saved once,
+and erasing anything in it is one blit of them
+
+this module contains :
+
+    - BackgroundLayer : a class to save regions of a surface and to restore them, or any part of them
+"""
+
+import pygame
+
+
+# +----------------------+
+# |   BackgroundLayer    |
+# +----------------------+
+class BackgroundLayer(object):
+    def __init__(self, surface: pygame.Surface):
+        """
+        This class is to save the pixels of regions of a surface before drawing on them,
+        and to restore them, or any part of them, with one blit
+
+        the regions are saved in the order they are given, a later region is restored over an earlier one
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        Methods:
+
+            .save(rect) -> rect
+                save the pixels under a rectangle
+
+            .restore(rect) -> rect
+                restore the saved pixels under a rectangle
+
+            .forget(rect)
+                forget the saved regions touching a rectangle
+
+            .get_stats() -> dict
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param surface: the surface, the screen for instance
+        :type: a pygame.Surface object
+        """
+        self.surface = surface
+
+        self._regions = []  # list of (rect, copy of the pixels under it)
+
+        self.nbr_restores = 0
+        self.restored_area = 0  # in pixels
+
+    def save(self, rect: [pygame.Rect, tuple] = None) -> pygame.Rect:
+        """
+        method to save the pixels under a rectangle of the surface, as they are now
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param rect: the rectangle, the parts outside the surface are ignored,
+                     optional defaulted to None (the whole surface)
+        :type: pygame.Rect or tuple of 4 int
+
+        :return: the rectangle saved
+        :type: pygame.Rect
+        """
+        rect = self.surface.get_rect() if rect is None else self.surface.get_rect().clip(rect)
+
+        if rect.width and rect.height:
+            self._regions.append((rect, self.surface.subsurface(rect).copy()))
+
+        return rect
+
+    def restore(self, rect: [pygame.Rect, tuple]) -> pygame.Rect:
+        """
+        method to restore the saved pixels under a rectangle of the surface, the parts of the rectangle that weren't
+        saved are left as they are
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param rect: the rectangle
+        :type: pygame.Rect or tuple of 4 int
+
+        :return: the rectangle, to give it to a damage tracker for instance
+        :type: pygame.Rect
+        """
+        rect = pygame.Rect(rect)
+
+        for region_rect, pixels in self._regions:
+            clipped = region_rect.clip(rect)
+            if not (clipped.width and clipped.height):
+                continue
+
+            self.surface.blit(pixels, clipped.topleft, clipped.move(-region_rect.x, -region_rect.y))
+
+            self.nbr_restores += 1
+            self.restored_area += clipped.width * clipped.height
+
+        return rect
+
+    def forget(self, rect: [pygame.Rect, tuple] = None):
+        """
+        method to forget the saved regions touching a rectangle
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param rect: the rectangle, optional defaulted to None (every region)
+        :type: pygame.Rect or tuple of 4 int
+        """
+        if rect is None:
+            self._regions = []
+        else:
+            self._regions = [region for region in self._regions if not region[0].colliderect(rect)]
+
+    def get_stats(self) -> dict:
+        """
+        method to obtain the statistics of the layer
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the keys "regions", "saved_area", "restores" and "restored_area" (in pixels)
+        :type: dict
+        """
+        return {
+            "regions":       len(self._regions),
+            "saved_area":    sum(rect.width * rect.height for rect, _ in self._regions),
+            "restores":      self.nbr_restores,
+            "restored_area": self.restored_area,
+        }
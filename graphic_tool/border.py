@@ -13,10 +13,25 @@ see on gitHub :
 this module contains :
 
     - Border : a class to have a border with the option of rounded corner with other options than pygame.draw.rect
+
+    - BorderGroup : a class to draw many borders together, the identical ones in one call
+
+    - clear_cache : a function to forget the rasterized borders and the masks
+
+    - get_cache_stats : a function to obtain the number of rasterized borders and of masks kept
+
+    - MAX_CACHED_SURFACES, MAX_CACHED_MASKS : the number maximum of rasterized borders and of masks kept
 """
 
+import collections
+
 import pygame
 
+try:
+    import numpy as np  # for Border.are_in, optional
+except ImportError:
+    np = None
+
 from . import _error_handling as err
 from . import colors
 from . import functions
@@ -27,6 +42,15 @@ _PI = 3.141592653
 _PI_3_ON_2 = 4.712388979
 _PI_2 = 6.283185306
 
+# the borders rasterized by Border.draw, by (x_2 - x_1, y_2 - y_1, border_radius, border_width, color)
+_surfaces = collections.OrderedDict()
+# the insides of the borders, by (x_2 - x_1, y_2 - y_1, border_radius), see Border.get_mask
+_masks = collections.OrderedDict()
+
+# the number maximum of rasterized borders and of masks kept, the least recently used ones are forgotten past it
+MAX_CACHED_SURFACES = 256
+MAX_CACHED_MASKS = 64
+
 
 # +-------------------+
 # |   internal tool   |
@@ -85,6 +109,68 @@ def _collection_to_abs(col: [list, tuple]) -> [list, tuple]:
     return new_col
 
 
+def _cache_get(cache: collections.OrderedDict, key):
+    """
+    function to obtain a value of a LRU cache, and to mark it as the most recently used
+    function used internally only
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param cache: the cache, _surfaces or _masks
+    :type: collections.OrderedDict
+    :param key: the key of the value
+    :type: tuple
+
+    :return: the value, None if it isn't in the cache
+    """
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+
+    return value
+
+
+def _cache_put(cache: collections.OrderedDict, key, value, max_size: int):
+    """
+    function to add a value to a LRU cache, the least recently used value is forgotten past max_size values
+    function used internally only
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param cache: the cache, _surfaces or _masks
+    :type: collections.OrderedDict
+    :param key: the key of the value
+    :type: tuple
+    :param value: the value
+    :param max_size: the number maximum of values
+    :type: int
+    """
+    cache[key] = value
+
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+
+
+def clear_cache():
+    """
+    function to forget the rasterized borders and the masks shared by the Border objects, to free their memory
+    """
+    _surfaces.clear()
+    _masks.clear()
+
+
+def get_cache_stats() -> dict:
+    """
+    function to obtain the number of rasterized borders and of masks kept
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :return: the keys "surfaces" and "masks"
+    :type: dict
+    """
+    return {"surfaces": len(_surfaces), "masks": len(_masks)}
+
+
 # +---------------------+
 # |   Borders classes   |
 # +---------------------+
@@ -112,15 +198,35 @@ class Border(object):
 
         Methods:
 
-            .draw(surface)
+            .draw(surface) -> rect
                 draw the border
 
+            .get_rect() -> rect
+                the rectangle the border draws in
+
+            .move(dx, dy)
+                move the border without drawing it
+
             .is_in(coord) -> bool
 
-            .is_in(coord) -> bool, list
+            .are_in(coord) -> numpy array of bool
+                test many points at once
+
+            .get_mask() -> pygame.mask.Mask
+                the inside of the border, computed once
+
+            .get_bitmap() -> numpy array of bool
+                the inside of the border, computed once
 
-            .erase(surface, background_color)
-                redraw the border in background_color
+            .is_in_mask(coord) -> bool
+                is_in, with a lookup in the mask
+
+            .overlaps(other) -> bool
+
+            .overlap_area(other) -> int
+
+            .erase(surface, background_color) -> rect
+                restore the pixels under the border, or redraw it in background_color
 
         ----------------------------------------------------------------------------------------------------------------
 
@@ -146,9 +252,9 @@ class Border(object):
         # coord_down_right :
 
         if err.test_class(coord_down_right, vector.Vector2D):
-            self.x_2, self.y_2 = self.coord_up_left = _collection_to_int(coord_down_right.get_tuple())
+            self.x_2, self.y_2 = self.coord_down_right = _collection_to_int(coord_down_right.get_tuple())
         else:
-            self.x_2, self.y_2 = self.coord_up_left = coord_down_right[:]
+            self.x_2, self.y_2 = self.coord_down_right = coord_down_right[:]
 
         # sizes :
 
@@ -199,110 +305,257 @@ class Border(object):
 
         self.border_width = border_width
 
-    def draw(self, surface: pygame.Surface):
+        # (surface, rect, position, pixels) under the border the last time it was drawn, see erase
+        self._background = None
+
+    def get_rect(self) -> pygame.Rect:
+        """
+        method to obtain the rectangle in which the border is drawn, including its width and its corners
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the rectangle
+        :type: pygame.Rect
+        """
+        margin = self.border_width
+
+        # the inverted corners are drawn outside of the border
+        if min(self.border_radius) < 0:
+            margin += max(self.border_radius_dist)
+
+        return pygame.Rect(min(self.x_1, self.x_2) - margin, min(self.y_1, self.y_2) - margin,
+                           self.width + 2 * margin + 1, self.height + 2 * margin + 1)
+
+    def move(self, dx: int, dy: int):
+        """
+        method to move the border, it isn't drawn nor erased
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param dx: the movement on the x axis
+        :type: int
+        :param dy: the movement on the y axis
+        :type: int
+        """
+        self.x_1 += dx
+        self.y_1 += dy
+        self.x_2 += dx
+        self.y_2 += dy
+
+        self.coord_up_left = self.x_1, self.y_1
+        self.coord_down_right = self.x_2, self.y_2
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
         """
         method to draw the border on a surface
 
+        the border is rasterized once on a transparent surface, shared by the identical borders (same size, radius,
+        width and color), and drawing it is one blit of it
+
+        the pixels under the border are saved the first time it is drawn at a place, erase restores them
+
         ----------------------------------------------------------------------------------------------------------------
 
         :param surface: the surface to draw on
         :type: a pygame.Surface object
+
+        :return: the rectangle in which the border is drawn (see get_rect)
+        :type: pygame.Rect
+        """
+        rect = self.get_rect()
+
+        if self._background is None or self._background[0] is not surface or self._background[1] != rect:
+            clipped = surface.get_rect().clip(rect)
+            self._background = surface, rect, clipped.topleft, surface.subsurface(clipped).copy()
+
+        surface.blit(self._get_surface(), rect.topleft)
+
+        return rect
+
+    def _get_surface(self, color: tuple[int, int, int] = None) -> pygame.Surface:
+        """
+        method to obtain the border rasterized on a transparent surface the size of get_rect, from the cache
+        method used internally only
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param color: the color of the border, optional defaulted to None (the color of the border)
+        :type: tuple of 3 int
+
+        :return: the rasterized border, shared with the identical borders, it must not be drawn on
+        :type: a pygame.Surface object
+        """
+        if color is None:
+            color = self.color
+
+        key = self._get_surface_key(color)
+
+        border_surface = _cache_get(_surfaces, key)
+        if border_surface is None:
+            rect = self.get_rect()
+
+            border_surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+            self._draw_shapes(border_surface, -rect.x, -rect.y, color)
+
+            if pygame.display.get_surface() is not None:
+                border_surface = border_surface.convert_alpha()
+            # a border is mostly transparent, run-length encoding skips the transparent pixels when it is blitted
+            border_surface.set_alpha(255, pygame.RLEACCEL)
+
+            _cache_put(_surfaces, key, border_surface, MAX_CACHED_SURFACES)
+
+        return border_surface
+
+    def _get_surface_key(self, color: tuple[int, int, int] = None) -> tuple:
+        """
+        method to obtain the key of the rasterized border in the cache, the same for the identical borders
+        method used internally only
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param color: the color of the border, optional defaulted to None (the color of the border)
+        :type: tuple of 3 int
+
+        :return: the key, (x_2 - x_1, y_2 - y_1, border_radius, border_width, color)
+        :type: tuple
+        """
+        if color is None:
+            color = self.color
+
+        return self.x_2 - self.x_1, self.y_2 - self.y_1, tuple(self.border_radius), self.border_width, tuple(color)
+
+    def _draw_shapes(self, surface: pygame.Surface, dx: int, dy: int, color: tuple[int, int, int]):
+        """
+        method to draw the lines and the arcs of the border on a surface, moved by (dx, dy)
+        method used internally only
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param surface: the surface to draw on
+        :type: a pygame.Surface object
+        :param dx: the movement on the x axis
+        :type: int
+        :param dy: the movement on the y axis
+        :type: int
+        :param color: the color of the lines and the arcs
+        :type: tuple of 3 int
         """
+        x_1, y_1 = self.x_1 + dx, self.y_1 + dy
+        x_2, y_2 = self.x_2 + dx, self.y_2 + dy
+
         # top border :
-        pygame.draw.line(surface, self.color,
-                         (self.x_1 + self.border_radius_dist[0], self.y_1),
-                         (self.x_2 - self.border_radius_dist[1], self.y_1), self.border_width)
+        pygame.draw.line(surface, color,
+                         (x_1 + self.border_radius_dist[0], y_1),
+                         (x_2 - self.border_radius_dist[1], y_1), self.border_width)
 
         # bottom border :
-        pygame.draw.line(surface, self.color,
-                         (self.x_1 + self.border_radius_dist[2], self.y_2),
-                         (self.x_2 - self.border_radius_dist[3], self.y_2), self.border_width)
+        pygame.draw.line(surface, color,
+                         (x_1 + self.border_radius_dist[2], y_2),
+                         (x_2 - self.border_radius_dist[3], y_2), self.border_width)
 
         # left border :
-        pygame.draw.line(surface, self.color,
-                         (self.x_1, self.y_1 + self.border_radius_dist[0]),
-                         (self.x_1, self.y_2 - self.border_radius_dist[2]), self.border_width)
+        pygame.draw.line(surface, color,
+                         (x_1, y_1 + self.border_radius_dist[0]),
+                         (x_1, y_2 - self.border_radius_dist[2]), self.border_width)
 
         # right border :
-        pygame.draw.line(surface, self.color,
-                         (self.x_2, self.y_1 + self.border_radius_dist[1]),
-                         (self.x_2, self.y_2 - self.border_radius_dist[3]), self.border_width)
+        pygame.draw.line(surface, color,
+                         (x_2, y_1 + self.border_radius_dist[1]),
+                         (x_2, y_2 - self.border_radius_dist[3]), self.border_width)
 
         # top right corner :
         if self.border_radius[0] > 0:
             t_r_rect = pygame.Rect(
-                self.x_1,
-                self.y_1,
+                x_1,
+                y_1,
                 self.border_radius_dist[0] * 2,
                 self.border_radius_dist[0] * 2
             )
-            pygame.draw.arc(surface, self.color, t_r_rect, _PI_ON_2, _PI, self.border_width)
+            pygame.draw.arc(surface, color, t_r_rect, _PI_ON_2, _PI, self.border_width)
 
         elif self.border_radius[0] < 0:
             t_r_rect = pygame.Rect(
-                self.x_1 - self.border_radius_dist[0],
-                self.y_1 - self.border_radius_dist[0],
+                x_1 - self.border_radius_dist[0],
+                y_1 - self.border_radius_dist[0],
                 self.border_radius_dist[0] * 2,
                 self.border_radius_dist[0] * 2
             )
-            pygame.draw.arc(surface, self.color, t_r_rect, _PI_3_ON_2, 0, self.border_width)
+            pygame.draw.arc(surface, color, t_r_rect, _PI_3_ON_2, 0, self.border_width)
 
         # top left corner :
         if self.border_radius[1] > 0:
             t_r_rect = pygame.Rect(
-                self.x_2 - (self.border_radius_dist[1] * 2),
-                self.y_1,
+                x_2 - (self.border_radius_dist[1] * 2),
+                y_1,
                 self.border_radius_dist[1] * 2,
                 self.border_radius_dist[1] * 2
             )
-            pygame.draw.arc(surface, self.color, t_r_rect, 0, _PI_ON_2, self.border_width)
+            pygame.draw.arc(surface, color, t_r_rect, 0, _PI_ON_2, self.border_width)
 
         elif self.border_radius[1] < 0:
             t_r_rect = pygame.Rect(
-                self.x_2 - self.border_radius_dist[1],
-                self.y_1 - self.border_radius_dist[1],
+                x_2 - self.border_radius_dist[1],
+                y_1 - self.border_radius_dist[1],
                 self.border_radius_dist[1] * 2,
                 self.border_radius_dist[1] * 2
             )
-            pygame.draw.arc(surface, self.color, t_r_rect, _PI, _PI_3_ON_2, self.border_width)
+            pygame.draw.arc(surface, color, t_r_rect, _PI, _PI_3_ON_2, self.border_width)
 
         # bottom right corner :
         if self.border_radius[2] > 0:
             t_r_rect = pygame.Rect(
-                self.x_1,
-                self.y_2 - (self.border_radius_dist[2] * 2),
+                x_1,
+                y_2 - (self.border_radius_dist[2] * 2),
                 self.border_radius_dist[2] * 2,
                 self.border_radius_dist[2] * 2
             )
-            pygame.draw.arc(surface, self.color, t_r_rect, _PI, _PI_3_ON_2, self.border_width)
+            pygame.draw.arc(surface, color, t_r_rect, _PI, _PI_3_ON_2, self.border_width)
 
         elif self.border_radius[0] < 0:
             t_r_rect = pygame.Rect(
-                self.x_1 - self.border_radius_dist[2],
-                self.y_2 - self.border_radius_dist[2],
+                x_1 - self.border_radius_dist[2],
+                y_2 - self.border_radius_dist[2],
                 self.border_radius_dist[2] * 2,
                 self.border_radius_dist[2] * 2
             )
-            pygame.draw.arc(surface, self.color, t_r_rect, 0, _PI_ON_2, self.border_width)
+            pygame.draw.arc(surface, color, t_r_rect, 0, _PI_ON_2, self.border_width)
 
         # bottom left corner :
         if self.border_radius[3] > 0:
             t_r_rect = pygame.Rect(
-                self.x_2 - (self.border_radius_dist[3] * 2),
-                self.y_2 - (self.border_radius_dist[3] * 2),
+                x_2 - (self.border_radius_dist[3] * 2),
+                y_2 - (self.border_radius_dist[3] * 2),
                 self.border_radius_dist[3] * 2,
                 self.border_radius_dist[3] * 2
             )
-            pygame.draw.arc(surface, self.color, t_r_rect, _PI_3_ON_2, 0, self.border_width)
+            pygame.draw.arc(surface, color, t_r_rect, _PI_3_ON_2, 0, self.border_width)
 
         elif self.border_radius[3] < 0:
             t_r_rect = pygame.Rect(
-                self.x_2 - self.border_radius_dist[3],
-                self.y_2 - self.border_radius_dist[3],
+                x_2 - self.border_radius_dist[3],
+                y_2 - self.border_radius_dist[3],
                 self.border_radius_dist[3] * 2,
                 self.border_radius_dist[3] * 2
             )
-            pygame.draw.arc(surface, self.color, t_r_rect, _PI_ON_2, _PI, self.border_width)
+            pygame.draw.arc(surface, color, t_r_rect, _PI_ON_2, _PI, self.border_width)
+
+    def _get_corners(self) -> list[tuple[int, int, int, int, int]]:
+        """
+        method to obtain the corners of the border, to test the points in them
+        method used internally only
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: for each corner from 0 to 3 : its x and y, the directions (1 or -1) from it to the inside of the border
+                 on the x and the y axis, and its border_radius
+        :type: list of tuple of 5 int
+        """
+        return [
+            (self.x_1, self.y_1,  1,  1, self.border_radius[0]),
+            (self.x_2, self.y_1, -1,  1, self.border_radius[1]),
+            (self.x_1, self.y_2,  1, -1, self.border_radius[2]),
+            (self.x_2, self.y_2, -1, -1, self.border_radius[3]),
+        ]
 
     def is_in(self, coord: [tuple[int, int], list[int, int], vector.Vector2D]) -> bool:
         """
@@ -312,6 +565,9 @@ class Border(object):
 
             test if it's in the rectangle and if yes, we test if it's inside or outsides of the circled corner
 
+        a rounded corner (border_radius > 0) is a quarter of the circle centered at border_radius of the corner,
+        an inverted corner (border_radius < 0) takes out the quarter of the circle centered on the corner
+
         ----------------------------------------------------------------------------------------------------------------
 
         :param coord: a point in space
@@ -323,97 +579,235 @@ class Border(object):
         x = coord[0]
         y = coord[1]
 
-        if self.x_1 < x < self.x_2 and self.y_1 < y < self.y_2:
+        if not (self.x_1 < x < self.x_2 and self.y_1 < y < self.y_2):
+            return False
 
-            # test for the corners :
-            # top right :
-            if self.x_1 < x < self.x_1 + self.border_radius_dist[0]\
-                    and self.y_1 < y < self.y_1 + self.border_radius_dist[0]:
-                if self.border_radius[0] > 0:
-                    return x * x + y * y <= self.border_radius_dist[0]
+        for corner_x, corner_y, direction_x, direction_y, radius in self._get_corners():
+            radius_dist = abs(radius)
 
-                elif self.border_radius[0] < 0:
-                    return x * x + y * y >= self.border_radius_dist[0]
+            # the point isn't in the square of this corner
+            if radius == 0 or direction_x * (x - corner_x) >= radius_dist \
+                    or direction_y * (y - corner_y) >= radius_dist:
+                continue
 
-                else:
-                    return True
+            if radius > 0:
+                center_x = corner_x + direction_x * radius_dist
+                center_y = corner_y + direction_y * radius_dist
+                return (x - center_x) ** 2 + (y - center_y) ** 2 <= radius_dist ** 2
 
-            # top left :
-            if self.x_2 > x > self.x_2 - self.border_radius_dist[1]\
-                    and self.y_1 < y < self.y_1 + self.border_radius_dist[1]:
-                if self.border_radius[1] > 0:
-                    return x * x + y * y <= self.border_radius_dist[1]
+            return (x - corner_x) ** 2 + (y - corner_y) ** 2 >= radius_dist ** 2
 
-                elif self.border_radius[1] < 0:
-                    return x * x + y * y >= self.border_radius_dist[1]
+        return True
 
-                else:
-                    return True
+    def are_in(self, coord) -> "np.ndarray":
+        """
+        method to test if a collection of points is insides of the border or not
+        test every point in the collection
 
-            # bottom right :
-            if self.x_1 < x < self.x_1 + self.border_radius_dist[2]\
-                    and self.y_2 > y > self.y_2 - self.border_radius_dist[2]:
-                if self.border_radius[2] > 0:
-                    return x * x + y * y <= self.border_radius_dist[2]
+        the points are tested all at once with numpy, with the same rules as the border.is_in method
+        without numpy, the border.is_in method is used for every point
 
-                elif self.border_radius[2] < 0:
-                    return x * x + y * y >= self.border_radius_dist[2]
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param coord: a collection of point in space
+        :type: numpy array of shape (N, 2), or tuple or list of tuple or list of 2 ints or Vector2D
+
+        :return: True if the point is inside the border, False otherwise
+        :type: numpy array of N bool, or a list of bool without numpy
+        """
+        if np is None:
+            return [self.is_in(elt) for elt in coord]
 
-                else:
-                    return True
+        if not isinstance(coord, np.ndarray):
+            coord = [elt.get_tuple() if err.test_class(elt, vector.Vector2D) else elt for elt in coord]
 
-            # bottom left :
-            if self.x_2 > x > self.x_2 + self.border_radius_dist[3]\
-                    and self.y_2 > y > self.y_2 + self.border_radius_dist[3]:
-                if self.border_radius[3] > 0:
-                    return x * x + y * y <= self.border_radius_dist[3]
+        points = np.asarray(coord)
+        if points.size == 0:
+            points = points.reshape(0, 2)
+        if points.ndim != 2 or points.shape[1] != 2:
+            raise ValueError("coord must be of shape (N, 2)")
 
-                elif self.border_radius[3] < 0:
-                    return x * x + y * y >= self.border_radius_dist[3]
+        x = points[:, 0]
+        y = points[:, 1]
 
-                else:
-                    return True
+        inside = (self.x_1 < x) & (x < self.x_2) & (self.y_1 < y) & (y < self.y_2)
 
-        return False
+        for corner_x, corner_y, direction_x, direction_y, radius in self._get_corners():
+            if radius == 0:
+                continue
+            radius_dist = abs(radius)
 
-    def are_in(self, coord: [list[tuple[int, int], list[int, int], vector.Vector2D],
-                             tuple[tuple[int, int], list[int, int], vector.Vector2D]]) -> list:
+            in_corner = (direction_x * (x - corner_x) < radius_dist) & (direction_y * (y - corner_y) < radius_dist)
+
+            if radius > 0:
+                center_x = corner_x + direction_x * radius_dist
+                center_y = corner_y + direction_y * radius_dist
+                is_kept = (x - center_x) ** 2 + (y - center_y) ** 2 <= radius_dist ** 2
+            else:
+                is_kept = (x - corner_x) ** 2 + (y - corner_y) ** 2 >= radius_dist ** 2
+
+            inside &= ~in_corner | is_kept
+
+        return inside
+
+    def _get_masks(self) -> tuple:
         """
-        method to test if a collection of points is insides of the border or not
-        test every point in the collection
+        method to obtain the mask and the bitmap of the inside of the border from the cache, computed the first time
+        they are asked for a border of this size and border_radius
+        method used internally only
 
-        uses the border.is_in method for every point
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the mask, and the bitmap (None without numpy)
+        :type: tuple of a pygame.mask.Mask and a numpy array of bool
+        """
+        if self.x_2 < self.x_1 or self.y_2 < self.y_1:
+            raise ValueError("coord_up_left must be above and on the left of coord_down_right to have a mask")
+
+        key = (self.x_2 - self.x_1, self.y_2 - self.y_1, tuple(self.border_radius))
+
+        masks = _cache_get(_masks, key)
+        if masks is None:
+            size = self.width + 1, self.height + 1
+
+            if np is None:
+                bitmap = None
+
+                mask = pygame.mask.Mask(size)
+                for x in range(size[0]):
+                    for y in range(size[1]):
+                        if self.is_in((self.x_1 + x, self.y_1 + y)):
+                            mask.set_at((x, y))
+
+            else:
+                # the points of the bitmap are tested all at once, and the mask is made from it through a surface
+                x, y = np.meshgrid(np.arange(self.x_1, self.x_1 + size[0]), np.arange(self.y_1, self.y_1 + size[1]))
+                bitmap = self.are_in(np.column_stack((x.ravel(), y.ravel()))).reshape(size[1], size[0])
+                bitmap.flags.writeable = False
+
+                bitmap_surface = pygame.surfarray.make_surface(bitmap.T.astype(np.uint8))
+                bitmap_surface.set_colorkey(0)
+                mask = pygame.mask.from_surface(bitmap_surface)
+
+            masks = mask, bitmap
+            _cache_put(_masks, key, masks, MAX_CACHED_MASKS)
+
+        return masks
+
+    def get_mask(self) -> pygame.mask.Mask:
+        """
+        method to obtain the inside of the border as a mask, the bit (x - x_1, y - y_1) is set if the point (x, y)
+        is in the border (see border.is_in)
+
+        it is computed once for all the borders of the same size and border_radius
 
         ----------------------------------------------------------------------------------------------------------------
 
-        :param coord: a collection of point in space
-        :type: tuple or list of tuple or list of 2 ints or Vector2D
+        :return: the mask, of size (width + 1, height + 1), shared with the other borders, it must not be modified
+        :type: pygame.mask.Mask
+        """
+        return self._get_masks()[0]
+
+    def get_bitmap(self) -> "np.ndarray":
+        """
+        method to obtain the inside of the border as a bitmap, bitmap[y - y_1, x - x_1] is True if the point (x, y)
+        is in the border (see border.is_in)
+
+        it is computed once for all the borders of the same size and border_radius
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the bitmap, of shape (height + 1, width + 1), shared with the other borders, it is read only
+        :type: numpy array of bool
+        """
+        if np is None:
+            raise ImportError("the bitmap of a border needs numpy, use get_mask instead")
+
+        return self._get_masks()[1]
+
+    def is_in_mask(self, coord: [tuple[int, int], list[int, int], vector.Vector2D]) -> bool:
+        """
+        method to test if a point is insides of the border or not, with a lookup in the mask of the border
+        the coordinates are truncated to integers
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param coord: a point in space
+        :type: tuple or list of 2 ints or Vector2D
 
         :return: True if the point is inside the border, False otherwise
-        :type: a list of bool
+        :type: bool
         """
-        test = []
+        x = int(coord[0]) - self.x_1
+        y = int(coord[1]) - self.y_1
 
-        for elt in coord:
-            test.append(self.is_in(elt))
+        if not (0 <= x <= self.width and 0 <= y <= self.height):
+            return False
 
-        return test
+        return bool(self.get_mask().get_at((x, y)))
+
+    def overlaps(self, other) -> bool:
+        """
+        method to test if the inside of the border overlaps the inside of another border, with their masks
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param other: the other border
+        :type: Border
+
+        :return: True if they have a point inside both of them, False otherwise
+        :type: bool
+        """
+        return self.get_mask().overlap(other.get_mask(), (other.x_1 - self.x_1, other.y_1 - self.y_1)) is not None
+
+    def overlap_area(self, other) -> int:
+        """
+        method to obtain the number of points inside both the border and another border, with their masks
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param other: the other border
+        :type: Border
+
+        :return: the number of points
+        :type: int
+        """
+        return self.get_mask().overlap_area(other.get_mask(), (other.x_1 - self.x_1, other.y_1 - self.y_1))
 
     def erase(self,
               surface: pygame.Surface,
-              background_color: [str, [int, int, int], tuple[int, int, int], vector.Vector3D]):
+              background_color: [str, [int, int, int], tuple[int, int, int], vector.Vector3D] = None):
         """
-        method that redraw the border in the color of the background to make it disappear
+        method to make the border disappear
+
+        if the border was drawn on this surface at this place, the pixels it was drawn over are restored with one blit
+        and forgotten, otherwise it is redrawn in the color of the background, its own color is kept
 
         ----------------------------------------------------------------------------------------------------------------
 
         :param surface: the surface to draw on
         :type: a pygame.Surface object
-        :param background_color: the color of the border
+        :param background_color: the color of the background, needed when the pixels weren't saved,
+                                 optional defaulted to None
         :type: str, tuple or list of 3 ints or Vector3D
+
+        :return: the rectangle in which the border is drawn (see get_rect)
+        :type: pygame.Rect
         """
+        rect = self.get_rect()
+
+        if self._background is not None and self._background[0] is surface and self._background[1] == rect:
+            surface.blit(self._background[3], self._background[2])
+
+            # what is drawn there from now on is the new background, the next draw saves it again
+            self._background = None
+            return rect
+
+        if background_color is None:
+            raise ValueError("background_color is needed, the border wasn't drawn on this surface at this place")
+
         if err.test_class(background_color, str):
-            self.color = colors.colors[background_color]
+            color_temp = colors.colors[background_color]
         else:
             if err.test_class(background_color, vector.Vector3D):
                 color_temp = background_color.get_tuple()
@@ -423,6 +817,161 @@ class Border(object):
             if 0 < color_temp[0] < 255 or 0 < color_temp[1] < 255 or 0 < color_temp[2] < 255:
                 raise ValueError("color must use the rgb system, with 3 values ranging from 0 to 255")
 
-            self.color = color_temp
+        surface.blit(self._get_surface(color_temp), rect.topleft)
+
+        return rect
+
+
+class BorderGroup(object):
+    def __init__(self, borders: [list, tuple] = ()):
+        """
+        This class is to draw many borders at once
+
+        the borders are grouped by their rasterized surface (same size, radius, width and color, see Border.draw),
+        each group is drawn with one call to pygame.Surface.blits, and the borders outside of the clip of the surface
+        are skipped
+
+        the group doesn't save the pixels under the borders, Border.erase must be given a background_color
+        for them (or use a graphic_tool.background.BackgroundLayer)
+
+        a border can be moved while it is in the group, but it must be added again if its size, radius, width
+        or color changed
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        Methods:
+
+            .add(border)
+                add a border, or group it again if it is already in
+
+            .remove(border)
+
+            .draw(surface) -> list of rect
+                draw every border in the clip of the surface
+
+            .clear()
+
+            .get_stats() -> dict
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param borders: the borders, optional defaulted to () (none)
+        :type: list or tuple of Border
+        """
+        self._groups = {}  # key of the rasterized surface -> list of borders
+        self._keys = {}  # border -> key of the rasterized surface
+
+        self.nbr_drawn = 0  # during the last draw
+        self.nbr_skipped = 0
+
+        for border in borders:
+            self.add(border)
+
+    def __len__(self) -> int:
+        """
+        Implement len(self)
+        """
+        return len(self._keys)
+
+    def __contains__(self, border) -> bool:
+        """
+        Implement border in self
+        """
+        return border in self._keys
+
+    def __iter__(self):
+        """
+        Implement iter(self)
+        """
+        return iter(self._keys)
+
+    def add(self, border: Border):
+        """
+        method to add a border to the group, if it is already in it is grouped again with the borders identical to it
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param border: the border
+        :type: Border
+        """
+        if not err.test_class(border, Border):
+            raise ValueError("border must be a Border")
+
+        if border in self._keys:
+            self.remove(border)
+
+        key = self._keys[border] = border._get_surface_key()
+        self._groups.setdefault(key, []).append(border)
 
-        self.draw(surface)
+    def remove(self, border: Border):
+        """
+        method to remove a border from the group, nothing happens if it isn't in
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param border: the border
+        :type: Border
+        """
+        key = self._keys.pop(border, None)
+        if key is None:
+            return
+
+        group = self._groups[key]
+        group.remove(border)
+
+        if not group:
+            del self._groups[key]
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """
+        method to draw every border of the group on a surface, the ones outside of its clip are skipped
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param surface: the surface to draw on
+        :type: a pygame.Surface object
+
+        :return: the rectangles drawn, clipped (to give to a damage tracker for instance)
+        :type: list of pygame.Rect
+        """
+        clip = surface.get_clip()
+        drawn_rects = []
+
+        self.nbr_drawn = self.nbr_skipped = 0
+
+        for group in self._groups.values():
+            rects = [border.get_rect() for border in group]
+            border_surface = group[0]._get_surface()
+
+            visible_rects = [rects[i] for i in clip.collidelistall(rects)]
+
+            self.nbr_drawn += len(visible_rects)
+            self.nbr_skipped += len(rects) - len(visible_rects)
+
+            if visible_rects:
+                drawn_rects += surface.blits([(border_surface, rect) for rect in visible_rects])
+
+        return drawn_rects
+
+    def clear(self):
+        """
+        method to remove every border from the group
+        """
+        self._groups.clear()
+        self._keys.clear()
+
+    def get_stats(self) -> dict:
+        """
+        method to obtain the statistics of the group
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the keys "borders", "groups", "last_drawn" and "last_skipped" (during the last draw)
+        :type: dict
+        """
+        return {
+            "borders":      len(self._keys),
+            "groups":       len(self._groups),
+            "last_drawn":   self.nbr_drawn,
+            "last_skipped": self.nbr_skipped,
+        }
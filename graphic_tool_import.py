@@ -16,5 +16,6 @@ this module is to handle all the importing from the graphic_tool package and mak
 everything as if it was one file and not a package of multiple file
 """
 
+from graphic_tool.background import *
 from graphic_tool.border import *
 from graphic_tool.colors import *
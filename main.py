@@ -17,20 +17,44 @@ main file
 app made in python using pygame and pygame_widgets
 """
 
+import argparse
+import os
 import sys
+import tempfile
 import time
 import webbrowser
 
+try:
+    import resource  # only on unix, to measure the peak memory of the scripted runs
+except ImportError:
+    resource = None
+
 import pygame
 import pygame_widgets
+from pygame_widgets.mouse import Mouse
 
+import autocomplete
 import Boxes
+import browser_dispatch
+import damage_tracker
+import frame_scheduler
 import graphic_tool_import as gti
+import perf_hud
 import pygame_widgets_import as pwi
+import query_cache
+import query_compiler as qc
+import query_history
+import widget_index
+from text_cache import text_cache
 
 
 class World(object):
-    def __init__(self, screen: pygame.surface, screen_size: tuple[int, int]):
+    def __init__(self,
+                 screen:               pygame.surface,
+                 screen_size:          tuple[int, int],
+                 repeat_search_window: float = 2.0,
+                 history_path:         str = query_history.DEFAULT_HISTORY_PATH,
+                 browser:              str = None):
         """
         class representing and handling the window, graphics and display
 
@@ -46,11 +70,34 @@ class World(object):
             .on_user_create() -> bool
                 initialise the world
 
-            .on_user_update(elapsed_time) -> bool
+            .on_user_update(elapsed_time, lst_event, frame_stats) -> bool
                 update the world
 
+            .is_animating() -> bool
+                is something changing on the screen without events
+
+            .update_widgets(lst_event)
+                give the events to the widgets concerned by them and draw every widget
+
+            .focus(text_input)
+                select a text input, as if it was clicked
+
+            .get_live_widgets() -> list of widgets
+                the widgets of the world and of its boxes
+
+            .find_leaked_widgets() -> list of widgets
+                the widgets still registered in pygame_widgets that aren't live
+
+            .get_widget_stats() -> dict
+
             .display_text(start_pos, text, color)
 
+            .restore_background(rect)
+                erase a part of the screen, back to what was under the boxes and the texts drawn over the menu
+
+            .add_box(box)
+                add a box at the end of self.lst_box, and scroll to it
+
             .delete_box(box_index)
 
             .box_go_right(box_index)
@@ -60,22 +107,102 @@ class World(object):
             .reset_lst_box()
                 reset the list of input boxes
 
+            .get_box_coord(box_index) -> (x, y)
+                where a box is drawn, given the scrolling of the viewport
+
+            .is_box_visible(box_index) -> bool
+
+            .scroll(step)
+                scroll the viewport of the boxes by step boxes
+
+            .scroll_to(box_index)
+                scroll the viewport of the boxes to make a box visible
+
+            .display_scroll_state()
+
+            .load_boxes(specs)
+                replace the input boxes by the ones described by the box specs
+
+            .load_history(step)
+                load an older or a more recent search from the history
+
+            .compile_query() -> (query_parsed, query_raw, errors)
+
+            .learn_words(specs)
+                add the words of the boxes to the autocompletion
+
+            .invalidate_query()
+                the query changed, the preview must be compiled again
+
+            .update_preview()
+                display the query as it is right now
+
             .search(search_mode_selection):
 
+            .close()
+                unregister the widgets, stop the web browser dispatcher and close the history
+
         ----------------------------------------------------------------------------------------------------------------
 
         :param screen: the pygame.surface object on witch this world is going to be applied
         :type: pygame.surface object
         :param screen_size: the width and the height of your world
         :type: a tuple of 2 integers
+
+        :param repeat_search_window: time in seconds during which the same search isn't opened again,
+                                     optional defaulted to 2.0
+        :type: float
+        :param history_path: path of the history files (see the query_history module),
+                             optional defaulted to query_history.DEFAULT_HISTORY_PATH
+        :type: str
+        :param browser: the name of the web browser given to webbrowser.get,
+                        optional defaulted to None (default browser)
+        :type: str
         """
         if screen_size[0] < 0 or screen_size[1] < 0:
             raise ValueError("A screen must be of size positive")
+        if repeat_search_window < 0:
+            raise ValueError("repeat_search_window must be positive")
 
         self.screen = screen
         self.screen_width, self.screen_high = self.screen_size = screen_size
 
+        # the rectangles of the screen drawn during the frame, presented by self.damage.present()
+        self.damage = damage_tracker.DamageTracker(screen)
+        # what the screen looks like without the boxes and the texts that change, saved by on_user_create
+        self.background = gti.BackgroundLayer(screen)
+
+        # pygame_widgets only keeps weak references to the widgets, the ones of the World are kept alive here
+        self.menu_widgets = {}
+
+        # the widgets of the boxes, by where they are, only the ones concerned by the events listen to them
+        self.widget_index = widget_index.SpatialHash(cell_size=80)
+        self._followed_widgets = set()  # the widgets of the boxes that must listen at the next frame
+        self._has_hovered_widgets = False  # a widget left by the mouse isn't drawn normally yet
+        self.nbr_listening_widgets = 0  # during the last frame
+        self.nbr_drawn_widgets = 0
+
+        # only the boxes from self.scroll_index to self.scroll_index + self.nbr_visible_boxes are in the viewport,
+        # they are the only ones with widgets (see Boxes.Box.create_widgets and Boxes.Box.release_widgets)
         self.lst_box = []
+        self.scroll_index = 0
+        self.nbr_visible_boxes = max(1, (self.screen_width - 155) // 160)
+        self.query_compiler = qc.QueryCompiler()
+        self.browser = browser_dispatch.BrowserDispatcher(browser=browser)
+        self.query_cache = query_cache.QueryCache()
+        self.repeat_search_window = repeat_search_window
+
+        self.history = query_history.QueryHistory(history_path)
+        self.history_position = None  # index in the history of the search loaded in self.lst_box, if any
+
+        # the words of the previous searches, to complete the words typed in the boxes
+        self.autocomplete = autocomplete.Autocomplete()
+        for entry in reversed(self.history.last(1000)):
+            self.learn_words(entry["boxes"])
+        self.preview_text = None
+        self._is_query_changed = True  # since the last preview, see invalidate_query
+
+        self.frame_stats = {}  # see frame_scheduler.FrameScheduler.get_stats
 
     def on_user_create(self) -> bool:
         """
@@ -101,13 +228,13 @@ class World(object):
                           is_center=(True, False), font_size=40)
         # buttons :
         normal_button = pwi.Button(self.screen, 50, 165, 70, 20, text="Normal", fontSize=25, radius=7,
-                                   onClick=lambda: self.lst_box.append(Boxes.Box(self, len(self.lst_box))))
+                                   onClick=lambda: self.add_box(Boxes.Box(self, len(self.lst_box))))
         exact_button = pwi.Button(self.screen, 140, 165, 70, 20, text="Exact", fontSize=25, radius=7,
-                                  onClick=lambda: self.lst_box.append(Boxes.BoxExact(self, len(self.lst_box))))
+                                  onClick=lambda: self.add_box(Boxes.BoxExact(self, len(self.lst_box))))
         avoid_button = pwi.Button(self.screen, 230, 165, 70, 20, text="Avoid", fontSize=25, radius=7,
-                                  onClick=lambda: self.lst_box.append(Boxes.BoxAvoid(self, len(self.lst_box))))
+                                  onClick=lambda: self.add_box(Boxes.BoxAvoid(self, len(self.lst_box))))
         any_button = pwi.Button(self.screen, 320, 165, 70, 20, text="Any", fontSize=25, radius=7,
-                                onClick=lambda: self.lst_box.append(Boxes.BoxAny(self, len(self.lst_box))))
+                                onClick=lambda: self.add_box(Boxes.BoxAny(self, len(self.lst_box))))
 
         def date_button_onclick():
             """
@@ -116,7 +243,7 @@ class World(object):
             """
             selected = date_menu.getSelected()
             try:
-                self.lst_box.append(selected(self, len(self.lst_box)))
+                self.add_box(selected(self, len(self.lst_box)))
             except TypeError:
                 pass
 
@@ -135,14 +262,24 @@ class World(object):
         # pygame.draw.line(self.screen, white, (30,                110), (screen_width - 30, 110), 2)  # top
         # pygame.draw.line(self.screen, white, (screen_width - 30, 210), (30,                210), 2)  # bottom
         border_menu = gti.Border((30, 110), (screen_width - 30, 210), white, border_radius=20, border_width=3)
-        border_menu.draw(self.screen)
+        self.damage.add(border_menu.draw(self.screen))
 
         # +-------------------------+
         # | list of the input boxes |
         # +-------------------------+
 
+        # erasing a box, or a text drawn after this, restores what is under it from here
+        self.background.save()
+
         self.lst_box.append(Boxes.Box(self, 0))
 
+        # buttons to scroll them :
+        scroll_left_button = pwi.Button(self.screen, screen_width - 135, 280, 55, 30, text="<", fontSize=30,
+                                        radius=7, onClick=lambda: self.scroll(-1))
+        scroll_right_button = pwi.Button(self.screen, screen_width - 70, 280, 55, 30, text=">", fontSize=30,
+                                         radius=7, onClick=lambda: self.scroll(1))
+        self.display_scroll_state()
+
         # +----------------------------+
         # | buttons for others actions |
         # +----------------------------+
@@ -156,15 +293,36 @@ class World(object):
                                              colour=(150, 150, 150), fontSize=30, radius=7)
         # (150, 150, 150) is the same color as the buttons
 
+        older_button = pwi.Button(self.screen, (screen_width // 2) - 310, 500, 200, 30, text="<- Older search",
+                                  fontSize=25, radius=7, onClick=lambda: self.load_history(-1))
+        newer_button = pwi.Button(self.screen, (screen_width // 2) - 100, 500, 200, 30, text="Newer search ->",
+                                  fontSize=25, radius=7, onClick=lambda: self.load_history(1))
+
+        self.menu_widgets = {
+            "normal_button":         normal_button,
+            "exact_button":          exact_button,
+            "avoid_button":          avoid_button,
+            "any_button":            any_button,
+            "date_menu":             date_menu,
+            "date_button":           date_button,
+            "reset_button":          reset_button,
+            "search_button":         search_button,
+            "search_mode_selection": search_mode_selection,
+            "older_button":          older_button,
+            "newer_button":          newer_button,
+            "scroll_left_button":    scroll_left_button,
+            "scroll_right_button":   scroll_right_button,
+        }
+
         # TODO : making border radius to have a more pleasant experience
 
         return True
 
-    def on_user_update(self, elapsed_time: float, lst_event: list) -> bool:
+    def on_user_update(self, elapsed_time: float, lst_event: list, frame_stats: dict = None) -> bool:
         """
         method that you call inside your pygame loop to update your world
 
-        the parameter elapsed_time must be in nanosecond
+        the parameter elapsed_time must be in seconds
 
         ----------------------------------------------------------------------------------------------------------------
 
@@ -172,12 +330,162 @@ class World(object):
         :type: float
         :param lst_event: list of all the pygame event
         :type: list
+
+        :param frame_stats: the statistics of the last frames, kept in self.frame_stats,
+                            optional defaulted to None (see frame_scheduler.FrameScheduler.get_stats)
+        :type: dict
         :return: bool
         """
         if elapsed_time < 0:
             raise ValueError("Time in general and elapsed_time must be positive")  # TODO : if needed
+
+        if frame_stats is not None:
+            self.frame_stats = frame_stats
+
+        # the mouse wheel over the boxes scrolls them
+        for event in lst_event:
+            if event.type == pygame.MOUSEWHEEL and 250 <= pygame.mouse.get_pos()[1] <= 380:
+                self.scroll(-event.y)
+
+        self.update_preview()
+
         return True
 
+    def is_animating(self) -> bool:
+        """
+        method to know if something on the screen changes without events, and needs the frames to keep coming
+
+        it is the case of a selected text input, for its blinking cursor and the repetition of a held key,
+        and of a button the mouse left, drawn back to normal at the next frames
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: True if something is animating, False otherwise
+        :type: bool
+        """
+        if self._has_hovered_widgets:
+            return True
+
+        return any(isinstance(widget, pwi.TextBox) and widget.selected
+                   for widget in pygame_widgets.WidgetHandler.getWidgets())
+
+    def update_widgets(self, lst_event: list):
+        """
+        method to give the events of the frame to the widgets concerned by them and draw every widget,
+        instead of pygame_widgets.update that gives them to every widget
+
+        the widgets of the boxes only listen when they are under the mouse, and until they are drawn normally again
+        after it left them (a button resets its colour at the second frame after), the selected text inputs listen
+        to the keyboard
+        the widgets of the menu always listen
+
+        the parts of the screen changed by the widgets that listen are given to self.damage
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param lst_event: list of all the pygame event
+        :type: list
+        """
+        Mouse.updateMouseState()
+        mouse_x, mouse_y = Mouse.getMousePos()
+
+        routed = set(self.widget_index.query_point(mouse_x, mouse_y))
+        routed.update(self._followed_widgets)
+
+        widgets = list(pygame_widgets.WidgetHandler.getWidgets())
+        listening = [widget for widget in widgets if widget in routed or widget not in self.widget_index]
+
+        self.damage.add_widgets(lst_event, listening)
+
+        # as in pygame_widgets, the widgets on top block the mouse for the ones under them
+        is_blocked = False
+        self._followed_widgets = set()
+        self._has_hovered_widgets = False
+        for widget in reversed(listening):
+            is_under_mouse = widget.contains(mouse_x, mouse_y)
+
+            if not is_blocked or not is_under_mouse:
+                widget.listen(lst_event)
+
+            if is_under_mouse:
+                is_blocked = True
+
+            # a button left by the mouse is drawn normally again only at a later frame, without any event
+            is_hovered = damage_tracker.is_hovered(widget)
+            if is_hovered and not is_under_mouse:
+                self._has_hovered_widgets = True
+
+            if widget in self.widget_index and (is_under_mouse or is_hovered or getattr(widget, "selected", False)
+                                                or getattr(widget, "keyDown", False)
+                                                or getattr(widget, "clicked", False)):
+                self._followed_widgets.add(widget)
+
+        self.nbr_listening_widgets = len(listening)
+        self.nbr_drawn_widgets = len(widgets)
+
+        for widget in widgets:
+            widget.draw()
+
+    def focus(self, text_input: pwi.TextBox):
+        """
+        method to select a text input of a box, as if it was clicked, the keyboard events then go to it
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param text_input: the text input
+        :type: pygame_widgets.textbox.TextBox object / pwi.TextBox object
+        """
+        text_input.selected = True
+        text_input.showCursor = True
+
+        # a widget of a box only listens when it is followed or under the mouse
+        self._followed_widgets.add(text_input)
+
+    def get_live_widgets(self) -> list:
+        """
+        method to obtain the widgets in use, the ones of the menus and of the boxes of self.lst_box
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the widgets
+        :type: list of pygame_widgets widgets
+        """
+        widgets = list(self.menu_widgets.values())
+
+        for box in self.lst_box:
+            widgets.extend(box.get_widgets())
+
+        return widgets
+
+    def find_leaked_widgets(self) -> list:
+        """
+        method to find the widgets still registered in pygame_widgets.WidgetHandler but not in use anymore,
+        pygame_widgets.update goes through them at every frame for nothing
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the leaked widgets
+        :type: list of pygame_widgets widgets
+        """
+        live_ids = {id(widget) for widget in self.get_live_widgets()}
+
+        return [widget for widget in pygame_widgets.WidgetHandler.getWidgets() if id(widget) not in live_ids]
+
+    def get_widget_stats(self) -> dict:
+        """
+        method to obtain the number of widgets in use and registered in pygame_widgets
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the keys "live", "registered" and "leaked" (see find_leaked_widgets)
+        :type: dict
+        """
+        return {
+            "live":       len(self.get_live_widgets()),
+            "registered": len(pygame_widgets.WidgetHandler.getWidgets()),
+            "leaked":     len(self.find_leaked_widgets()),
+        }
+
     def display_text(self,
                      text:      str,
                      start_pos: tuple[[int, float], [int, float]],
@@ -207,17 +515,30 @@ class World(object):
         if start_pos[0] < 0 or start_pos[1] < 0:
             raise ValueError("start_pos must have positive coordinates")
 
-        if 0 < color[0] < 255 or 0 < color[1] < 255 or 0 < color[2] < 255:
+        if not (0 <= color[0] <= 255 and 0 <= color[1] <= 255 and 0 <= color[2] <= 255):
             raise ValueError("color must use the rgb system, with 3 values ranging from 0 to 255")
 
-        text_render = pygame.font.Font(font, font_size).render(text, True, color)
+        # the fonts and the rendered texts are shared by the whole app
+        text_render = text_cache.render(text, color, font, font_size)
 
         if is_center[0]:
             start_pos = (start_pos[0] - (text_render.get_size()[0] // 2), start_pos[1])
         if is_center[1]:
             start_pos = (start_pos[0], start_pos[1] - (text_render.get_size()[1] // 2))
 
-        self.screen.blit(text_render, start_pos)
+        self.damage.add(self.screen.blit(text_render, start_pos))
+
+    def restore_background(self, rect: [pygame.Rect, tuple]):
+        """
+        method to erase a part of the screen, back to what it was before the boxes were drawn
+        (the title, the menu and its border), with one blit
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param rect: the part of the screen
+        :type: pygame.Rect or tuple of 4 int
+        """
+        self.damage.add(self.background.restore(rect))
 
     def delete_box(self, box_index: int):
         """
@@ -234,27 +555,25 @@ class World(object):
 
         lst_left, del_box, lst_right = self.lst_box[:box_index], self.lst_box[box_index], self.lst_box[box_index + 1:]
 
-        del_box_x, del_box_y = del_box.coord
-        del_box_opp_x, del_box_opp_y = del_box.opp_coord
+        # the box and the ones to its right, drawn again one step to the left
+        self._restore_boxes(box_index, len(self.lst_box) - 1)
 
         del_box.delete_widgets()
         del del_box
 
-        try:
-            pygame.draw.rect(self.screen, gti.colors["black"],
-                             (del_box_x, del_box_y, lst_right[-1].opp_x, lst_right[-1].opp_y))
-        except IndexError:
-            pygame.draw.rect(self.screen, gti.colors["black"],
-                             (del_box_x, del_box_y, del_box_opp_x, del_box_opp_y))
-
         for i, box in enumerate(lst_right):
             box.update_index(box_index + i)
 
         self.lst_box = lst_left + lst_right
+        self.invalidate_query()
 
         if len(self.lst_box) == 0:
             self.lst_box.append(Boxes.Box(self, 0))
 
+        # the viewport can't show past the last box
+        self.scroll(0)
+        self.display_scroll_state()
+
     def box_go_right(self, box_index: int):
         """
         method to move a specified box from self.lst_box one step to the right
@@ -271,14 +590,16 @@ class World(object):
             raise ValueError("box_index must be positive")
 
         if (box_index != len(self.lst_box) - 1) and (len(self.lst_box) != 0):
-            pygame.draw.rect(self.screen, gti.colors["black"],
-                             (self.lst_box[box_index].x, self.lst_box[box_index].y,
-                              self.lst_box[box_index + 1].opp_x, self.lst_box[box_index + 1].opp_y))
+            self._restore_boxes(box_index, box_index + 1)
 
             self.lst_box[box_index + 1].update_index(box_index)
             self.lst_box[box_index].update_index(box_index + 1)
 
             self.lst_box[box_index + 1], self.lst_box[box_index] = self.lst_box[box_index], self.lst_box[box_index + 1]
+            self.invalidate_query()
+
+            # the viewport follows the box
+            self.scroll_to(box_index + 1)
 
     def box_go_left(self, box_index: int):
         """
@@ -296,118 +617,619 @@ class World(object):
             raise ValueError("box_index must be positive")
 
         if (box_index != 0) and (len(self.lst_box) != 0):
-            pygame.draw.rect(self.screen, gti.colors["black"],
-                             (self.lst_box[box_index - 1].x, self.lst_box[box_index - 1].y,
-                              self.lst_box[box_index].opp_x, self.lst_box[box_index].opp_y))
+            self._restore_boxes(box_index - 1, box_index)
 
             self.lst_box[box_index].update_index(box_index - 1)
             self.lst_box[box_index - 1].update_index(box_index)
 
             self.lst_box[box_index - 1], self.lst_box[box_index] = self.lst_box[box_index], self.lst_box[box_index - 1]
+            self.invalidate_query()
+
+            # the viewport follows the box
+            self.scroll_to(box_index - 1)
 
     def reset_lst_box(self):
         """
         method to reset self.lst_box to its original state
         meaning : self.lst_box containing a unique default Box (type = " Normal ")
         """
-        pygame.draw.rect(self.screen, gti.colors["black"],
-                         (self.lst_box[0].x, self.lst_box[0].y, self.lst_box[-1].opp_x, self.lst_box[-1].opp_y))
+        self._restore_boxes(0, len(self.lst_box) - 1)
 
         for box in self.lst_box:
             box.delete_widgets()
             del box
 
-        self.lst_box.append(Boxes.Box(self, 0))
+        self.scroll_index = 0
+        self.lst_box = [Boxes.Box(self, 0)]
+        self.invalidate_query()
+        self.history_position = None
+
+        self.display_scroll_state()
+
+    def load_boxes(self, specs: [list, tuple]):
+        """
+        method to replace the boxes of self.lst_box by the ones described by a list of box specs
+        (see the query_compiler module), with their inputs filled
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param specs: the box specs, in the order of the boxes
+        :type: list or tuple of dict
+        """
+        self._restore_boxes(0, len(self.lst_box) - 1)
+
+        for box in self.lst_box:
+            box.delete_widgets()
+            del box
+
+        self.scroll_index = 0
+        self.lst_box = [Boxes.box_from_spec(self, i, spec) for i, spec in enumerate(specs)]
+        self.invalidate_query()
+
+        if len(self.lst_box) == 0:
+            self.lst_box.append(Boxes.Box(self, 0))
+
+        self.display_scroll_state()
+
+    def _restore_boxes(self, first: int, last: int):
+        """
+        method to erase the boxes of self.lst_box from first to last included, the ones outside the viewport are
+        skipped as they aren't drawn
+        method used internally only
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param first: the index of the first box
+        :type: int
+        :param last: the index of the last box
+        :type: int
+        """
+        first = max(first, self.scroll_index)
+        last = min(last, self.scroll_index + self.nbr_visible_boxes - 1)
+
+        if first <= last:
+            self.restore_background(self.lst_box[first].get_rect().union(self.lst_box[last].get_rect()))
+
+    def add_box(self, box: Boxes.Box):
+        """
+        method to add a box at the end of self.lst_box, the viewport is scrolled to show it
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param box: the box, created with the index len(self.lst_box)
+        :type: Boxes.Box or a derived class
+        """
+        self.lst_box.append(box)
+
+        self.scroll_to(box.index)
+        self.display_scroll_state()
+
+    def get_box_coord(self, box_index: int) -> tuple[int, int]:
+        """
+        method to obtain the coordinates of the top left corner of a box, given the scrolling of the viewport
+
+        the boxes outside the viewport have coordinates outside of it as well
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param box_index: the index of the box
+        :type: int
+
+        :return: the coordinates
+        :type: tuple of 2 int
+        """
+        return 15 + ((box_index - self.scroll_index) * 160), 260
+
+    def is_box_visible(self, box_index: int) -> bool:
+        """
+        method to know if a box is in the viewport, and so has widgets
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param box_index: the index of the box
+        :type: int
+
+        :return: True if the box is visible, False otherwise
+        :type: bool
+        """
+        return self.scroll_index <= box_index < self.scroll_index + self.nbr_visible_boxes
+
+    def scroll(self, step: int):
+        """
+        method to scroll the viewport of the boxes, it never shows past the last box
+
+        the boxes leaving the viewport lose their widgets and the ones coming in get them
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param step: the number of boxes to scroll by, positive to go to the right, negative to go to the left
+        :type: int
+        """
+        max_scroll_index = max(0, len(self.lst_box) - self.nbr_visible_boxes)
+        scroll_index = min(max(self.scroll_index + step, 0), max_scroll_index)
+
+        if scroll_index == self.scroll_index:
+            return
+
+        old_scroll_index, self.scroll_index = self.scroll_index, scroll_index
+
+        self.restore_background((0, 250, 10 + (self.nbr_visible_boxes * 160), 132))
+
+        # only the boxes that were or that are in the viewport have something to do
+        start = min(old_scroll_index, scroll_index)
+        stop = min(max(old_scroll_index, scroll_index) + self.nbr_visible_boxes, len(self.lst_box))
+        for i in range(start, stop):
+            self.lst_box[i].update_index(i)
+
+        self.display_scroll_state()
+
+    def scroll_to(self, box_index: int):
+        """
+        method to scroll the viewport of the boxes just enough to show a box
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param box_index: the index of the box
+        :type: int
+        """
+        if box_index < self.scroll_index:
+            self.scroll(box_index - self.scroll_index)
+        elif box_index >= self.scroll_index + self.nbr_visible_boxes:
+            self.scroll(box_index - self.scroll_index - self.nbr_visible_boxes + 1)
+
+    def display_scroll_state(self):
+        """
+        method to display which boxes are in the viewport, under the buttons to scroll
+        """
+        first = self.scroll_index + 1
+        last = min(self.scroll_index + self.nbr_visible_boxes, len(self.lst_box))
+
+        self.restore_background((self.screen_width - 140, 320, 140, 30))
+        self.display_text(f"{first}-{last} / {len(self.lst_box)}", (self.screen_width - 72, 335),
+                          gti.colors["white"], is_center=(True, True), font_size=25)
+
+    def load_history(self, step: int):
+        """
+        method to load in self.lst_box a search from the history, step searches away from the one loaded
+
+        if no search of the history is loaded, -1 loads the last search
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param step: -1 for the previous (older) search, 1 for the next (more recent) one
+        :type: int
+        """
+        length = len(self.history)
+        if length == 0:
+            return
+
+        if self.history_position is None:
+            position = length - 1 if step < 0 else None
+        else:
+            position = self.history_position + step
+
+        if position is None or not (0 <= position < length):
+            return
+
+        self.load_boxes(self.history.get(position)["boxes"])
+        self.history_position = position
+
+    def compile_query(self) -> tuple[str, str, list]:
+        """
+        method to compile the query from the boxes of self.lst_box
+
+        each box keeps its fragment of the query until one of its inputs changes (see Box.get_fragment),
+        so only the modified boxes are parsed again and the query is assembled in a single join
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the parsed query, the raw query and the list of (index, error) of the boxes with an invalid input
+        :type: tuple[str, str, list]
+        """
+        fragments = []
+        errors = []
+
+        for i, box in enumerate(self.lst_box):
+            try:
+                fragments.append(box.get_fragment())
+
+            except ValueError as err:
+                fragments.append(None)
+                errors.append((i, err))
+
+        return *self.query_compiler.join(fragments), errors
+
+    def invalidate_query(self):
+        """
+        method to tell that the query changed : an input of a box changed (see Box.invalidate_fragment),
+        a box was created, or self.lst_box was reordered or shortened
+        """
+        self._is_query_changed = True
+
+    def update_preview(self):
+        """
+        method to display the parsed query under the boxes, as it is right now
+
+        called every frame by on_user_update, it only compiles the query when it changed (see invalidate_query),
+        so a frame without changes doesn't go through the boxes, and only redraws the preview when its text changed
+        """
+        if not self._is_query_changed:
+            return
+        self._is_query_changed = False
+
+        query_parsed, _, errors = self.compile_query()
+
+        preview_text = query_parsed[len(self.query_compiler.base_url):]
+        if errors:
+            preview_text += "  (invalid input ignored)"
+        if len(preview_text) > 110:
+            preview_text = preview_text[:107] + "..."
+
+        if preview_text == self.preview_text:
+            return
+        self.preview_text = preview_text
+
+        self.restore_background((0, 380, self.screen_width, 40))
+        if preview_text:
+            self.display_text(preview_text, (self.screen_width // 2, 400), gti.colors["white"],
+                              is_center=(True, True), font_size=25)
+
+    def learn_words(self, specs: [list, tuple]):
+        """
+        method to add the words typed in boxes to self.autocomplete, so that they can be completed later
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param specs: the box specs of the boxes (see the query_compiler module)
+        :type: list or tuple of dict
+        """
+        for spec in specs:
+            if "text" in spec:
+                self.autocomplete.add_text(spec["text"])
 
     def search(self, search_mode_selection: pwi.Checkbox):
         """
         method to make a Google search from the input created by the boxes from self.lst_box
         it can either search with and/or without the parsing and keyword of the boxes
 
-        this method uses webbrowser.open()
+        the query itself is assembled by World.compile_query from the cached fragments of the boxes
+
+        the queries are opened by self.browser, a browser_dispatch.BrowserDispatcher,
+        so this method doesn't wait for the web browser, and the same query isn't opened twice in a row
+
+        the compiled queries are kept in self.query_cache, and a search identical to one made less than
+        self.repeat_search_window seconds ago isn't compiled nor opened again
 
         ----------------------------------------------------------------------------------------------------------------
 
         :param search_mode_selection: a Checkbox object used to select the mode of search
         :type: pygame_widgets.checkbox.Checkbox object / pwi.Checkbox object
         """
-        query_parsed = "http://www.google.com/search?q="
-        query_raw = "http://www.google.com/search?q="
-
         without_keyword, with_keyword = search_mode_selection.selected.copy()
 
-        for i, box in enumerate(self.lst_box):
+        specs = [box.get_spec() for box in self.lst_box]
+        signature = query_cache.make_signature(specs)
+        entry = self.query_cache.get(signature)
+        if entry is None:
+            entry = self.query_cache.put(signature, *self.compile_query())
+
+        query_parsed, query_raw, errors = entry["query_parsed"], entry["query_raw"], entry["errors"]
+
+        for _, err in errors:
+            if pwi.Popup is None:  # no display for the popups, see pygame_widgets_import
+                break
+
+            error_popup = pwi.Popup(
+                self.screen, 100, 100, 400, 400, pwi.PopupType.RETRY_CANCEL,
+                "Error",
+                f"There seems to be an error in your input :\n{err}\nPlease retry",
+                textSize=30
+            )
+            error_popup.show()
+
+        search_mode = (without_keyword, with_keyword)
+        if self.query_cache.is_repeat(entry, search_mode, self.repeat_search_window):
+            return
+        self.query_cache.mark_dispatched(entry, search_mode)
+
+        if len(query_parsed) > len(self.query_compiler.base_url):
+            self.history.append(specs, query_parsed)
+            self.learn_words(specs)
+
+        # checks to not open an empty search
+        if with_keyword and len(query_parsed) > len(self.query_compiler.base_url):
+            self.browser.open(query_parsed)
+        # when the query has no keyword, both are the same and the dispatcher drops the second one
+        if without_keyword and len(query_parsed) > len(self.query_compiler.base_url):
+            self.browser.open(query_raw)
+
+    def close(self):
+        """
+        method to release what the world holds outside of itself, once it isn't used anymore :
+        the widgets registered in pygame_widgets, the thread of the web browser dispatcher
+        (after it opened the last queries) and the history files
 
-            try:
-                text = box.get_text()
-                raw_text = box.get_raw_text()
+        pygame_widgets.WidgetHandler is global, the widgets left in it would be updated with the widgets of the next
+        world, on a display that may have been quit, so this method must be called before pygame.quit
+        """
+        for box in self.lst_box:
+            box.delete_widgets()
+        for widget in self.menu_widgets.values():
+            pygame_widgets.WidgetHandler.removeWidget(widget)
 
-            except ValueError as err:
-                error_popup = pwi.Popup(
-                    self.screen, 100, 100, 400, 400, pwi.PopupType.RETRY_CANCEL,
-                    "Error",
-                    f"There seems to be an error in your input :\n{err}\nPlease retry",
-                    textSize=30
-                )
-                error_popup.show()
-            else:
-                # checks to not have to add ' + ' nor to add the text is the text is empty
-                is_text = not ((text is None) or (len(text) == 0))
-                is_raw_text = not ((raw_text is None) or (len(raw_text) == 0))
-
-                if i:
-                    if is_text:
-                        if box.box_type == "Avoid":
-                            query_parsed += '-'
-                        else:
-                            query_parsed += '+'
-
-                    if box.box_type in ("Normal", "Exact") and is_raw_text:
-                        query_raw += '+'
-                if is_text:
-                    query_parsed += text
-
-                if box.box_type in ("Normal", "Exact") and is_raw_text:
-                    query_raw += raw_text.strip().replace(' ', '+')
-
-        if with_keyword and len(query_parsed) > 31:
-            webbrowser.open(query_parsed)
-        if without_keyword and len(query_parsed) > 31:
-            webbrowser.open(query_raw)
+        self.browser.stop()
+        self.history.close()
+
+
+# +-------------------------+
+# |   scripted (headless)   |
+# +-------------------------+
+class CountingBrowser(webbrowser.BaseBrowser):
+    def __init__(self, name: str = "scripted"):
+        """
+        class of a web browser for the scripted runs, the tests and the benchmarks, it only counts the urls
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param name: the name of the browser, optional defaulted to "scripted"
+        :type: str
+        """
+        super().__init__(name)
+        self.nbr_opened = 0
+
+    def open(self, url: str, new: int = 0, autoraise: bool = True) -> bool:
+        self.nbr_opened += 1
+        return True
+
+
+def register_counting_browser(name: str = "scripted") -> CountingBrowser:
+    """
+    function to register a new CountingBrowser in webbrowser, a World given browser=name then opens no web browser
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param name: the name of the browser, optional defaulted to "scripted"
+    :type: str
+
+    :return: the browser registered, to read its nbr_opened
+    :type: CountingBrowser
+    """
+    browser = CountingBrowser(name)
+    webbrowser.register(name, None, browser)
+
+    return browser
+
+
+def _click(widget):
+    """
+    function to do what pygame_widgets does when a button is clicked
+    function used internally only
+
+    the mouse can't be pressed without a display, pygame_widgets reading it from pygame.mouse.get_pressed
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param widget: the button
+    :type: pygame_widgets.button.Button
+    """
+    widget.onClick(*widget.onClickParams)
+
+
+def _script(world: World):
+    """
+    function giving the scripted events of the frames, as a generator, one list of events per frame
+    the clicks are done on the world directly (see _click)
+    function used internally only
+
+    the script adds boxes, types in them, moves the mouse on them, moves, scrolls and deletes them and searches,
+    the boxes are reset once there are 40 of them
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param world: the world, created
+    :type: World
+
+    :return: the events of each frame
+    :type: generator of list of pygame.event.Event
+    """
+    words = ("butler", "search", "pygame", "widget")
+    nbr_cycles = 0
+
+    # searching with and without the keywords
+    world.menu_widgets["search_mode_selection"].selected = [True, True]
+
+    while True:
+        for name in ("normal_button", "exact_button", "avoid_button", "any_button"):
+            _click(world.menu_widgets[name])
+            yield []
+
+        # typing in the last box having a text input
+        text_boxes = [box for box in world.lst_box if box.has_widgets and "text" in box._input_names]
+        if text_boxes:
+            text_input = text_boxes[-1].text_input
+            world.focus(text_input)
+
+            for char in f"{words[nbr_cycles % len(words)]} ":
+                key = pygame.K_SPACE if char == ' ' else ord(char)
+                yield [pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char, mod=0, scancode=0)]
+                yield [pygame.event.Event(pygame.KEYUP, key=key, unicode=char, mod=0, scancode=0)]
+
+            text_input.selected = False
+
+        # the mouse going over the boxes
+        for x in range(0, world.screen_width, 80):
+            yield [pygame.event.Event(pygame.MOUSEMOTION, pos=(x, 300), rel=(80, 0), buttons=(0, 0, 0))]
+
+        _click(world.lst_box[world.scroll_index].right_button)
+        yield []
+        _click(world.menu_widgets["scroll_left_button"])
+        yield []
+        _click(world.menu_widgets["search_button"])
+        yield []
+        _click(world.lst_box[world.scroll_index].delete_button)
+        yield []
+
+        if len(world.lst_box) >= 40:
+            _click(world.menu_widgets["reset_button"])
+            yield []
+
+        nbr_cycles += 1
+
+
+def run_scripted(nbr_frames: int, screen_size: tuple[int, int] = (1280, 720)) -> dict:
+    """
+    function to run the app without display (SDL's dummy video driver) for nbr_frames frames,
+    replaying the scripted events of _script as fast as possible, to measure the whole UI
+
+    the history is written in a temporary directory and the web browser is replaced by one only counting the urls
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param nbr_frames: the number of frames
+    :type: int
+
+    :param screen_size: the size of the screen, optional defaulted to (1280, 720)
+    :type: tuple of 2 int
+
+    :return: the keys "frames", "time", "frame_p50", "frame_p95", "frame_p99", "max_frame_time" (in seconds),
+             "peak_rss" (in kilobytes, None if unknown), "boxes", "widgets" (see World.get_widget_stats),
+             "urls_opened" and "damage" (see damage_tracker.DamageTracker.get_stats)
+    :type: dict
+    """
+    if nbr_frames <= 0:
+        raise ValueError("nbr_frames must be strictly positive")
+
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    browser = register_counting_browser()
+
+    pygame.init()
+    screen = pygame.display.set_mode(screen_size)
+
+    # no frame cap and no waiting for the events, every frame time is kept
+    # (the work times, measured with time.perf_counter, pygame.time.Clock only counts in milliseconds)
+    scheduler = frame_scheduler.FrameScheduler(max_fps=0, idle_timeout=0, nbr_frames_kept=nbr_frames)
+
+    with tempfile.TemporaryDirectory() as history_dir:
+        world = World(screen, screen_size, repeat_search_window=0.0,
+                      history_path=os.path.join(history_dir, "history"), browser="scripted")
+        world.on_user_create()
+
+        start = time.perf_counter()
+
+        script = _script(world)
+        for _ in range(nbr_frames):
+            for event in next(script):
+                pygame.event.post(event)
+
+            lst_event = scheduler.get_events(world.is_animating())
+
+            world.on_user_update(scheduler.elapsed_time, lst_event, scheduler.get_stats())
+            world.update_widgets(lst_event)
+            world.damage.present()
+
+            scheduler.tick()
+
+        total_time = time.perf_counter() - start
+
+        # before closing the world, its boxes erase themselves
+        widget_stats, damage_stats = world.get_widget_stats(), world.damage.get_stats()
+        world.close()
+
+        percentiles = scheduler.get_percentiles((50, 95, 99))
+        report = {
+            "frames":         scheduler.nbr_frames,
+            "time":           total_time,
+            "frame_p50":      percentiles["work_p50"],
+            "frame_p95":      percentiles["work_p95"],
+            "frame_p99":      percentiles["work_p99"],
+            "max_frame_time": max(scheduler.work_times),
+            "peak_rss":       resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource is not None else None,
+            "boxes":          len(world.lst_box),
+            "widgets":        widget_stats,
+            "urls_opened":    browser.nbr_opened,
+            "damage":         damage_stats,
+        }
+
+    pygame.quit()
+
+    return report
 
 
 def main(*argv, **kwargv):
+    parser = argparse.ArgumentParser(prog="main")
+    parser.add_argument("--fps", type=int, default=60, help="number maximum of frames per second, 0 for no cap")
+    parser.add_argument("--idle-timeout", type=float, default=1.0,
+                        help="seconds between two frames when nothing happens, 0 to never wait for the events")
+    parser.add_argument("--scripted", type=int, metavar="N_FRAMES",
+                        help="run N_FRAMES frames of scripted events without display, and print the frame times")
+    parser.add_argument("--hud", action="store_true",
+                        help="show the performance overlay at the start (F3 to show or hide it)")
+    parser.add_argument("--profile-frames", type=int, default=300,
+                        help="number of frames profiled after pressing F4, written in a .prof file")
+    parser.add_argument("--profile-dir", default='.', help="directory of the .prof files")
+    args = parser.parse_args(argv[1:])
+
+    if args.profile_frames <= 0:
+        parser.error("--profile-frames must be strictly positive")
+
+    if args.scripted is not None:
+        if args.scripted <= 0:
+            parser.error("--scripted must be strictly positive")
+
+        report = run_scripted(args.scripted)
+
+        print(f"frames : {report['frames']} in {report['time']:.2f} s")
+        print(f"frame times : p50 {report['frame_p50'] * 1000:.2f} ms, p95 {report['frame_p95'] * 1000:.2f} ms, "
+              f"p99 {report['frame_p99'] * 1000:.2f} ms, max {report['max_frame_time'] * 1000:.2f} ms")
+        print(f"peak RSS : {'unknown' if report['peak_rss'] is None else str(report['peak_rss']) + ' kB'}")
+        print(f"boxes : {report['boxes']}, widgets : {report['widgets']}")
+        print(f"urls opened : {report['urls_opened']}, display updates : {report['damage']}")
+        return 0
+
     pygame.init()
 
     screen_size = width, height = (1280, 720)
     screen = pygame.display.set_mode(screen_size)
     pygame.display.set_caption("Google-Search's Butler")
 
-    # structure to use and keep track of time
-    delta_time = [time.time(), time.time(), lambda: delta_time[1] - delta_time[0]]
+    # to cap the frames and sleep while nothing happens
+    scheduler = frame_scheduler.FrameScheduler(max_fps=args.fps, idle_timeout=args.idle_timeout)
 
     # creating and starting the world
     world = World(screen, screen_size)
     world.on_user_create()
 
+    # F3 shows the performance overlay, F4 profiles the next frames
+    hud = perf_hud.PerfHud(world, is_visible=args.hud, profile_frames=args.profile_frames,
+                           profile_dir=args.profile_dir)
+
     # program/pygame loop
     running_state = True
     while running_state:
 
-        lst_event = pygame.event.get()
+        lst_event = scheduler.get_events(world.is_animating())
+        hud.begin_frame(lst_event)
         for event in lst_event:
 
             if event.type == pygame.QUIT:
                 running_state = False
 
         # here's where the magic happen
-        world.on_user_update(delta_time[2](), lst_event)
+        world.on_user_update(scheduler.elapsed_time, lst_event, scheduler.get_stats())
+
+        # only the parts of the screen that changed are presented, by the overlay to profile it as well
+        world.update_widgets(lst_event)
+        hud.end_frame()
+
+        scheduler.tick()
 
-        pygame_widgets.update(lst_event)
-        pygame.display.flip()
+    # the frames profiled until now, if the app is quit during a profile
+    hud.close()
 
-        # update the delta_time
-        delta_time[0], delta_time[1] = delta_time[1], time.time()
+    # let the web browser open the last queries, and unregister the widgets
+    world.close()
 
     # to be sure we quit our interface
     pygame.quit()
@@ -415,4 +1237,4 @@ def main(*argv, **kwargv):
 
 
 if __name__ == '__main__':
-    main(*sys.argv)
+    sys.exit(main(*sys.argv))
@@ -0,0 +1,291 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+file to show how the app performs while it is used, and to profile it
+
+an overlay in the top left corner of the window shows the frame times, the events, the widgets, the text cache
+and the drawing of the last frames, and a key profiles the next frames with cProfile into a .prof file
+(to read with pstats or snakeviz for instance)
+
+    F3 : show or hide the overlay
+    F4 : profile the next frames
+
+this module contains :
+
+    - PerfHud : a class to draw the overlay and to profile the frames
+"""
+
+import collections
+import cProfile
+import os
+import time
+
+import pygame
+import pygame_widgets
+
+import graphic_tool_import as gti
+from text_cache import text_cache
+
+
+class PerfHud(object):
+    def __init__(self,
+                 world,
+                 is_visible:     bool = False,
+                 profile_frames: int = 300,
+                 profile_dir:    str = '.',
+                 toggle_key:     int = pygame.K_F3,
+                 profile_key:    int = pygame.K_F4):
+        """
+        class to draw an overlay of the performances of the app and to profile its frames, used as :
+
+            while running:
+                lst_event = ...
+                hud.begin_frame(lst_event)
+                ... (update and draw the frame)
+                hud.end_frame()  # it presents the frame
+                scheduler.tick()
+
+            hud.close()
+
+        the overlay shows :
+            - the mean and the max time used by the last frames, and the frames per second
+            - the number of events of the last frame, and by frame on average
+            - the number of widgets in pygame_widgets, and how many listened to the last frame
+            - the hit rate of the rendered texts cache
+            - the rectangles drawn and the widgets drawn during the last frame
+
+        Please refer to the documentation of each method for further explanation
+        You can do that with help(PerfHud.{method_name})
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        Methods:
+
+            .begin_frame(lst_event)
+                handle the keys, and start profiling if asked
+
+            .end_frame()
+                draw the overlay, present the frame and stop profiling
+
+            .close()
+                write the profile running, if any
+
+            .toggle()
+                show or hide the overlay
+
+            .start_profile()
+                profile the next profile_frames frames
+
+            .get_stats() -> dict
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param world: the World class from the main.py class in the Google butler app
+        :type: the World class from the main.py class in the Google butler app
+
+        :param is_visible: is the overlay shown at the start, optional defaulted to False
+        :type: bool
+        :param profile_frames: the number of frames profiled, optional defaulted to 300
+        :type: int
+        :param profile_dir: the directory where the .prof files are written, optional defaulted to '.'
+        :type: str
+        :param toggle_key: the key showing or hiding the overlay, optional defaulted to pygame.K_F3
+        :type: int
+        :param profile_key: the key starting a profile, optional defaulted to pygame.K_F4
+        :type: int
+        """
+        if profile_frames <= 0:
+            raise ValueError("profile_frames must be strictly positive")
+
+        self.world = world
+        self.is_visible = is_visible
+        self.profile_frames = profile_frames
+        self.profile_dir = profile_dir
+        self.toggle_key = toggle_key
+        self.profile_key = profile_key
+
+        self.rect = pygame.Rect(5, 5, 0, 0)  # where the overlay was drawn the last time
+        self.font_size = 20
+
+        self.event_counts = collections.deque(maxlen=120)
+
+        self._profiler = None
+        self._nbr_profiled_frames = 0
+        self.last_profile_path = None
+
+    def begin_frame(self, lst_event: list):
+        """
+        method to call at the start of the frame, with its events
+
+        it shows or hides the overlay and starts profiling when their key is pressed,
+        the profiling includes the frame it started in
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param lst_event: list of all the pygame event
+        :type: list
+        """
+        self.event_counts.append(len(lst_event))
+
+        for event in lst_event:
+            if event.type != pygame.KEYDOWN:
+                continue
+
+            if event.key == self.toggle_key:
+                self.toggle()
+            elif event.key == self.profile_key:
+                self.start_profile()
+
+        if self._profiler is not None:
+            self._profiler.enable()
+
+    def end_frame(self):
+        """
+        method to call at the end of the frame, after the widgets were drawn, instead of world.damage.present
+
+        it draws the overlay, presents the frame with world.damage.present, then stops profiling the frame
+        and writes the profile when the last frame of it is done
+
+        the update of the display is often a large part of the frame, so it is profiled,
+        the wait for the next frame (FrameScheduler.tick) isn't
+        """
+        if self.is_visible:
+            self._draw()
+
+        self.world.damage.present()
+
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._nbr_profiled_frames += 1
+
+            if self._nbr_profiled_frames >= self.profile_frames:
+                self._save_profile()
+
+    def close(self):
+        """
+        method to call when the app quits, it writes the profile running, with the frames profiled until now
+        """
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._save_profile()
+
+    def toggle(self):
+        """
+        method to show the overlay if it is hidden, and to hide it otherwise
+        """
+        self.is_visible = not self.is_visible
+
+        if not self.is_visible:
+            self.world.restore_background(self.rect)
+
+    def start_profile(self):
+        """
+        method to profile the next profile_frames frames, nothing happens if a profile is already running
+        """
+        if self._profiler is not None:
+            return
+
+        self._profiler = cProfile.Profile()
+        self._nbr_profiled_frames = 0
+
+    def get_stats(self) -> dict:
+        """
+        method to obtain the state of the overlay and of the profiling
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the keys "visible", "profiling", "profiled_frames", "last_profile_path" and "mean_events"
+        :type: dict
+        """
+        return {
+            "visible":           self.is_visible,
+            "profiling":         self._profiler is not None,
+            "profiled_frames":   self._nbr_profiled_frames,
+            "last_profile_path": self.last_profile_path,
+            "mean_events":       sum(self.event_counts) / len(self.event_counts) if self.event_counts else None,
+        }
+
+    def _save_profile(self):
+        """
+        method to write the profile in profile_dir, as profile_{date}_{time}.prof
+        method used internally only
+        """
+        os.makedirs(self.profile_dir, exist_ok=True)
+
+        path = os.path.join(self.profile_dir, f"profile_{time.strftime('%Y%m%d_%H%M%S')}.prof")
+        self._profiler.dump_stats(path)
+
+        self._profiler = None
+        self.last_profile_path = path
+
+    def _get_lines(self) -> list[str]:
+        """
+        method to obtain the lines of the overlay
+        method used internally only
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the lines
+        :type: list of str
+        """
+        frame_stats = self.world.frame_stats
+        text_stats = text_cache.get_stats()
+        damage_stats = self.world.damage.get_stats()
+
+        mean_work_time = frame_stats.get("mean_work_time")
+        max_work_time = frame_stats.get("max_work_time")
+        if mean_work_time is None:
+            frame_line = "frame : -"
+        else:
+            frame_line = (f"frame : {mean_work_time * 1000:.2f} ms (max {max_work_time * 1000:.2f} ms), "
+                          f"{frame_stats.get('fps', 0):.0f} fps")
+
+        mean_events = self.get_stats()["mean_events"] or 0
+        hit_rate = text_stats["hit_rate"]
+
+        lines = [
+            frame_line,
+            f"events : {self.event_counts[-1] if self.event_counts else 0} (mean {mean_events:.1f})",
+            f"widgets : {len(pygame_widgets.WidgetHandler.getWidgets())} "
+            f"({self.world.nbr_listening_widgets} listening)",
+            f"text cache : {'-' if hit_rate is None else f'{hit_rate * 100:.1f} %'} hits, "
+            f"{text_stats['renders']} texts",
+            f"draws : {damage_stats['last_added']} rects, {self.world.nbr_drawn_widgets} widgets",
+        ]
+
+        if self._profiler is not None:
+            lines.append(f"profiling : {self._nbr_profiled_frames} / {self.profile_frames}")
+        elif self.last_profile_path is not None:
+            lines.append(f"profile : {self.last_profile_path}")
+
+        return lines
+
+    def _draw(self):
+        """
+        method to draw the overlay, on top of the rest of the frame
+        method used internally only
+
+        the numbers change at every frame, so they are rendered without the text cache to not fill it
+        """
+        font = text_cache.get_font(None, self.font_size)
+        renders = [font.render(line, True, gti.colors["white"]) for line in self._get_lines()]
+        line_height = font.get_linesize() + 1
+
+        # the overlay grows with its lines, the previous one is cleared as well
+        rect = pygame.Rect(self.rect.topleft, (8 + max(render.get_width() for render in renders),
+                                               8 + len(renders) * line_height))
+        self.world.restore_background(rect.union(self.rect))
+        self.rect = rect
+
+        for i, render in enumerate(renders):
+            self.world.screen.blit(render, (rect.x + 4, rect.y + 4 + i * line_height))
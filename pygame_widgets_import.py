@@ -14,10 +14,20 @@ see on gitHub :
 
 this module is to handle all the importing from the pygame_widgets package and make it such that I can just import
 everything as if it was one file and not a package of multiple file
+
+pygame_widgets.popup creates a tkinter window when imported, which fails when there is no display
+(for instance under the SDL dummy video driver used by the benchmarks) : Popup and PopupType are then None
 """
 
+import tkinter
+
 from pygame_widgets.button import *
 from pygame_widgets.textbox import *
 from pygame_widgets.dropdown import *
 from pygame_widgets.selection import *
-from pygame_widgets.popup import *
+
+try:
+    from pygame_widgets.popup import *
+except tkinter.TclError:
+    Popup = None
+    PopupType = None
@@ -0,0 +1,234 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+file to remember the queries already compiled, and when they were last opened in the web browser
+
+this module contains :
+
+    - make_signature : a function to obtain the signature of a list of box specs, usable as a dictionary key
+
+    - QueryCache : a class to cache the compiled queries, with an LRU and a TTL eviction
+"""
+
+import collections
+import time
+
+
+# +------------------------+
+# |   signature function   |
+# +------------------------+
+def make_signature(specs: [list, tuple]) -> tuple:
+    """
+    function to obtain the signature of a list of box specs (see the query_compiler module)
+
+    two lists of boxes with the same types and the same inputs have the same signature
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param specs: the box specs, in the order of the boxes
+    :type: list or tuple of dict
+
+    :return: the signature
+    :type: tuple
+    """
+    signature = []
+
+    for spec in specs:
+        inputs = tuple(sorted((key, value) for key, value in spec.items() if key != "type"))
+        signature.append((spec.get("type", "Normal").capitalize(), inputs))
+
+    return tuple(signature)
+
+
+# +-----------------+
+# |   Query cache   |
+# +-----------------+
+class QueryCache(object):
+    def __init__(self, max_size: int = 256, ttl: float = 600.0):
+        """
+        class to cache the compiled queries by the signature of their boxes (see make_signature)
+
+        each entry is a dictionary with the keys :
+            "query_parsed", "query_raw", "errors" : what the compilation gave
+            "created" : when the entry was added, in seconds (time.monotonic)
+            "dispatched" : a dictionary of the last time the query was opened, for each search mode
+
+        the least recently used entries are evicted past max_size entries, and the entries older than ttl seconds
+        are compiled again
+
+        Please refer to the documentation of each method for further explanation
+        You can do that with help(QueryCache.{method_name})
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        Methods:
+
+            .get(signature) -> entry or None
+
+            .put(signature, query_parsed, query_raw, errors) -> entry
+
+            .is_repeat(entry, search_mode, window) -> bool
+                was the query opened with this search mode less than window seconds ago
+
+            .mark_dispatched(entry, search_mode)
+
+            .clear()
+
+            .get_stats() -> dict
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param max_size: the number maximum of entries, optional defaulted to 256
+        :type: int
+        :param ttl: the time to live of an entry in seconds, optional defaulted to 600.0
+        :type: float
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be strictly positive")
+        if ttl <= 0:
+            raise ValueError("ttl must be strictly positive")
+
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._entries = collections.OrderedDict()
+
+        self.nbr_hits = 0
+        self.nbr_misses = 0
+        self.nbr_evictions = 0
+
+    def __len__(self) -> int:
+        """
+        Implement len(self)
+        """
+        return len(self._entries)
+
+    def get(self, signature: tuple) -> [dict, None]:
+        """
+        method to obtain the entry of a signature, if it is in the cache and not expired
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param signature: the signature of the boxes
+        :type: tuple
+
+        :return: the entry, or None if there is none
+        :type: dict or None
+        """
+        entry = self._entries.get(signature)
+
+        if entry is not None and time.monotonic() - entry["created"] > self.ttl:
+            del self._entries[signature]
+            self.nbr_evictions += 1
+            entry = None
+
+        if entry is None:
+            self.nbr_misses += 1
+            return None
+
+        self._entries.move_to_end(signature)
+        self.nbr_hits += 1
+        return entry
+
+    def put(self, signature: tuple, query_parsed: str, query_raw: str, errors: list) -> dict:
+        """
+        method to add the compiled queries of a signature to the cache
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param signature: the signature of the boxes
+        :type: tuple
+        :param query_parsed: the query with the keywords
+        :type: str
+        :param query_raw: the query without the keywords
+        :type: str
+        :param errors: the (index, error) of the boxes with an invalid input
+        :type: list
+
+        :return: the new entry
+        :type: dict
+        """
+        entry = {
+            "query_parsed": query_parsed,
+            "query_raw":    query_raw,
+            "errors":       errors,
+            "created":      time.monotonic(),
+            "dispatched":   {},
+        }
+
+        self._entries[signature] = entry
+        self._entries.move_to_end(signature)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.nbr_evictions += 1
+
+        return entry
+
+    @staticmethod
+    def is_repeat(entry: dict, search_mode, window: float) -> bool:
+        """
+        method to know if the query of an entry was opened with a search mode less than window seconds ago
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param entry: the entry of the query
+        :type: dict
+        :param search_mode: anything hashable describing how the query is opened
+        :param window: the time in seconds
+        :type: float
+
+        :return: True if it is a repeat, False otherwise
+        :type: bool
+        """
+        last = entry["dispatched"].get(search_mode)
+
+        return last is not None and time.monotonic() - last < window
+
+    @staticmethod
+    def mark_dispatched(entry: dict, search_mode):
+        """
+        method to remember that the query of an entry has been opened now with a search mode
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param entry: the entry of the query
+        :type: dict
+        :param search_mode: anything hashable describing how the query is opened
+        """
+        entry["dispatched"][search_mode] = time.monotonic()
+
+    def clear(self):
+        """
+        method to remove every entry, the counters are kept
+        """
+        self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """
+        method to obtain the counters of the cache
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the keys "size", "hits", "misses", "evictions" and "hit_rate"
+        :type: dict
+        """
+        total = self.nbr_hits + self.nbr_misses
+
+        return {
+            "size":      len(self._entries),
+            "hits":      self.nbr_hits,
+            "misses":    self.nbr_misses,
+            "evictions": self.nbr_evictions,
+            "hit_rate":  self.nbr_hits / total if total else None,
+        }
@@ -0,0 +1,495 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+file to turn the content of the boxes into a query, without any widget
+
+this module doesn't import pygame nor pygame_widgets, such that it can be used headless by scripts
+
+a box is described by a box spec, a plain dictionary :
+
+    - {"type": "Normal", "text": "..."}
+    - {"type": "Exact",  "text": "..."}
+    - {"type": "Avoid",  "text": "..."}
+    - {"type": "Any"}
+    - {"type": "Before", "year": "...", "month": "...", "day": "..."}
+    - {"type": "After",  "year": "...", "month": "...", "day": "..."}
+    - {"type": "Range",  "first_year": "...", "first_month": "...", "first_day": "...",
+                         "last_year": "...",  "last_month": "...",  "last_day": "..."}
+
+this module contains :
+
+    - SEARCH_URL : the beginning of every query
+
+    - DAYS_IN_MONTH : the calendar table used to test the days
+
+    - is_leap_year : a function to know if a year is a leap year
+
+    - is_number : a function to know if a date input is a number
+
+    - encode_text : a function to encode the text typed in a box so that it can be put in an url
+
+    - test_and_handle_ymd : a function to test and normalise a date input, as yyyy, mm and dd
+
+    - parse_normal, parse_exact, parse_avoid, parse_any, parse_date, parse_date_range :
+        functions to parse the input of each type of box
+
+    - QueryCompiler : a class to compile a list of box specs into the parsed and raw queries
+"""
+
+import functools
+import string
+
+SEARCH_URL = "http://www.google.com/search?q="
+
+# number maximum of days of each month, for the common years then for the leap years
+# the month 0 stands for an unknown month, so any day up to 31 is accepted
+DAYS_IN_MONTH = (
+    (31, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+    (31, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+)
+
+
+# the characters which don't need to be encoded in an url (RFC 3986 unreserved characters), and the space
+_URL_SAFE_BYTES = (string.ascii_letters + string.digits + "-_.~ ").encode("ascii")
+
+# the encoding of every byte to encode, the non ASCII characters are encoded byte by byte from their UTF-8 encoding
+_URL_ESCAPES = {byte: f"%{byte:02X}".encode("ascii") for byte in range(256) if byte not in _URL_SAFE_BYTES}
+_PERCENT = ord('%')
+
+# the short texts are cached by encode_text, the cache holds at most 4096 of them so its memory is bounded by their
+# size as well, the longer ones have a cache of their own of a few texts
+_MAX_CACHED_LENGTH = 256
+
+
+# +------------------+
+# |   url encoding   |
+# +------------------+
+def encode_text(text: str, space: str = '+') -> str:
+    """
+    function to encode the text typed in a box so that it can be put in an url
+
+    every character that isn't a letter, a digit or one of - _ . ~ is percent encoded (as UTF-8),
+    except the spaces which are replaced by space
+
+    the bytes to encode are found in one pass with bytes.translate, a text without any is only a str.replace of its
+    spaces, otherwise only the bytes found in the text cost a bytes.replace
+    the results are cached since the same texts are compiled again and again, the long texts in a smaller cache
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param text: the text to encode
+    :type: str
+
+    :param space: what replaces the spaces, optional defaulted to '+'
+    :value: '+' or '-'
+    :type: str
+
+    :return: the encoded text
+    :type: str
+    """
+    if len(text) <= _MAX_CACHED_LENGTH:
+        return _encode_text_cached(text, space)
+    return _encode_long_text_cached(text, space)
+
+
+def _encode_text(text: str, space: str = '+') -> str:
+    """
+    function to encode a text, see encode_text, without the cache
+    function used internally only
+    """
+    encoded = text.encode("utf-8")
+
+    # the bytes to encode, the safe ones are removed in C
+    unsafe = encoded.translate(None, _URL_SAFE_BYTES)
+    if not unsafe:
+        return text.replace(' ', space)
+
+    # the distinct bytes to encode, each one is removed from the others once found
+    bytes_found = []
+    while unsafe:
+        bytes_found.append(unsafe[0])
+        unsafe = unsafe.translate(None, unsafe[:1])
+
+    # '%' comes first so that the escapes aren't encoded twice
+    if _PERCENT in bytes_found:
+        bytes_found.remove(_PERCENT)
+        encoded = encoded.replace(b'%', b"%25")
+
+    # the bytes are replaced rather than the characters, bytes.replace is several times faster than str.replace
+    for byte in bytes_found:
+        encoded = encoded.replace(bytes((byte,)), _URL_ESCAPES[byte])
+
+    return encoded.replace(b' ', space.encode("utf-8")).decode("utf-8")
+
+
+_encode_text_cached = functools.lru_cache(maxsize=4096)(_encode_text)
+_encode_long_text_cached = functools.lru_cache(maxsize=8)(_encode_text)
+
+
+# +---------------------+
+# |   tests functions   |
+# +---------------------+
+def is_leap_year(year: int) -> bool:
+    """
+    function to know if a year is a leap year in the gregorian calendar
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param year: the year
+    :type: int
+
+    :return: True if the year is a leap year, False otherwise
+    :type: bool
+    """
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def is_number(text: str) -> bool:
+    """
+    function to know if a date input, once its spaces are removed, is a number : made of decimal digits only,
+    the ones int() can read (so '²' or '½' aren't numbers)
+
+    used by test_and_handle_ymd and by the bulk_dates module, so that they read the inputs the same way
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param text: the input
+    :type: str
+
+    :return: True if the input is a number, False otherwise (the empty input isn't a number)
+    :type: bool
+    """
+    return text.isdecimal()
+
+
+def test_and_handle_ymd(year_input, month_input, day_input) -> tuple[str, str, str]:
+    """
+    function to test the year, month and day for the BoxDate and BoxDateRange
+    and if needed, modify them or raise error
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param year_input: the raw year input from the input of the Box
+    :type: str
+    :param month_input: the raw mont input from the input of the Box
+    :type: str
+    :param day_input: the raw day input from the input of the Box
+    :type: str
+
+    :return: the tested input, zero padded as yyyy, mm and dd
+    :type: tuple[str, str, str]
+    """
+    year = year_input  .replace(' ', '')[:4]
+    month = month_input.replace(' ', '')[:2]
+    day = day_input    .replace(' ', '')[:2]
+
+    if not is_number(year):
+        raise ValueError("Year must be a number")
+
+    if not is_number(month):
+        month = '00'
+
+    if not is_number(day):
+        day = '00'
+
+    if not (0 <= int(month) <= 12):
+        raise ValueError("Month must be between 0 and 12")
+
+    max_day = DAYS_IN_MONTH[is_leap_year(int(year))][int(month)]
+    if not (0 <= int(day) <= max_day):
+        raise ValueError(f"Day must be between 0 and {max_day}")
+
+    return year.zfill(4), month.zfill(2), day.zfill(2)
+
+
+# +-----------------------+
+# |   parsing functions   |
+# +-----------------------+
+def parse_normal(text: str) -> str:
+    """
+    function to parse the input of a Normal box
+
+    parsing :
+        ' ' -> '+'
+        the other special characters are encoded (see encode_text)
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param text: the raw input of the box
+    :type: str
+
+    :return: the parsed input
+    :type: str
+    """
+    return encode_text(text.strip())
+
+
+def parse_exact(text: str) -> str:
+    """
+    function to parse the input of an Exact box
+
+    parsing :
+        ' ' -> '+'
+        the other special characters are encoded (see encode_text)
+        the text get surrounded by double quotes "" [...] ""
+            (must use "" ... "" instead of " ... " to trick webbrowser.open())
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param text: the raw input of the box
+    :type: str
+
+    :return: the parsed input
+    :type: str
+    """
+    return '""' + encode_text(text) + '""'
+
+
+def parse_avoid(text: str) -> str:
+    """
+    function to parse the input of an Avoid box
+
+    parsing :
+        ' ' -> '-'
+        the other special characters are encoded (see encode_text)
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param text: the raw input of the box
+    :type: str
+
+    :return: the parsed input
+    :type: str
+    """
+    return encode_text(text, space='-')
+
+
+def parse_any() -> str:
+    """
+    function to parse an Any box, it has no input and always gives ' * '
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :return: ' * '
+    :type: str
+    """
+    return '*'
+
+
+def parse_date(box_type: str, year: str, month: str, day: str) -> str:
+    """
+    function to parse the input of a Before or After box
+
+    parsing :
+        [" before " or " after "]:yyyy-mm-dd
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param box_type: "Before" or "After"
+    :type: str
+    :param year: the raw year input
+    :type: str
+    :param month: the raw month input
+    :type: str
+    :param day: the raw day input
+    :type: str
+
+    :return: the parsed input
+    :type: str
+    """
+    year, month, day = test_and_handle_ymd(year, month, day)
+
+    return f"{box_type.lower()}:{year}-{month}-{day}"
+
+
+def parse_date_range(first_year: str, first_month: str, first_day: str,
+                     last_year:  str, last_month:  str, last_day:  str) -> str:
+    """
+    function to parse the input of a Range box
+
+    parsing :
+        yyyy-mm-dd::yyyy-mm-dd
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :return: the parsed input
+    :type: str
+    """
+    first_year, first_month, first_day = test_and_handle_ymd(first_year, first_month, first_day)
+    last_year, last_month, last_day = test_and_handle_ymd(last_year, last_month, last_day)
+
+    return f"{first_year}-{first_month}-{first_day}::{last_year}-{last_month}-{last_day}"
+
+
+# +--------------------+
+# |   Query compiler   |
+# +--------------------+
+class QueryCompiler(object):
+    def __init__(self, base_url: str = SEARCH_URL):
+        """
+        class to compile a list of box specs into a query, the same way World.search does it with the boxes
+
+        It doesn't need any widget, display nor font, so it can be used by scripts to compile queries in bulk
+
+        Please refer to the documentation of each method for further explanation
+        You can do that with help(QueryCompiler.{method_name})
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        Methods:
+
+            .compile_box(spec) -> (text, raw_text)
+
+            .compile_fragment(spec) -> (box_type, text, raw_text)
+
+            .join(fragments) -> (query_parsed, query_raw)
+
+            .compile(specs) -> (query_parsed, query_raw, errors)
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param base_url: the beginning of every query, optional defaulted to SEARCH_URL
+        :type: str
+        """
+        self.base_url = base_url
+
+    @staticmethod
+    def compile_box(spec: dict) -> tuple[str, str]:
+        """
+        method to obtain the parsed text and the raw text of a single box spec
+
+        the raw text is only used by Normal and Exact boxes, it is '' for every other type
+
+        raise a ValueError if the input of the box isn't valid
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param spec: the box spec
+        :type: dict
+
+        :return: the parsed text and the raw text
+        :type: tuple[str, str]
+        """
+        box_type = spec.get("type", "Normal").capitalize()
+
+        if box_type == "Normal":
+            text = spec.get("text", '')
+            return parse_normal(text), text
+
+        if box_type == "Exact":
+            text = spec.get("text", '')
+            return parse_exact(text), text
+
+        if box_type == "Avoid":
+            return parse_avoid(spec.get("text", '')), ''
+
+        if box_type == "Any":
+            return parse_any(), ''
+
+        if box_type in ("Before", "After"):
+            return parse_date(box_type, spec.get("year", ''), spec.get("month", ''), spec.get("day", '')), ''
+
+        if box_type == "Range":
+            return parse_date_range(
+                spec.get("first_year", ''), spec.get("first_month", ''), spec.get("first_day", ''),
+                spec.get("last_year", ''),  spec.get("last_month", ''),  spec.get("last_day", '')
+            ), ''
+
+        raise ValueError(f"Unknown box type : {spec.get('type')}")
+
+    @classmethod
+    def compile_fragment(cls, spec: dict) -> tuple[str, str, str]:
+        """
+        method to obtain the fragment of a single box spec, what the box adds to the queries
+
+        the fragment only depends on the inputs of the box, so a box can keep it until one of its inputs changes
+
+        raise a ValueError if the input of the box isn't valid
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param spec: the box spec
+        :type: dict
+
+        :return: the box type, the parsed text and the raw text ('' if the box type doesn't use it)
+        :type: tuple[str, str, str]
+        """
+        text, raw_text = cls.compile_box(spec)
+        box_type = spec.get("type", "Normal").capitalize()
+
+        # raw text only matters for the boxes with a free text input
+        raw_text = encode_text(raw_text.strip()) if box_type in ("Normal", "Exact") else ''
+
+        return box_type, text, raw_text
+
+    def join(self, fragments: [list, tuple]) -> tuple[str, str]:
+        """
+        method to assemble the fragments of the boxes into the parsed query and the raw query, with a single join each
+
+        a fragment can be None for a box with an invalid input, it is then skipped
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param fragments: the fragments, in the order of the boxes
+        :type: list or tuple of fragments (see compile_fragment) or None
+
+        :return: the parsed query and the raw query
+        :type: tuple[str, str]
+        """
+        parts_parsed = [self.base_url]
+        parts_raw = [self.base_url]
+
+        for i, fragment in enumerate(fragments):
+            if fragment is None:
+                continue
+
+            box_type, text, raw_text = fragment
+
+            if text:
+                if i:
+                    parts_parsed.append('-' if box_type == "Avoid" else '+')
+                parts_parsed.append(text)
+
+            if raw_text:
+                if i:
+                    parts_raw.append('+')
+                parts_raw.append(raw_text)
+
+        return ''.join(parts_parsed), ''.join(parts_raw)
+
+    def compile(self, specs: [list, tuple]) -> tuple[str, str, list]:
+        """
+        method to compile a list of box specs into the parsed query and the raw query
+
+        the boxes with an invalid input are skipped, and their error is returned with their index
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param specs: the box specs, in the order of the boxes
+        :type: list or tuple of dict
+
+        :return: the parsed query, the raw query and the list of (index, error) of the skipped boxes
+        :type: tuple[str, str, list]
+        """
+        fragments = []
+        errors = []
+
+        for i, spec in enumerate(specs):
+            try:
+                fragments.append(self.compile_fragment(spec))
+
+            except ValueError as error:
+                fragments.append(None)
+                errors.append((i, error))
+
+        return *self.join(fragments), errors
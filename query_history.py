@@ -0,0 +1,193 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+file to keep the history of the searches on the disk
+
+the history is made of two files :
+
+    - {path}.jsonl : the searches, appended one per line as {"time": ..., "query": ..., "boxes": [box specs]}
+    - {path}.idx : the offset of each line in the .jsonl file, as 8 bytes little endian unsigned integers
+
+the index is memory-mapped, so reading any search, from the first to the last one, costs the same
+whatever the number of searches in the history
+
+this module contains :
+
+    - DEFAULT_HISTORY_PATH : where the app keeps its history if not told otherwise
+
+    - QueryHistory : a class to append searches to the history and read them back
+"""
+
+import json
+import mmap
+import os
+import struct
+import time
+
+DEFAULT_HISTORY_PATH = os.path.join(os.path.expanduser('~'), ".google_search_butler", "history")
+
+_OFFSET = struct.Struct("<Q")
+
+
+class QueryHistory(object):
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH):
+        """
+        class to append the searches to a history on the disk and read them back
+
+        Please refer to the documentation of each method for further explanation
+        You can do that with help(QueryHistory.{method_name})
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        Methods:
+
+            .append(specs, query) -> index
+                add a search at the end of the history
+
+            .get(index) -> entry
+
+            .last(count) -> list of entries
+                the count last searches, the most recent first
+
+            .close()
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param path: the path of the history files, without extension, optional defaulted to DEFAULT_HISTORY_PATH
+        :type: str
+        """
+        self.path = path
+        self.data_path = path + ".jsonl"
+        self.index_path = path + ".idx"
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._data_file = open(self.data_path, "a+b")
+        self._index_file = open(self.index_path, "a+b")
+
+        # an index cut by a crash in the middle of a write loses its last, incomplete offset
+        index_size = os.path.getsize(self.index_path)
+        if index_size % _OFFSET.size:
+            self._index_file.truncate(index_size - index_size % _OFFSET.size)
+
+        self._index_map = None
+        self._index_map_size = 0
+
+    def __len__(self) -> int:
+        """
+        Implement len(self)
+        """
+        return self._index_file.seek(0, os.SEEK_END) // _OFFSET.size
+
+    def append(self, specs: [list, tuple], query: str) -> int:
+        """
+        method to add a search at the end of the history
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param specs: the box specs of the search (see the query_compiler module)
+        :type: list or tuple of dict
+        :param query: the compiled query
+        :type: str
+
+        :return: the index of the search in the history
+        :type: int
+        """
+        line = json.dumps({"time": time.time(), "query": query, "boxes": list(specs)}, ensure_ascii=False) + '\n'
+
+        offset = self._data_file.seek(0, os.SEEK_END)
+        self._data_file.write(line.encode("utf-8"))
+        self._data_file.flush()
+
+        # the offset is written after the line, so that the index never points to a line not written yet
+        self._index_file.seek(0, os.SEEK_END)
+        self._index_file.write(_OFFSET.pack(offset))
+        self._index_file.flush()
+
+        return len(self) - 1
+
+    def get(self, index: int) -> dict:
+        """
+        method to read a search of the history
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param index: the index of the search, negative indices count from the end like for a list
+        :type: int
+
+        :return: the search, {"time": ..., "query": ..., "boxes": [box specs]}
+        :type: dict
+        """
+        length = len(self)
+
+        if index < 0:
+            index += length
+        if not (0 <= index < length):
+            raise IndexError("history index out of range")
+
+        offset, = _OFFSET.unpack_from(self._get_index_map(length), index * _OFFSET.size)
+
+        self._data_file.seek(offset)
+        return json.loads(self._data_file.readline().decode("utf-8"))
+
+    def last(self, count: int) -> list[dict]:
+        """
+        method to read the last searches of the history
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param count: the number of searches
+        :type: int
+
+        :return: the searches, the most recent first
+        :type: list of dict
+        """
+        if count < 0:
+            raise ValueError("count must be positive")
+
+        return [self.get(-i) for i in range(1, min(count, len(self)) + 1)]
+
+    def close(self):
+        """
+        method to close the history files
+        """
+        if self._index_map is not None:
+            self._index_map.close()
+            self._index_map = None
+
+        self._data_file.close()
+        self._index_file.close()
+
+    def _get_index_map(self, length: int) -> mmap.mmap:
+        """
+        method to obtain the memory map of the index, mapped again only when the index grew
+        method used internally only
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param length: the number of searches in the history
+        :type: int
+
+        :return: the memory map of the index
+        :type: mmap.mmap
+        """
+        if self._index_map is None or self._index_map_size < length:
+            if self._index_map is not None:
+                self._index_map.close()
+
+            self._index_map = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._index_map_size = length
+
+        return self._index_map
@@ -0,0 +1,298 @@
+"""
+tests of the Border class of graphic_tool
+"""
+
+import numpy as np
+import pygame
+import pytest
+
+import graphic_tool_import as gti
+from graphic_tool import border, vector
+
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    border.clear_cache()
+
+    yield pygame.display.set_mode((400, 300))
+
+    border.clear_cache()
+
+
+def test_caches_are_bounded(screen, monkeypatch):
+    monkeypatch.setattr(border, "MAX_CACHED_SURFACES", 8)
+    monkeypatch.setattr(border, "MAX_CACHED_MASKS", 4)
+
+    for size in range(20, 40):
+        frame = gti.Border((10, 10), (10 + size, 10 + size), "white", border_radius=5)
+        frame.draw(screen)
+        frame.get_mask()
+
+    assert border.get_cache_stats() == {"surfaces": 8, "masks": 4}
+
+    border.clear_cache()
+    assert border.get_cache_stats() == {"surfaces": 0, "masks": 0}
+
+
+def test_cache_keeps_the_recently_used_borders(screen, monkeypatch):
+    monkeypatch.setattr(border, "MAX_CACHED_SURFACES", 2)
+
+    first = gti.Border((10, 10), (60, 60), "white", border_radius=5)
+    first.draw(screen)
+    surface = first._get_surface()
+
+    gti.Border((10, 10), (70, 70), "white").draw(screen)
+    first.draw(screen)
+    gti.Border((10, 10), (80, 80), "white").draw(screen)
+
+    assert first._get_surface() is surface
+
+
+def test_erase_restores_the_background(screen):
+    screen.fill((0, 0, 0))
+    screen.fill((0, 0, 255), (0, 0, 200, 300))
+    background = pygame.image.tostring(screen, "RGB")
+
+    frame = gti.Border((20, 20), (180, 120), "white", border_radius=(10, -10, 5, -5), border_width=3)
+    frame.draw(screen)
+    frame.draw(screen)
+    frame.erase(screen)
+
+    assert pygame.image.tostring(screen, "RGB") == background
+
+
+def test_erase_after_painting_restores_the_new_background(screen):
+    screen.fill((0, 0, 0))
+    frame = gti.Border((20, 20), (180, 120), "white", border_width=2)
+
+    frame.draw(screen)
+    frame.erase(screen)
+
+    # something new is painted where the border was, then the border is drawn and erased again
+    screen.fill((255, 0, 0), (10, 10, 200, 150))
+    frame.draw(screen)
+    frame.erase(screen)
+
+    assert screen.get_at((20, 20))[:3] == (255, 0, 0)
+    assert screen.get_at((180, 120))[:3] == (255, 0, 0)
+
+
+def test_erase_without_background(screen):
+    frame = gti.Border((20, 20), (180, 120), "white", border_width=2)
+
+    with pytest.raises(ValueError):
+        frame.erase(screen)
+
+    frame.erase(screen, "black")
+    assert tuple(frame.color) == gti.colors["white"]
+
+
+@pytest.mark.parametrize("radius", [0, 9, -10, (5, -7, 10, -3)])
+def test_hit_tests_agree(screen, radius):
+    frame = gti.Border((10, 10), (110, 70), "white", border_radius=radius)
+    points = np.random.default_rng(0).integers((0, 0), (121, 81), size=(20_000, 2))
+
+    inside = frame.are_in(points)
+
+    assert inside.tolist() == [frame.is_in(point) for point in points.tolist()]
+    assert inside.tolist() == [frame.is_in_mask(point) for point in points.tolist()]
+    assert 0 < inside.sum() < len(points)
+
+
+@pytest.mark.parametrize("point, expected", [
+    ((11, 11), False),   # corner 0, outside of the quarter circle centered on (19, 19)
+    ((17, 12), True),    # corner 0, inside of it, the old x * x + y * y <= r said outside
+    ((103, 12), True),   # corner 1, centered on (101, 19), the old test said outside
+    ((109, 69), False),  # corner 3, outside of the quarter circle centered on (101, 61)
+    ((104, 64), True),   # corner 3, inside of it, the old test said outside
+    ((10, 40), False),   # on the edge of the rectangle
+    ((60, 40), True),
+])
+def test_is_in_rounded_corners(point, expected):
+    frame = gti.Border((10, 10), (110, 70), "white", border_radius=9)
+
+    assert frame.is_in(point) is expected
+    assert frame.are_in([point]).tolist() == [expected]
+
+
+@pytest.mark.parametrize("point, expected", [
+    ((15, 15), False),   # in the quarter circle taken out of the corner 0, the old test said inside
+    ((18, 18), True),
+    ((105, 65), False),  # corner 3
+    ((12, 60), True),    # out of the squares of the corners, the old test said outside
+])
+def test_is_in_inverted_corners(point, expected):
+    frame = gti.Border((10, 10), (110, 70), "white", border_radius=-10)
+
+    assert frame.is_in(point) is expected
+    assert frame.are_in([point]).tolist() == [expected]
+
+
+def test_are_in_accepts_vectors_and_floats():
+    frame = gti.Border((10, 10), (110, 70), "white", border_radius=9)
+    points = [vector.Vector2D(60, 40), (17.5, 12.5), [11.5, 11.5]]
+
+    assert frame.are_in(points).tolist() == [frame.is_in(point) for point in points] == [True, True, False]
+
+
+@pytest.mark.parametrize("points", [[], (), np.empty((0, 2)), np.empty(0)])
+def test_are_in_without_points(points):
+    frame = gti.Border((10, 10), (110, 70), "white", border_radius=9)
+
+    inside = frame.are_in(points)
+
+    assert inside.shape == (0,)
+    assert inside.dtype == bool
+
+
+@pytest.mark.parametrize("points", [[(1, 2, 3)], [1, 2], np.zeros((3, 3)), np.zeros((2, 2, 2))])
+def test_are_in_bad_shapes(points):
+    frame = gti.Border((10, 10), (110, 70), "white", border_radius=9)
+
+    with pytest.raises(ValueError):
+        frame.are_in(points)
+
+
+@pytest.mark.parametrize("radius", [0, 9, -10, (5, -7, 10, -3)])
+def test_bitmap_and_mask_are_the_inside(radius):
+    frame = gti.Border((10, 20), (110, 70), "white", border_radius=radius)
+    x, y = np.meshgrid(np.arange(10, 111), np.arange(20, 71))
+
+    bitmap = frame.get_bitmap()
+    mask = frame.get_mask()
+
+    assert bitmap.shape == (51, 101)
+    assert np.array_equal(bitmap, frame.are_in(np.column_stack((x.ravel(), y.ravel()))).reshape(51, 101))
+
+    assert mask.get_size() == (101, 51)
+    assert mask.count() == bitmap.sum()
+    assert np.array_equal(bitmap, [[mask.get_at((x, y)) for x in range(101)] for y in range(51)])
+
+
+def test_bitmap_is_read_only():
+    bitmap = gti.Border((10, 10), (110, 70), "white", border_radius=9).get_bitmap()
+
+    with pytest.raises(ValueError):
+        bitmap[30, 50] = False
+
+    # shared by the borders of the same size and radii
+    assert gti.Border((0, 0), (100, 60), "green", border_radius=9).get_bitmap() is bitmap
+
+
+def count_common_points(first, second):
+    return sum(first.is_in((x, y)) and second.is_in((x, y)) for x in range(0, 130) for y in range(0, 130))
+
+
+@pytest.mark.parametrize("other_x, expected_area", [(50, 0), (49, 0), (48, 29), (45, 124)])
+def test_overlap_of_borders_side_by_side(other_x, expected_area):
+    first = gti.Border((10, 10), (50, 50), "white", border_radius=10)
+    second = gti.Border((other_x, 10), (other_x + 40, 50), "white", border_radius=10)
+
+    # the edges aren't inside the borders, sharing one isn't overlapping
+    assert first.overlaps(second) is second.overlaps(first) is (expected_area > 0)
+    assert first.overlap_area(second) == second.overlap_area(first) == expected_area
+    assert count_common_points(first, second) == expected_area
+
+
+@pytest.mark.parametrize("offset, expected_area", [(40, 57), (44, 3), (45, 0)])
+def test_overlap_of_rounded_corners(offset, expected_area):
+    first = gti.Border((10, 10), (50, 50), "white", border_radius=10)
+    second = gti.Border((offset, offset), (offset + 40, offset + 40), "white", border_radius=10)
+
+    # at 45 the rectangles overlap but not the rounded corners
+    assert first.get_rect().colliderect(second.get_rect())
+    assert first.overlaps(second) is (expected_area > 0)
+    assert first.overlap_area(second) == expected_area
+    assert count_common_points(first, second) == expected_area
+
+
+def make_mixed_borders(nbr_borders):
+    # one border in each cell of 40 x 30 pixels, so that they don't overlap, of 3 sizes, 4 radii, 3 widths, 4 colors
+    borders = []
+
+    for i in range(nbr_borders):
+        x, y = (i % 20) * 40, (i // 20) * 30
+        width, height = ((30, 20), (36, 26), (24, 14))[i % 3]
+        radius = (0, 5, -6, (5, -3, 0, 7))[i % 4]
+        color = ("white", "red", "green", "yellow")[i // 3 % 4]
+
+        borders.append(gti.Border((x, y), (x + width, y + height), color, border_radius=radius,
+                                  border_width=1 + i % 5 // 2))
+
+    return borders
+
+
+def test_group_draws_the_same_pixels(screen):
+    borders = make_mixed_borders(200)
+    group = gti.BorderGroup(borders)
+    clip = pygame.Rect(50, 35, 500, 200)  # some borders are cut by it, and some outside of it
+
+    each_surface, group_surface = pygame.Surface((800, 300)), pygame.Surface((800, 300))
+    for surface in (each_surface, group_surface):
+        surface.fill((0, 0, 64))
+        surface.set_clip(clip)
+
+    for frame in borders:
+        frame.draw(each_surface)
+    drawn_rects = group.draw(group_surface)
+
+    assert pygame.image.tostring(group_surface, "RGB") == pygame.image.tostring(each_surface, "RGB")
+
+    nbr_visible = sum(clip.colliderect(frame.get_rect()) for frame in borders)
+    nbr_kinds = len({(frame.size, tuple(frame.border_radius), frame.border_width, tuple(frame.color))
+                     for frame in borders})
+    assert group.get_stats() == {"borders": 200, "groups": nbr_kinds, "last_drawn": nbr_visible,
+                                 "last_skipped": 200 - nbr_visible}
+    assert 1 < nbr_kinds < 200
+    assert 0 < nbr_visible < 200
+    assert len(drawn_rects) == nbr_visible
+    assert all(clip.contains(rect) for rect in drawn_rects)
+
+
+def test_group_counts_the_borders_drawn(screen):
+    inside = gti.Border((10, 10), (50, 40), "white", border_radius=5)
+    cut = gti.Border((380, 10), (420, 40), "white", border_radius=5)
+    outside = gti.Border((500, 10), (540, 40), "white", border_radius=5)
+    group = gti.BorderGroup([inside, cut, outside])
+
+    group.draw(screen)
+    assert (group.nbr_drawn, group.nbr_skipped) == (2, 1)
+
+    outside.move(-400, 50)
+    group.draw(screen)
+    assert (group.nbr_drawn, group.nbr_skipped) == (3, 0)
+
+    group.clear()
+    assert group.draw(screen) == []
+    assert group.get_stats() == {"borders": 0, "groups": 0, "last_drawn": 0, "last_skipped": 0}
+
+
+def test_group_add_and_remove(screen):
+    first = gti.Border((10, 10), (50, 40), "white", border_radius=5)
+    second = gti.Border((60, 10), (100, 40), "white", border_radius=5)
+    group = gti.BorderGroup([first, second])
+
+    assert len(group) == 2
+    assert group.get_stats()["groups"] == 1
+
+    # a border changed must be added again, it is then grouped with the borders identical to it
+    second.color = gti.colors["red"]
+    group.add(second)
+
+    assert len(group) == 2 and list(group) == [first, second]
+    assert group.get_stats()["groups"] == 2
+
+    screen.fill((0, 0, 0))
+    group.draw(screen)
+    assert screen.get_at((60, 25))[:3] == gti.colors["red"]
+    assert screen.get_at((10, 25))[:3] == gti.colors["white"]
+
+    group.remove(second)
+    group.remove(second)  # nothing happens, it isn't in the group anymore
+
+    assert second not in group and first in group
+    assert group.get_stats()["groups"] == 1
+
+    with pytest.raises(ValueError):
+        group.add(first.get_rect())
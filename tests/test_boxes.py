@@ -0,0 +1,123 @@
+"""
+tests of the boxes of the Boxes module, in a World drawn on the dummy display
+"""
+
+import pygame
+import pytest
+
+import Boxes
+import main
+
+
+@pytest.fixture
+def world(tmp_path):
+    # the urls are only counted, the browser "scripted" is registered here and not only by main.run_scripted
+    main.register_counting_browser()
+
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+
+    world = main.World(screen, (1280, 720), history_path=str(tmp_path / "history"), browser="scripted")
+    world.on_user_create()
+    world.learn_words([{"type": "Normal", "text": "butler pygame"}])
+
+    yield world
+
+    world.close()
+
+
+def type_text(world, text):
+    for char in text:
+        world.update_widgets([pygame.event.Event(pygame.KEYDOWN, key=ord(char), unicode=char, mod=0, scancode=0)])
+        world.update_widgets([pygame.event.Event(pygame.KEYUP, key=ord(char), unicode=char, mod=0, scancode=0)])
+
+
+def test_completions_of_typed_text(world):
+    box = world.lst_box[0]
+    world.focus(box.text_input)
+
+    type_text(world, "bu")
+
+    assert box.completions == ["butler"]
+
+
+def test_no_completions_when_the_text_is_set(world):
+    box = world.lst_box[0]
+
+    box.set_spec({"type": "Normal", "text": "bu"})
+    assert box.completions == []
+
+    world.load_boxes([{"type": "Normal", "text": "bu"}, {"type": "Exact", "text": "py"}])
+    assert [box.completions for box in world.lst_box] == [[], []]
+
+
+def test_set_text_clears_the_completions(world):
+    box = world.lst_box[0]
+    world.focus(box.text_input)
+    type_text(world, "bu")
+    box.text_input.selected = False
+
+    box.set_spec({"type": "Normal", "text": "pyg"})
+
+    assert box.completions == []
+
+
+def test_button_colour_resets_after_the_mouse_left(world, monkeypatch):
+    button = world.lst_box[0].right_button
+    mouse_pos = [(button.getX() + 5, button.getY() + 5)]
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: mouse_pos[0])
+
+    world.update_widgets([pygame.event.Event(pygame.MOUSEMOTION, pos=mouse_pos[0], rel=(1, 1), buttons=(0, 0, 0))])
+    assert button.colour == button.hoverColour
+
+    mouse_pos[0] = (5, 600)
+    world.update_widgets([pygame.event.Event(pygame.MOUSEMOTION, pos=mouse_pos[0], rel=(1, 1), buttons=(0, 0, 0))])
+    assert world.is_animating()
+
+    for _ in range(3):
+        world.update_widgets([])
+
+    assert button.colour == button.inactiveColour
+    assert button not in world._followed_widgets
+    assert not world.is_animating()
+
+
+def test_preview_only_compiled_when_the_query_changed(world, monkeypatch):
+    for i in range(1, 30):
+        world.add_box(Boxes.Box(world, i))
+    world.update_preview()
+
+    nbr_compiles = [0]
+    compile_query = world.compile_query
+
+    def counting_compile_query():
+        nbr_compiles[0] += 1
+        return compile_query()
+
+    monkeypatch.setattr(world, "compile_query", counting_compile_query)
+
+    for _ in range(10):
+        world.update_preview()
+    assert nbr_compiles[0] == 0
+
+    world.lst_box[3].set_spec({"type": "Normal", "text": "butler"})
+    world.update_preview()
+    assert nbr_compiles[0] == 1
+    assert "butler" in world.preview_text
+
+    world.delete_box(3)
+    world.update_preview()
+    assert nbr_compiles[0] == 2
+    assert "butler" not in world.preview_text
+
+
+def test_search_opens_the_registered_browser(world):
+    world.lst_box[0].set_spec({"type": "Normal", "text": "butler"})
+    world.menu_widgets["search_mode_selection"].selected = [True, True]
+
+    world.search(world.menu_widgets["search_mode_selection"])
+    world.browser.stop()
+
+    stats = world.browser.get_stats()
+    assert stats["opened"] >= 1
+    assert stats["failed"] == 0
@@ -0,0 +1,47 @@
+"""
+tests of browser_dispatch.BrowserDispatcher, with a browser that waits to be released
+"""
+
+import threading
+import time
+import webbrowser
+
+import browser_dispatch
+
+
+class BlockingBrowser(webbrowser.BaseBrowser):
+    def __init__(self):
+        super().__init__("blocking")
+        self.release = threading.Event()
+        self.urls = []
+
+    def open(self, url, new=0, autoraise=True):
+        self.release.wait(5)
+        self.urls.append(url)
+        return True
+
+
+def test_url_dropped_by_a_full_queue_can_be_asked_again():
+    browser = BlockingBrowser()
+    webbrowser.register("test-blocking", None, browser)
+    dispatcher = browser_dispatch.BrowserDispatcher(max_pending=1, duplicate_window=60., browser="test-blocking")
+
+    try:
+        assert dispatcher.open("https://a")      # taken by the thread, which waits
+        while dispatcher.get_stats()["pending"]:
+            time.sleep(0.001)
+        assert dispatcher.open("https://b")      # fills the queue
+        assert not dispatcher.open("https://c")  # dropped, the queue is full
+
+        browser.release.set()
+        while dispatcher.get_stats()["opened"] < 2:
+            time.sleep(0.001)
+
+        assert dispatcher.open("https://c")      # not a duplicate, it was never queued
+        assert not dispatcher.open("https://b")  # a duplicate
+    finally:
+        browser.release.set()
+        dispatcher.stop()
+
+    assert browser.urls == ["https://a", "https://b", "https://c"]
+    assert dispatcher.get_stats()["dropped"] == 2
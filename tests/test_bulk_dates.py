@@ -0,0 +1,42 @@
+"""
+tests of the bulk_dates module, against query_compiler.test_and_handle_ymd
+"""
+
+import numpy as np
+import pytest
+
+import bulk_dates
+import query_compiler as qc
+
+
+def test_float_dates_are_read_as_numbers():
+    dates, error = bulk_dates.validate_dates([[2020., 2., 29.], [2019., 2., 29.], [2019., 2., 28.]])
+
+    assert dates.tolist() == ['2020-02-29', '', '2019-02-28']
+    assert error.tolist() == [False, True, False]
+
+
+@pytest.mark.parametrize("triple", [[2020.5, 1., 1.], [2020., 1.5, 1.], [np.nan, 1., 1.], [np.inf, 1., 1.],
+                                    [1e30, 1., 1.], [-1., 1., 1.], [2020., 13., 1.]])
+def test_invalid_float_dates(triple):
+    dates, error = bulk_dates.validate_dates([triple, [2020., 1., 1.]])
+
+    assert dates.tolist() == ['', '2020-01-01']
+    assert error.tolist() == [True, False]
+
+
+@pytest.mark.parametrize("year, month, day", [("2020", "²", "1"), ("2020", "½", "3"), ("²", "1", "1"),
+                                              ("20 20", "0 2", "29"), ("2019", "02", "29"), ("", "1", "1")])
+def test_same_answer_as_test_and_handle_ymd(year, month, day):
+    dates, error = bulk_dates.validate_dates([[year, month, day]])
+
+    try:
+        expected = '-'.join(qc.test_and_handle_ymd(year, month, day))
+    except ValueError:
+        expected = None
+
+    if expected is None:
+        assert error[0]
+    else:
+        assert not error[0]
+        assert dates[0] == expected
@@ -0,0 +1,72 @@
+"""
+tests of the damage_tracker module
+"""
+
+import pygame
+import pygame_widgets
+import pytest
+
+import damage_tracker
+import pygame_widgets_import as pwi
+
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    return pygame.display.set_mode((400, 300))
+
+
+@pytest.fixture
+def tracker(screen):
+    tracker = damage_tracker.DamageTracker(screen)
+    tracker.present()  # the first frame is presented entirely
+
+    return tracker
+
+
+@pytest.fixture
+def button(screen):
+    button = pwi.Button(screen, 100, 100, 50, 20, text="b")
+    yield button
+    pygame_widgets.WidgetHandler.removeWidget(button)
+
+
+@pytest.mark.parametrize("event_type", [pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED])
+def test_expose_presents_everything(tracker, event_type):
+    tracker.add_widgets([pygame.event.Event(event_type)], [])
+    tracker.present()
+
+    assert tracker.get_stats()["full_updates"] == 2
+
+
+def test_widget_left_by_the_mouse_is_marked_until_drawn_back(tracker, button):
+    # the mouse leaves the button, which is still drawn hovered
+    button.colour = button.hoverColour
+    button.mouseWasInside = True
+
+    leave = pygame.event.Event(pygame.MOUSEMOTION, pos=(300, 250), rel=(175, 140), buttons=(0, 0, 0))
+    tracker.add_widgets([leave], [button])
+    assert tracker.get_stats()["pending_rects"] == 1
+    tracker.present()
+
+    # the frame after, without events, pygame_widgets puts the colour back : it must be presented
+    button.mouseWasInside = False
+    tracker.add_widgets([], [button])
+    assert tracker.get_stats()["pending_rects"] == 1
+    tracker.present()
+
+    # then the button is drawn normally and doesn't change anymore
+    button.colour = button.inactiveColour
+    tracker.add_widgets([], [button])
+    assert tracker.get_stats()["pending_rects"] == 0
+
+
+def test_is_hovered(button):
+    assert not damage_tracker.is_hovered(button)
+
+    button.colour = button.hoverColour  # the mouse is over it, or left it and it isn't drawn back yet
+    assert damage_tracker.is_hovered(button)
+
+    button.colour = button.inactiveColour
+    button.mouseWasInside = True
+    assert damage_tracker.is_hovered(button)
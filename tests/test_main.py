@@ -0,0 +1,16 @@
+"""
+tests of the scripted runs of main, which create and close a whole World
+"""
+
+import pygame_widgets
+
+import main
+
+
+def test_run_scripted_twice():
+    first = main.run_scripted(60)
+    second = main.run_scripted(60)
+
+    assert first["frames"] == second["frames"] == 60
+    assert second["widgets"]["leaked"] == 0
+    assert len(pygame_widgets.WidgetHandler.getWidgets()) == 0
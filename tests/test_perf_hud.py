@@ -0,0 +1,63 @@
+"""
+tests of the profiling of perf_hud.PerfHud, with a world only presenting its frames
+"""
+
+import pstats
+
+import pygame
+import pytest
+
+import perf_hud
+
+
+def present_the_frame():
+    pass
+
+
+class PresentingWorld(object):
+    def __init__(self):
+        self.damage = self
+        self.nbr_presents = 0
+
+    def present(self):
+        present_the_frame()
+        self.nbr_presents += 1
+
+
+@pytest.fixture
+def world():
+    pygame.init()
+    return PresentingWorld()
+
+
+def profiled_functions(path):
+    return {function for _, _, function in pstats.Stats(str(path)).stats}
+
+
+def test_profile_includes_the_present(world, tmp_path):
+    hud = perf_hud.PerfHud(world, profile_frames=2, profile_dir=str(tmp_path))
+
+    hud.begin_frame([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F4, mod=0, unicode='', scancode=0)])
+    hud.end_frame()
+    hud.begin_frame([])
+    hud.end_frame()
+
+    assert world.nbr_presents == 2
+    assert hud.get_stats()["profiling"] is False
+    assert "present_the_frame" in profiled_functions(hud.last_profile_path)
+
+
+def test_close_writes_the_running_profile(world, tmp_path):
+    hud = perf_hud.PerfHud(world, profile_frames=300, profile_dir=str(tmp_path))
+
+    hud.close()
+    assert hud.last_profile_path is None  # nothing to write
+
+    hud.start_profile()
+    hud.begin_frame([])
+    hud.end_frame()
+    hud.close()
+
+    assert hud.get_stats()["profiling"] is False
+    assert hud.get_stats()["profiled_frames"] == 1
+    assert "present_the_frame" in profiled_functions(hud.last_profile_path)
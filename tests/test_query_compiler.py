@@ -0,0 +1,36 @@
+"""
+tests of the url encoding of query_compiler, against urllib.parse.quote
+"""
+
+import random
+import urllib.parse
+
+import pytest
+
+import query_compiler as qc
+
+
+def quote(text, space):
+    return urllib.parse.quote(text, safe=" -_.~").replace(' ', space)
+
+
+@pytest.mark.parametrize("text", ["", "butler", "google search", "a-b_c.d~e", "100%", "%25", "c++ & c#", "l'été",
+                                  "ça coûte 5€", "😀 emoji", "tab\tand\nnew line", "%é%"])
+@pytest.mark.parametrize("space", ['+', '-'])
+def test_encode_text(text, space):
+    assert qc.encode_text(text, space) == quote(text, space)
+
+
+def test_encode_random_texts():
+    rng = random.Random(0)
+    alphabet = [chr(i) for i in range(32, 127)] + list("éàçü€😀")
+
+    for _ in range(1000):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert qc._encode_text(text) == quote(text, '+')
+
+
+@pytest.mark.parametrize("text", ["word " * 200, "c++ & c# " * 200, "l'été " * 200])
+def test_encode_long_texts(text):
+    assert qc.encode_text(text) == quote(text, '+')
+    assert qc.encode_text(text, '-') == quote(text, '-')
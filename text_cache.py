@@ -0,0 +1,174 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+file to cache the fonts and the rendered texts used by the display_text methods
+
+pygame.font.Font opens and parses the font file each time it is called, and the boxes display the same few labels
+each time they are created or moved, so the fonts are kept by (font, size) and the rendered texts in an LRU cache
+
+this module contains :
+
+    - TextCache : a class to cache the fonts and the rendered texts
+
+    - text_cache : the TextCache shared by the whole app
+"""
+
+import collections
+
+import pygame
+
+
+class TextCache(object):
+    def __init__(self, max_renders: int = 512):
+        """
+        class to cache the pygame fonts by (font, size) and the texts rendered with them
+
+        the rendered surfaces are shared, they must not be drawn on
+
+        after pygame.quit, the fonts can't be used anymore and clear() must be called
+
+        Please refer to the documentation of each method for further explanation
+        You can do that with help(TextCache.{method_name})
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        Methods:
+
+            .get_font(font, font_size) -> pygame.font.Font
+
+            .render(text, color, font, font_size, antialias) -> pygame.Surface
+
+            .clear()
+
+            .get_stats() -> dict
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param max_renders: the number maximum of rendered texts kept, optional defaulted to 512
+        :type: int
+        """
+        if max_renders <= 0:
+            raise ValueError("max_renders must be strictly positive")
+
+        self.max_renders = max_renders
+
+        self._fonts = {}
+        self._renders = collections.OrderedDict()
+
+        self.nbr_font_hits = 0
+        self.nbr_font_misses = 0
+        self.nbr_render_hits = 0
+        self.nbr_render_misses = 0
+        self.nbr_evictions = 0
+
+    def get_font(self, font: str = None, font_size: int = 20) -> pygame.font.Font:
+        """
+        method to obtain a font, opened only the first time it is asked
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param font: file path to the font, optional defaulted to None (=default font of pygame)
+        :type: str
+        :param font_size: size of the font, optional defaulted to 20
+        :type: int
+
+        :return: the font
+        :type: pygame.font.Font
+        """
+        key = (font, font_size)
+
+        font_object = self._fonts.get(key)
+        if font_object is None:
+            font_object = self._fonts[key] = pygame.font.Font(font, font_size)
+            self.nbr_font_misses += 1
+        else:
+            self.nbr_font_hits += 1
+
+        return font_object
+
+    def render(self,
+               text:      str,
+               color:     tuple[int, int, int],
+               font:      str = None,
+               font_size: int = 20,
+               antialias: bool = True) -> pygame.Surface:
+        """
+        method to obtain a text rendered with a font, rendered only if it isn't in the cache
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param text: the text
+        :type: str
+        :param color: the rgb code of the color
+        :type: tuple of 3 int
+
+        :param font: file path to the font, optional defaulted to None (=default font of pygame)
+        :type: str
+        :param font_size: size of the font, optional defaulted to 20
+        :type: int
+        :param antialias: is the text antialiased, optional defaulted to True
+        :type: bool
+
+        :return: the rendered text, shared with the other users of the cache
+        :type: pygame.Surface
+        """
+        key = (text, font, font_size, tuple(color), antialias)
+
+        text_render = self._renders.get(key)
+        if text_render is not None:
+            self._renders.move_to_end(key)
+            self.nbr_render_hits += 1
+            return text_render
+
+        self.nbr_render_misses += 1
+
+        text_render = self._renders[key] = self.get_font(font, font_size).render(text, antialias, color)
+
+        if len(self._renders) > self.max_renders:
+            self._renders.popitem(last=False)
+            self.nbr_evictions += 1
+
+        return text_render
+
+    def clear(self):
+        """
+        method to forget every font and rendered text, the counters are kept
+        """
+        self._fonts.clear()
+        self._renders.clear()
+
+    def get_stats(self) -> dict:
+        """
+        method to obtain the counters of the cache
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the keys "fonts", "renders", "font_hits", "font_misses", "render_hits", "render_misses",
+                 "evictions" and "hit_rate" (of the rendered texts)
+        :type: dict
+        """
+        total = self.nbr_render_hits + self.nbr_render_misses
+
+        return {
+            "fonts":         len(self._fonts),
+            "renders":       len(self._renders),
+            "font_hits":     self.nbr_font_hits,
+            "font_misses":   self.nbr_font_misses,
+            "render_hits":   self.nbr_render_hits,
+            "render_misses": self.nbr_render_misses,
+            "evictions":     self.nbr_evictions,
+            "hit_rate":      self.nbr_render_hits / total if total else None,
+        }
+
+
+text_cache = TextCache()
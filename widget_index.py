@@ -0,0 +1,200 @@
+"""
+google search butler
+
+@author: Zaynn-Lea
+
+see on git-hub :
+    * author :
+        - Zaynn-Lea : https://github.com/Zaynn-lea
+
+    * project : https://github.com/Zaynn-lea/google_search_helper
+
+------------------------------------------------------------------------------------------------------------------------
+
+file to find the widgets under a point without testing every widget
+
+pygame_widgets offers each frame to every widget it knows, and each one tests the mouse against its own rectangle,
+so the widgets of the boxes are kept in a uniform grid of cells : a point only looks at the widgets of its cell
+
+this module contains :
+
+    - SpatialHash : a class to keep rectangles in a uniform grid and find the ones containing a point
+
+    - get_widget_rect : a function to obtain the rectangle of a widget of pygame_widgets
+"""
+
+import pygame
+
+
+class SpatialHash(object):
+    def __init__(self, cell_size: int = 64):
+        """
+        class to keep items with a rectangle in a uniform grid of cells, to find the ones containing a point
+        by only looking at the items of its cell
+
+        an item is in every cell its rectangle touches, the items must be hashable
+
+        Please refer to the documentation of each method for further explanation
+        You can do that with help(SpatialHash.{method_name})
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        Methods:
+
+            .insert(item, rect)
+                add an item, or move it if it is already in
+
+            .remove(item)
+
+            .query_point(x, y) -> list of items
+                the items whose rectangle contains the point
+
+            .clear()
+
+            .get_stats() -> dict
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param cell_size: the width and the height of the cells in pixels, optional defaulted to 64
+        :type: int
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be strictly positive")
+
+        self.cell_size = cell_size
+
+        self._cells = {}  # (column, row) -> set of items
+        self._rects = {}  # item -> pygame.Rect
+
+        self.nbr_queries = 0
+        self.nbr_candidates = 0  # items tested by the queries
+
+    def __len__(self) -> int:
+        """
+        Implement len(self)
+        """
+        return len(self._rects)
+
+    def __contains__(self, item) -> bool:
+        """
+        Implement item in self
+        """
+        return item in self._rects
+
+    def _get_cells(self, rect: pygame.Rect):
+        """
+        method to obtain the cells touched by a rectangle
+        method used internally only
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param rect: the rectangle
+        :type: pygame.Rect
+
+        :return: the (column, row) of the cells
+        :type: generator of tuple of 2 int
+        """
+        first_column, first_row = rect.left // self.cell_size, rect.top // self.cell_size
+        last_column, last_row = (rect.right - 1) // self.cell_size, (rect.bottom - 1) // self.cell_size
+
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                yield column, row
+
+    def insert(self, item, rect: [pygame.Rect, tuple]):
+        """
+        method to add an item to the grid, if it is already in it is moved to its new rectangle
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param item: the item
+        :type: any hashable object
+        :param rect: the rectangle of the item
+        :type: pygame.Rect or tuple of 4 int
+        """
+        if item in self._rects:
+            self.remove(item)
+
+        rect = self._rects[item] = pygame.Rect(rect)
+
+        for cell in self._get_cells(rect):
+            self._cells.setdefault(cell, set()).add(item)
+
+    def remove(self, item):
+        """
+        method to remove an item from the grid, nothing happens if it isn't in
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param item: the item
+        :type: any hashable object
+        """
+        rect = self._rects.pop(item, None)
+        if rect is None:
+            return
+
+        for cell in self._get_cells(rect):
+            items = self._cells[cell]
+            items.discard(item)
+
+            if not items:
+                del self._cells[cell]
+
+    def query_point(self, x: int, y: int) -> list:
+        """
+        method to obtain the items whose rectangle contains a point
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :param x: the x coordinate of the point
+        :type: int
+        :param y: the y coordinate of the point
+        :type: int
+
+        :return: the items, in no particular order
+        :type: list
+        """
+        items = self._cells.get((x // self.cell_size, y // self.cell_size), ())
+
+        self.nbr_queries += 1
+        self.nbr_candidates += len(items)
+
+        return [item for item in items if self._rects[item].collidepoint(x, y)]
+
+    def clear(self):
+        """
+        method to remove every item from the grid, the counters are kept
+        """
+        self._cells.clear()
+        self._rects.clear()
+
+    def get_stats(self) -> dict:
+        """
+        method to obtain the statistics of the grid
+
+        ----------------------------------------------------------------------------------------------------------------
+
+        :return: the keys "items", "cells", "queries" and "mean_candidates" (items tested by query)
+        :type: dict
+        """
+        return {
+            "items":           len(self._rects),
+            "cells":           len(self._cells),
+            "queries":         self.nbr_queries,
+            "mean_candidates": self.nbr_candidates / self.nbr_queries if self.nbr_queries else None,
+        }
+
+
+def get_widget_rect(widget) -> pygame.Rect:
+    """
+    function to obtain the rectangle of a widget of pygame_widgets, the one its contains method tests
+
+    --------------------------------------------------------------------------------------------------------------------
+
+    :param widget: the widget
+    :type: pygame_widgets.widget.WidgetBase
+
+    :return: the rectangle
+    :type: pygame.Rect
+    """
+    return pygame.Rect(widget.getX(), widget.getY(), widget.getWidth(), widget.getHeight())